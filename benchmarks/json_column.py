@@ -0,0 +1,63 @@
+"""JSON TEXT columns: decoding on every attribute access against decoding once per loaded row.
+
+Installing orjson switches the JsonArray backend; run once with and once without it to compare.
+Usage: API_ENV=test python -m benchmarks.json_column [--iterations 2000] [--posts 50] [--images 5]
+"""
+import argparse
+import json
+import time
+
+from sqlalchemy.dialects import postgresql
+
+from claon_admin.common.util import json_column
+from claon_admin.common.util.json_column import JsonArray
+from claon_admin.schema.post import PostImage
+
+COLUMN_TYPE = JsonArray(PostImage)
+DIALECT = postgresql.dialect()
+
+
+class LegacyPostImage:
+    def __init__(self, url: str):
+        self.url = url
+
+
+def legacy_img(raw: str):
+    return [LegacyPostImage(value['url']) for value in json.loads(raw)]
+
+
+def legacy_page(rows, accesses):
+    # The property parsed the column again on each access
+    return [legacy_img(raw)[0].url for raw in rows for _ in range(accesses)]
+
+
+def json_array_page(rows, accesses):
+    loaded = [COLUMN_TYPE.process_result_value(raw, DIALECT) for raw in rows]
+    return [img[0].url for img in loaded for _ in range(accesses)]
+
+
+def measure(func, rows, accesses, iterations):
+    started = time.process_time()
+    for _ in range(iterations):
+        func(rows, accesses)
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--images", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [json.dumps([dict(url=f"https://claon.s3.amazonaws.com/post/{post}/{image}.png")
+                        for image in range(args.images)]) for post in range(args.posts)]
+
+    assert legacy_page(rows, 1) == json_array_page(rows, 1)
+    print(f"backend: {'orjson' if json_column.orjson is not None else 'json'}, "
+          f"{args.posts} posts x {args.images} images")
+    for accesses in (1, 3):
+        print(f"legacy, {accesses} access(es) per row    : "
+              f"{measure(legacy_page, rows, accesses, args.iterations):8.1f} us/page")
+        print(f"JsonArray, {accesses} access(es) per row : "
+              f"{measure(json_array_page, rows, accesses, args.iterations):8.1f} us/page")
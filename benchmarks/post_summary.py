@@ -0,0 +1,97 @@
+"""Post summary bucketing: per-request CPU time and import time, with and without pandas.
+
+The pandas implementation is kept here only for comparison; install pandas to run it.
+Usage: API_ENV=test python -m benchmarks.post_summary [--iterations 1000]
+"""
+import argparse
+import random
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+
+from claon_admin.model.post import PostSummaryResponseDto
+
+History = namedtuple("History", ["reg_date", "count"])
+
+
+def legacy_summarize(end_date: date, count_total: int, history_list):
+    import pandas as pd
+
+    count_by_month = [x for x in history_list if end_date - timedelta(days=4 * 7) <= x.reg_date < end_date]
+    count_by_week = [x for x in count_by_month if end_date - timedelta(days=7) <= x.reg_date < end_date]
+    count_by_day = [x for x in count_by_week if end_date - timedelta(days=1) <= x.reg_date < end_date]
+
+    data = [{'reg_date': history.reg_date, 'count': history.count} for history in history_list]
+    data_default = pd.DataFrame(pd.date_range(history_list[0].reg_date, end_date - timedelta(days=1), freq="D"),
+                                columns=["reg_date"]).fillna(0)
+    data_per_week = pd.DataFrame(data)
+    data_per_week.reg_date = data_per_week.reg_date.astype("datetime64[ns]")
+    data_per_week = pd.merge(data_default, data_per_week, on="reg_date", how="left").fillna(0).set_index("reg_date")
+    data_per_day = data_per_week.iloc[-7:].T.to_dict("records")[0]
+    data_per_week = data_per_week.resample("W")["count"].sum().to_frame()
+    if end_date.weekday() > 0:
+        data_per_week = data_per_week[0:-1]
+    data_per_week = data_per_week.T.to_dict("records")[0]
+
+    return dict(
+        count_today=sum(x.count for x in count_by_day),
+        count_week=sum(x.count for x in count_by_week),
+        count_month=sum(x.count for x in count_by_month),
+        count_total=count_total,
+        count_per_day=[dict(unit="월화수목금토일"[day.weekday()], count=int(data_per_day[day]))
+                       for day in data_per_day],
+        count_per_week=[dict(unit=week.strftime("%Y-%m-%d"), count=int(data_per_week[week]))
+                        for week in data_per_week]
+    )
+
+
+def make_histories(end_date: date, density: float):
+    start_date = PostSummaryResponseDto.start_date_of(end_date)
+    histories = []
+    for offset in range((end_date - start_date).days):
+        if random.random() < density:
+            histories.append(History(start_date + timedelta(days=offset), random.randint(1, 50)))
+    return histories
+
+
+def measure(func, cases, iterations):
+    started = time.process_time()
+    for i in range(iterations):
+        func(*cases[i % len(cases)])
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+def import_time(module: str):
+    command = f"import time; s = time.perf_counter(); import {module}; print(time.perf_counter() - s)"
+    return float(subprocess.check_output([sys.executable, "-c", command])) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    cases = []
+    for _ in range(100):
+        end_date = date(2023, 1, 1) + timedelta(days=random.randint(0, 365))
+        histories = make_histories(end_date, random.choice([0.05, 0.5, 1.0]))
+        if histories:
+            cases.append((end_date, 100, histories))
+
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        pandas = None
+
+    if pandas is not None:
+        mismatches = sum(PostSummaryResponseDto.summarize(*case) != legacy_summarize(*case) for case in cases)
+        print(f"cases: {len(cases)}, mismatches against pandas: {mismatches}")
+        print(f"pandas      : {measure(legacy_summarize, cases, args.iterations):8.1f} us/request")
+    print(f"DailySeries : {measure(PostSummaryResponseDto.summarize, cases, args.iterations):8.1f} us/request")
+
+    if pandas is not None:
+        print(f"import pandas                         : {import_time('pandas'):8.1f} ms")
+    print(f"import claon_admin.common.util.series : {import_time('claon_admin.common.util.series'):8.1f} ms")
@@ -0,0 +1,112 @@
+"""Review feed visit counts: join + GROUP BY against the correlated subquery, 100k posts in one center.
+
+Usage: API_ENV=test python -m benchmarks.review_visit_count [--posts 100000] [--users 2000] [--reviews 2000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi_pagination import Params
+from sqlalchemy import insert, select, func, and_, desc
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker, selectinload
+
+from claon_admin.common.enum import Role
+from claon_admin.common.util.db import Base
+from claon_admin.common.util.pagination import count_cache
+from claon_admin.schema.center import Center, Review, ReviewRepository
+from claon_admin.schema.post import Post
+from claon_admin.schema.user import User
+
+START = datetime(2022, 1, 1)
+
+
+def legacy_query(center_id: str):
+    return select(Review, func.count(Post.id)) \
+        .select_from(Review) \
+        .join(Post, and_(Review.user_id == Post.user_id, Review.center_id == Post.center_id)) \
+        .where(and_(Review.center_id == center_id,
+                    Review.created_at >= START,
+                    Review.created_at < START + timedelta(days=365))) \
+        .group_by(Review.id) \
+        .order_by(desc(Review.created_at)) \
+        .options(selectinload(Review.user), selectinload(Review.center), selectinload(Review.answer))
+
+
+async def populate(session: AsyncSession, posts: int, users: int, reviews: int):
+    user_ids = [str(uuid.uuid4()) for _ in range(users)]
+    await session.execute(insert(User), [
+        dict(id=user_id, oauth_id=user_id, nickname=user_id[:20], profile_img="", sns="", role=Role.USER)
+        for user_id in user_ids
+    ])
+
+    center_id = str(uuid.uuid4())
+    await session.execute(insert(Center), [dict(id=center_id, name="center", profile_img="", address="", tel="",
+                                                approved=True, user_id=user_ids[0])])
+
+    await session.execute(insert(Post), [
+        dict(id=str(uuid.uuid4()), content="", _img=[], user_id=random.choice(user_ids[:users // 2]),
+             center_id=center_id, created_at=START + timedelta(minutes=i))
+        for i in range(posts)
+    ])
+    await session.execute(insert(Review), [
+        dict(id=str(uuid.uuid4()), content="", _tag=[], user_id=user_ids[i % users], center_id=center_id,
+             created_at=START + timedelta(hours=i))
+        for i in range(reviews)
+    ])
+    await session.commit()
+
+    return center_id
+
+
+async def measure(func, repeat: int = 5):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = await func()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+async def main(posts: int, users: int, reviews: int):
+    path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with sessionmaker(engine, class_=AsyncSession)() as session:
+        random.seed(0)
+        center_id = await populate(session, posts, users, reviews)
+        params = Params(page=1, size=50)
+
+        async def legacy():
+            return (await session.execute(legacy_query(center_id).limit(50))).all()
+
+        async def current():
+            count_cache.clear()
+            return (await ReviewRepository.find_reviews_by_center(
+                session, params, center_id, START, START + timedelta(days=365), None, None
+            )).items
+
+        legacy_ms, legacy_rows = await measure(legacy)
+        current_ms, current_rows = await measure(current)
+
+    await engine.dispose()
+
+    print(f"posts: {posts}, users: {users}, reviews: {reviews}")
+    print(f"join + GROUP BY      : {legacy_ms:8.1f} ms/page, {len(legacy_rows)} rows (reviews without posts dropped)")
+    print(f"correlated subquery  : {current_ms:8.1f} ms/page, {len(current_rows)} rows "
+          "(includes an uncached total count)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--reviews", type=int, default=2_000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.posts, args.users, args.reviews))
@@ -0,0 +1,53 @@
+"""Per-request auth CPU: decoding both tokens with conf() on every request against the cached TokenVerifier.
+
+Usage: API_ENV=test python -m benchmarks.token_verify [--iterations 20000] [--users 100]
+"""
+import argparse
+import time
+
+from jose import jwt
+
+from claon_admin.common.util.jwt import TokenVerifier
+from claon_admin.config.config import conf
+
+ACCESS_SECRET_KEY = "access-secret"
+REFRESH_SECRET_KEY = "refresh-secret"
+ALGORITHM = "HS256"
+
+
+def legacy_resolve(access_token: str, refresh_token: str):
+    # conf() built a new config dataclass on each call
+    conf()
+    access = jwt.decode(access_token, ACCESS_SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False})
+    conf()
+    refresh = jwt.decode(refresh_token, REFRESH_SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False})
+    return access, refresh
+
+
+def measure(func, tokens, iterations):
+    started = time.process_time()
+    for i in range(iterations):
+        func(*tokens[i % len(tokens)])
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=100)
+    args = parser.parse_args()
+
+    exp = int(time.time()) + 3600
+    tokens = [(jwt.encode({"sub": f"user-{i}", "exp": exp}, ACCESS_SECRET_KEY, ALGORITHM),
+               jwt.encode({"exp": exp + i}, REFRESH_SECRET_KEY, ALGORITHM)) for i in range(args.users)]
+
+    access_verifier = TokenVerifier(ACCESS_SECRET_KEY, ALGORITHM, max_size=10_000, ttl=300)
+    refresh_verifier = TokenVerifier(REFRESH_SECRET_KEY, ALGORITHM, max_size=10_000, ttl=300)
+
+    def verifier_resolve(access_token: str, refresh_token: str):
+        return access_verifier.verify(access_token), refresh_verifier.verify(refresh_token)
+
+    assert all(legacy_resolve(*pair) == verifier_resolve(*pair) for pair in tokens)
+    print(f"{args.users} users, {args.iterations} requests")
+    print(f"jwt.decode per request : {measure(legacy_resolve, tokens, args.iterations):8.1f} us/request")
+    print(f"TokenVerifier          : {measure(verifier_resolve, tokens, args.iterations):8.1f} us/request")
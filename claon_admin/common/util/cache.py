@@ -0,0 +1,100 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Callable, Iterable
+
+from claon_admin.config.redis import RedisClient
+
+
+class TTLCache:
+    def __init__(self, ttl: float, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            self._items.pop(key, None)
+            return None
+
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        self._items[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def evict_expired(self):
+        """ Drops expired items from the least recently set end; exact when every item is set with the same ttl. """
+        current = time.monotonic()
+        while self._items:
+            key, (expires_at, _) = next(iter(self._items.items()))
+            if expires_at > current:
+                return
+            self._items.pop(key)
+
+    def delete(self, key: Hashable):
+        self._items.pop(key, None)
+
+    def clear(self):
+        self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+class TwoTierCache:
+    """ Per-worker TTLCache in front of Redis when a client is given; Redis keeps values serialized by `dumps`. """
+
+    def __init__(self,
+                 prefix: str,
+                 ttl: float,
+                 local_ttl: float,
+                 max_size: int,
+                 redis: Optional[RedisClient],
+                 dumps: Callable[[Any], str] = json.dumps,
+                 loads: Callable[[str], Any] = json.loads):
+        self.prefix = prefix
+        self.ttl = ttl
+        self.redis = redis
+        self.dumps = dumps
+        self.loads = loads
+        self.local = TTLCache(ttl=local_ttl if redis is not None else ttl, max_size=max_size)
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None or self.redis is None:
+            return value
+
+        raw = await self.redis.get_connection().get(self.prefix + key)
+        if raw is None:
+            return None
+
+        value = self.loads(raw)
+        self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any):
+        self.local.set(key, value)
+
+        if self.redis is not None:
+            await self.redis.get_connection().set(self.prefix + key, self.dumps(value), ex=self.ttl)
+
+    async def delete(self, key: str):
+        await self.delete_all([key])
+
+    async def delete_all(self, keys: Iterable[str]):
+        keys = set(keys)
+        for key in keys:
+            self.local.delete(key)
+
+        if self.redis is not None and keys:
+            await self.redis.get_connection().delete(*[self.prefix + key for key in keys])
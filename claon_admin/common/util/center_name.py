@@ -0,0 +1,69 @@
+import re
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.cache import TTLCache
+from claon_admin.common.util.db import call_after_commit
+from claon_admin.common.util.hangul import has_chosung, to_chosung_pattern
+from claon_admin.config.config import conf
+
+CENTER_NAME_SEARCH_LIMIT = 5
+
+center_name_cache = TTLCache(
+    ttl=conf().CENTER_NAME_CACHE_TTL_SECONDS,
+    max_size=conf().CENTER_NAME_CACHE_MAX_SIZE
+)
+
+
+def normalize_center_name(name: str) -> str:
+    return " ".join(name.split())
+
+
+def match_center_name(query: str, name: str) -> bool:
+    if has_chosung(query):
+        return re.search(to_chosung_pattern(query), name) is not None
+    return query.casefold() in name.casefold()
+
+
+def rank_center_name(query: str, name: str):
+    """ Same ordering as CenterRepository.find_by_name: exact match, then prefix match, then shorter names. """
+    if has_chosung(query):
+        rank = 1 if re.match(to_chosung_pattern(query), name) else 2
+    else:
+        rank = 0 if name == query else 1 if name.casefold().startswith(query.casefold()) else 2
+    return rank, len(name), name
+
+
+def find_center_names(query: str) -> Optional[List[dict]]:
+    centers = center_name_cache.get(query)
+    if centers is not None:
+        return centers
+
+    # Each keystroke only narrows the result, so a complete result of a shorter prefix can be filtered instead
+    for length in range(len(query) - 1, 0, -1):
+        centers = center_name_cache.get(query[:length])
+        if centers is not None and len(centers) < CENTER_NAME_SEARCH_LIMIT:
+            centers = sorted((center for center in centers if match_center_name(query, center["name"])),
+                             key=lambda center: rank_center_name(query, center["name"]))
+            center_name_cache.set(query, centers)
+            return centers
+
+    return None
+
+
+def save_center_names(query: str, centers: List[dict]):
+    center_name_cache.set(query, centers)
+
+
+def evict_center_names():
+    center_name_cache.clear()
+
+
+async def _evict_center_names(names: List[str]):
+    # A changed center can enter or leave the result of any query, not only those matching its name
+    evict_center_names()
+
+
+def evict_center_names_after_commit(session: AsyncSession, name: str):
+    call_after_commit(session, _evict_center_names, [name])
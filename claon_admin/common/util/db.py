@@ -1,18 +1,165 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import Optional, Sequence, Callable, Awaitable, Iterable, List
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from claon_admin.common.util.cache import TTLCache
+from claon_admin.common.util.jwt import find_user_id_by_access_token
 from claon_admin.config.config import conf
 
+AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
 Base = declarative_base()
+logger = logging.getLogger(__name__)
+
+_background_tasks = set()
+
+
+def call_after_commit(session: AsyncSession, callback: Callable[[List], Awaitable], items: Iterable):
+    """ Queues items for `callback`, awaited once with all of them after the session commits; a rollback drops them. """
+    items = list(items)
+    if not items:
+        return
+
+    session.info.setdefault(AFTER_COMMIT_CALLBACKS, {}).setdefault(callback, []).extend(items)
+
+
+def _finish_background_task(task: asyncio.Task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("[DB] after commit callback failed: %r", task.exception())
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session):
+    callbacks = session.info.pop(AFTER_COMMIT_CALLBACKS, None)
+    if not callbacks:
+        return
+
+    for callback, items in callbacks.items():
+        task = asyncio.get_running_loop().create_task(callback(items))
+        _background_tasks.add(task)
+        task.add_done_callback(_finish_background_task)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session):
+    session.info.pop(AFTER_COMMIT_CALLBACKS, None)
+
+
+class PoolStatistics:
+    def __init__(self):
+        self.checkout_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def record(self, wait_time: float):
+        self.checkout_count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    @property
+    def avg_wait_time(self):
+        if self.checkout_count == 0:
+            return 0.0
+
+        return self.total_wait_time / self.checkout_count
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.statistics.record(time.perf_counter() - started_at)
+
+
+class WriteTrackingSession(Session):
+    pass
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _mark_flushed(session: Session, _):
+    session.info["written"] = True
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _mark_executed(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["written"] = True
 
 
 class Database:
-    def __init__(self, db_url: str) -> None:
-        self._engine: AsyncEngine = create_async_engine(db_url, echo=True, pool_pre_ping=True)
+    def __init__(self,
+                 db_url: str,
+                 read_db_urls: Sequence[str] = (),
+                 read_pin_seconds: int = 0,
+                 read_pin_key: Optional[Callable[[Request], Optional[str]]] = None,
+                 echo: bool = False,
+                 pool_size: Optional[int] = None,
+                 max_overflow: Optional[int] = None,
+                 pool_recycle: Optional[int] = None,
+                 pool_timeout: Optional[int] = None,
+                 statement_cache_size: Optional[int] = None) -> None:
+        def create_engine(url: str) -> AsyncEngine:
+            return create_async_engine(
+                url,
+                echo=echo,
+                pool_pre_ping=True,
+                **self.__build_pool_options(url, pool_size, max_overflow, pool_recycle, pool_timeout,
+                                            statement_cache_size)
+            )
+
+        self._engine: AsyncEngine = create_engine(db_url)
         self.async_session_maker = sessionmaker(
-            self._engine, class_=AsyncSession, expire_on_commit=False
+            self._engine, class_=AsyncSession, sync_session_class=WriteTrackingSession, expire_on_commit=False
         )
 
+        self._read_engines = [create_engine(url) for url in read_db_urls]
+        self.async_read_session_makers = [
+            sessionmaker(engine, class_=AsyncSession, expire_on_commit=False) for engine in self._read_engines
+        ]
+        self._read_index = itertools.count()
+        self._read_pin_key = read_pin_key
+        self._pinned = TTLCache(ttl=read_pin_seconds, max_size=conf().DB_READ_PIN_MAX_SIZE)
+
+    @staticmethod
+    def __build_pool_options(db_url: str,
+                             pool_size: Optional[int],
+                             max_overflow: Optional[int],
+                             pool_recycle: Optional[int],
+                             pool_timeout: Optional[int],
+                             statement_cache_size: Optional[int]) -> dict:
+        options = {}
+
+        if pool_size is not None:
+            options["poolclass"] = TimedQueuePool
+            options["pool_size"] = pool_size
+            if max_overflow is not None:
+                options["max_overflow"] = max_overflow
+            if pool_recycle is not None:
+                options["pool_recycle"] = pool_recycle
+            if pool_timeout is not None:
+                options["pool_timeout"] = pool_timeout
+
+        if statement_cache_size is not None and make_url(db_url).get_driver_name() == "asyncpg":
+            options["connect_args"] = {"statement_cache_size": statement_cache_size}
+
+        return options
+
     async def create_database(self) -> None:
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
@@ -26,19 +173,98 @@ class Database:
             await conn.run_sync(Base.metadata.drop_all)
             await conn.run_sync(Base.metadata.create_all)
 
-    async def get_db(self) -> AsyncSession:
+    async def get_db(self, request: Request) -> AsyncSession:
         async with self.async_session_maker() as session:
             try:
                 yield session
                 await session.commit()
+                if session.info.pop("written", False):
+                    self.__pin_to_primary(request)
             except Exception:
                 await session.rollback()
             finally:
                 await session.close()
 
+    async def get_read_db(self, request: Request) -> AsyncSession:
+        if not self.async_read_session_makers or self.__is_pinned_to_primary(request):
+            async with self.async_session_maker() as session:
+                try:
+                    yield session
+                finally:
+                    await session.close()
+            return
+
+        session_maker = self.async_read_session_makers[next(self._read_index) % len(self.async_read_session_makers)]
+        async with session_maker() as session:
+            try:
+                yield session
+            finally:
+                await session.close()
+
+    def __pin_to_primary(self, request: Request):
+        if not self.async_read_session_makers or self._pinned.ttl <= 0 or self._read_pin_key is None:
+            return
+
+        key = self._read_pin_key(request)
+        if key is None:
+            return
+
+        self._pinned.evict_expired()
+        self._pinned.set(key, True)
+
+    def __is_pinned_to_primary(self, request: Request):
+        if self._read_pin_key is None or len(self._pinned) == 0:
+            return False
+
+        key = self._read_pin_key(request)
+        return key is not None and self._pinned.get(key) is not None
+
+    def pool_status(self) -> dict:
+        return {
+            "primary": self.__engine_pool_status(self._engine),
+            "replicas": [self.__engine_pool_status(engine) for engine in self._read_engines]
+        }
+
+    @staticmethod
+    def __engine_pool_status(engine: AsyncEngine) -> dict:
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            return {"pool": type(pool).__name__}
+
+        status = {
+            "pool": type(pool).__name__,
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow()
+        }
+
+        if isinstance(pool, TimedQueuePool):
+            status["checkout_count"] = pool.statistics.checkout_count
+            status["avg_wait_ms"] = round(pool.statistics.avg_wait_time * 1000, 3)
+            status["max_wait_ms"] = round(pool.statistics.max_wait_time * 1000, 3)
+
+        return status
+
     @property
     def session(self):
         return self.get_db
 
 
-db = Database(db_url=conf().DB_URL)
+def _request_user_id(request: Request) -> Optional[str]:
+    # Keyed on the user rather than the token so that the pin survives a token refresh
+    return find_user_id_by_access_token(request.headers.get("access-token"))
+
+
+db = Database(
+    db_url=conf().DB_URL,
+    read_db_urls=conf().DB_READ_URLS,
+    read_pin_seconds=conf().DB_READ_PIN_SECONDS,
+    read_pin_key=_request_user_id,
+    echo=conf().DB_ECHO,
+    pool_size=conf().DB_POOL_SIZE,
+    max_overflow=conf().DB_MAX_OVERFLOW,
+    pool_recycle=conf().DB_POOL_RECYCLE,
+    pool_timeout=conf().DB_POOL_TIMEOUT,
+    statement_cache_size=conf().DB_STATEMENT_CACHE_SIZE
+)
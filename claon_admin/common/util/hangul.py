@@ -0,0 +1,24 @@
+import re
+
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLES_PER_CHOSUNG = 21 * 28
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def is_chosung(char: str) -> bool:
+    return len(char) == 1 and char in CHOSUNG
+
+
+def has_chosung(text: str) -> bool:
+    return any(is_chosung(char) for char in text)
+
+
+def chosung_range(char: str) -> str:
+    """ Character class of every syllable starting with the given chosung, e.g. ㅋ -> [카-킿]. """
+    start = HANGUL_SYLLABLE_START + CHOSUNG.index(char) * HANGUL_SYLLABLES_PER_CHOSUNG
+    return f"[{chr(start)}-{chr(start + HANGUL_SYLLABLES_PER_CHOSUNG - 1)}]"
+
+
+def to_chosung_pattern(text: str) -> str:
+    """ Regular expression matching text where each chosung stands for any syllable it starts. """
+    return "".join(chosung_range(char) if is_chosung(char) else re.escape(char) for char in text)
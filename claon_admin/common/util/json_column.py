@@ -0,0 +1,80 @@
+import json
+from operator import itemgetter
+from typing import Any, Optional, Type
+
+from sqlalchemy import TEXT
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> str:
+    if orjson is not None:
+        # Dates go through str() as with json.dumps, so both backends write the same values
+        return orjson.dumps(value, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
+    return json.dumps(value, default=str)
+
+
+def loads(value: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+class JsonValue:
+    """ Value object stored as a JSON object whose keys are the __slots__ of the subclass, in __init__ order. """
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if len(cls.__slots__) == 1:
+            key = cls.__slots__[0]
+            cls._from_dict = lambda value: cls(value[key])
+        else:
+            getter = itemgetter(*cls.__slots__)
+            cls._from_dict = lambda value: cls(*getter(value))
+
+    @classmethod
+    def from_dict(cls, value: dict):
+        return cls._from_dict(value)
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
+
+
+def normalize(values: list) -> list:
+    """ Values as they read back from a JsonArray column, e.g. dates become ISO strings. """
+    return [type(value).from_dict(loads(dumps(value.to_dict()))) for value in values]
+
+
+class JsonArray(TypeDecorator):
+    """
+    JSON array of value objects kept in a TEXT column, which the main service writes as well.
+    Rows are decoded once when loaded, so reading the attribute does not parse the JSON again.
+    """
+    impl = TEXT
+    cache_ok = True
+
+    def __init__(self, item_type: Type[JsonValue]):
+        super().__init__()
+        self.item_type = item_type
+
+    def process_bind_param(self, value: Optional[list], dialect):
+        if value is None:
+            return None
+        return dumps([item.to_dict() for item in value])
+
+    def process_result_value(self, value: Optional[str], dialect):
+        if value is None:
+            return None
+        from_dict = self.item_type.from_dict
+        return [from_dict(item) for item in loads(value)]
@@ -0,0 +1,63 @@
+import asyncio
+import re
+import time
+from typing import Dict, Optional
+
+from claon_admin.config.config import conf
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def max_age_of(headers) -> int:
+    """ Seconds a response stays fresh according to its Cache-Control and Age headers. """
+    cache_control = headers.get("cache-control", "")
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+
+    match = MAX_AGE_PATTERN.search(cache_control)
+    if match is None:
+        return conf().JWKS_DEFAULT_MAX_AGE_SECONDS
+
+    age = headers.get("age", "0")
+    return max(int(match.group(1)) - (int(age) if age.isdigit() else 0), 0)
+
+
+class JwksCache:
+    """ Signing keys of a JSON Web Key Set by kid, fetched again once the response is stale. """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.keys: Dict[str, dict] = {}
+        self.fetched_at = float("-inf")
+        self.expires_at = float("-inf")
+        self.lock = asyncio.Lock()
+
+    def __find(self, kid: str) -> Optional[dict]:
+        return self.keys.get(kid) if time.monotonic() < self.expires_at else None
+
+    async def get_key(self, client, kid: str) -> Optional[dict]:
+        key = self.__find(kid)
+        if key is not None:
+            return key
+
+        async with self.lock:
+            # Another sign-in may have refreshed the keys while this one waited
+            key = self.__find(kid)
+            if key is None and self.__should_refresh():
+                await self.refresh(client)
+                key = self.keys.get(kid)
+
+        return key
+
+    def __should_refresh(self):
+        # An unknown kid in a fresh key set triggers a refresh at most every JWKS_MIN_REFRESH_SECONDS
+        now = time.monotonic()
+        return now >= self.expires_at or now - self.fetched_at >= conf().JWKS_MIN_REFRESH_SECONDS
+
+    async def refresh(self, client):
+        response = await client.get(self.url)
+        response.raise_for_status()
+
+        self.keys = {key["kid"]: key for key in response.json()["keys"]}
+        self.fetched_at = time.monotonic()
+        self.expires_at = self.fetched_at + max_age_of(response.headers)
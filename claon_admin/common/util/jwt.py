@@ -1,10 +1,15 @@
+import functools
+import time
+import uuid
 from datetime import datetime, timedelta
+from typing import Optional
 
 from jose import jwt
 
 from claon_admin.common.error.exception import UnauthorizedException
 from claon_admin.common.error.exception import ErrorCode
-from claon_admin.common.util.redis import save_refresh_token, delete_refresh_token
+from claon_admin.common.util.cache import TTLCache
+from claon_admin.common.util.redis import save_refresh_token
 from claon_admin.config.config import conf
 from claon_admin.config.consts import TIME_ZONE_KST
 
@@ -18,29 +23,55 @@ def create_access_token(user_id: str) -> str:
     return jwt.encode(to_encode, conf().JWT_SECRET_KEY, conf().JWT_ALGORITHM)
 
 
-def create_refresh_token(user_id: str) -> str:
+async def create_refresh_token(user_id: str) -> str:
     to_encode = {
+        "jti": str(uuid.uuid4()),
         "exp": datetime.now(TIME_ZONE_KST) + timedelta(minutes=conf().REFRESH_TOKEN_EXPIRE_MINUTES)
     }
 
     token = jwt.encode(to_encode, conf().JWT_REFRESH_SECRET_KEY, conf().JWT_ALGORITHM)
-    save_refresh_token(token, user_id)
+    await save_refresh_token(token, user_id)
     return token
 
 
-def reissue_refresh_token(refresh_token: str, user_id: str) -> str:
-    delete_refresh_token(refresh_token)
-    return create_refresh_token(user_id)
+class TokenVerifier:
+    """ Decodes tokens signed with one key and keeps the claims of recently verified tokens until they expire. """
+
+    def __init__(self, secret_key: str, algorithm: str, max_size: int, ttl: float):
+        self.secret_key = secret_key
+        self.algorithms = [algorithm]
+        self.cache = TTLCache(ttl=ttl, max_size=max_size)
+
+    def verify(self, token: str) -> dict:
+        claims = self.cache.get(token)
+        if claims is not None:
+            return claims
+
+        claims = jwt.decode(token, self.secret_key, algorithms=self.algorithms, options={"verify_exp": False})
+
+        # Expiry is checked by the caller, so expired tokens decode but are not kept
+        ttl = min(claims.get("exp", 0) - time.time(), self.cache.ttl)
+        if ttl > 0:
+            self.cache.set(token, claims, ttl)
+
+        return claims
+
+
+@functools.lru_cache(maxsize=None)
+def access_token_verifier() -> TokenVerifier:
+    return TokenVerifier(conf().JWT_SECRET_KEY, conf().JWT_ALGORITHM,
+                         max_size=conf().TOKEN_CACHE_MAX_SIZE, ttl=conf().TOKEN_CACHE_TTL_SECONDS)
+
+
+@functools.lru_cache(maxsize=None)
+def refresh_token_verifier() -> TokenVerifier:
+    return TokenVerifier(conf().JWT_REFRESH_SECRET_KEY, conf().JWT_ALGORITHM,
+                         max_size=conf().TOKEN_CACHE_MAX_SIZE, ttl=conf().TOKEN_CACHE_TTL_SECONDS)
 
 
 def resolve_access_token(access_token: str) -> dict:
     try:
-        return jwt.decode(
-            access_token,
-            conf().JWT_SECRET_KEY,
-            algorithms=[conf().JWT_ALGORITHM],
-            options={"verify_exp": False}
-        )
+        return access_token_verifier().verify(access_token)
     except jwt.JWTError as e:
         raise UnauthorizedException(
             ErrorCode.INVALID_JWT,
@@ -50,12 +81,7 @@ def resolve_access_token(access_token: str) -> dict:
 
 def resolve_refresh_token(refresh_token: str) -> dict:
     try:
-        return jwt.decode(
-            refresh_token,
-            conf().JWT_REFRESH_SECRET_KEY,
-            algorithms=[conf().JWT_ALGORITHM],
-            options={"verify_exp": False}
-        )
+        return refresh_token_verifier().verify(refresh_token)
     except jwt.JWTError as e:
         raise UnauthorizedException(
             ErrorCode.INVALID_JWT,
@@ -63,6 +89,17 @@ def resolve_refresh_token(refresh_token: str) -> dict:
         ) from e
 
 
+def find_user_id_by_access_token(access_token: Optional[str]) -> Optional[str]:
+    """ Subject of a correctly signed access token, expired or not; None for a missing or invalid token. """
+    if access_token is None:
+        return None
+
+    try:
+        return access_token_verifier().verify(access_token).get("sub")
+    except jwt.JWTError:
+        return None
+
+
 def is_expired(payload: dict):
     if datetime.now(TIME_ZONE_KST) > datetime.fromtimestamp(payload.get("exp"), TIME_ZONE_KST):
         return True
@@ -1,31 +1,57 @@
 from typing import Dict
 
-import requests
-from google.oauth2.id_token import verify_oauth2_token
-from google.auth.transport.requests import Request
+from jose import jwt
 
 from claon_admin.common.error.exception import InternalServerException, ErrorCode
+from claon_admin.common.util.jwks import JwksCache
 from claon_admin.config.config import conf
+from claon_admin.config.http import get_http_client
 from claon_admin.model.auth import OAuthUserInfoDto
 from claon_admin.common.enum import OAuthProvider
 
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+KAKAO_USER_INFO_URL = "https://kapi.kakao.com/v2/user/me"
+
+google_jwks = JwksCache(GOOGLE_CERTS_URL)
+
 
 class UserInfoProvider:
+    def __init__(self, client=None):
+        self.client = client
+
+    @property
+    def http_client(self):
+        return self.client or get_http_client()
+
     async def get_user_info(self, token: str):
         pass
 
 
 class GoogleUserInfoProvider(UserInfoProvider):
+    def __init__(self, client=None, jwks: JwksCache = google_jwks):
+        super().__init__(client)
+        self.jwks = jwks
+
     async def get_user_info(self, token: str):
         try:
-            id_token = verify_oauth2_token(token, Request(), conf().GOOGLE_CLIENT_ID)
+            key = await self.jwks.get_key(self.http_client, jwt.get_unverified_header(token).get("kid"))
 
-            if id_token is None:
+            if key is None:
                 raise InternalServerException(
                     ErrorCode.INTERNAL_SERVER_ERROR,
-                    "Failed to google login because of not existing id token"
+                    "Failed to google login because of unknown signing key"
                 )
 
+            id_token = jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=conf().GOOGLE_CLIENT_ID,
+                issuer=GOOGLE_ISSUERS,
+                options={"verify_at_hash": False}
+            )
+
             return OAuthUserInfoDto(oauth_id=id_token['sub'], sns_email=id_token['email'])
         except Exception as e:
             raise InternalServerException(
@@ -37,13 +63,12 @@ class GoogleUserInfoProvider(UserInfoProvider):
 class KakaoUserInfoProvider(UserInfoProvider):
     async def get_user_info(self, token: str):
         try:
-            response: requests.Response = requests.get(
-                url="https://kapi.kakao.com/v2/user/me",
+            response = await self.http_client.get(
+                url=KAKAO_USER_INFO_URL,
                 headers={
                     "Authorization": "Bearer " + token,
                     "Content-Type": "application/x-www-form-urlencoded;charset=utf-8"
-                },
-                timeout=5
+                }
             )
 
             response.raise_for_status()
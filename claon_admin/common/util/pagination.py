@@ -1,10 +1,24 @@
-from typing import TypeVar, Generic, List, Type
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import TypeVar, Generic, List, Type, Optional, Tuple
 
-from fastapi_pagination import Page
+from fastapi import Query
+from fastapi_pagination import Page, Params
 from pydantic import BaseModel
 from pydantic.generics import GenericModel
+from sqlalchemy import and_, or_, desc, Column, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from claon_admin.common.error.exception import BadRequestException, ErrorCode
+from claon_admin.common.util.cache import TTLCache
+from claon_admin.common.util.sql import explain
+from claon_admin.config.config import conf
 
 T = TypeVar('T', bound=BaseModel)
+S = TypeVar('S')
 
 
 class Pagination(GenericModel, Generic[T]):
@@ -14,9 +28,127 @@ class Pagination(GenericModel, Generic[T]):
     results: List[T]
 
 
-class PaginationFactory:
-    S = TypeVar('S')
+class CountStrategy(Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    # Display only: page-number endpoints derive their pages from the total, so they need EXACT or CACHED
+    ESTIMATED = "estimated"
+
+
+count_cache = TTLCache(ttl=conf().PAGINATION_COUNT_CACHE_TTL_SECONDS, max_size=conf().PAGINATION_COUNT_CACHE_MAX_SIZE)
+
+
+async def _count_exact(session: AsyncSession, query: Select) -> int:
+    result = await session.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+    return result.scalar()
+
+
+async def _count_cached(session: AsyncSession, query: Select) -> int:
+    compiled = query.compile(dialect=session.bind.dialect)
+    key = (compiled.string, repr(sorted(compiled.params.items())))
+
+    total = count_cache.get(key)
+    if total is None:
+        total = await _count_exact(session, query)
+        count_cache.set(key, total)
+
+    return total
+
+
+async def _count_estimated(session: AsyncSession, query: Select) -> int:
+    """ Row estimate of the planner; small results are counted exactly since estimates are poor there. """
+    if session.bind.dialect.name != "postgresql":
+        return await _count_exact(session, query)
+
+    result = await session.execute(explain(query.order_by(None)))
+
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    estimated = int(plan[0]["Plan"]["Plan Rows"])
+    if estimated < conf().PAGINATION_ESTIMATE_EXACT_THRESHOLD:
+        return await _count_exact(session, query)
+
+    return estimated
+
+
+_counters = {
+    CountStrategy.EXACT: _count_exact,
+    CountStrategy.CACHED: _count_cached,
+    CountStrategy.ESTIMATED: _count_estimated
+}
+
+
+async def paginate(query: Select,
+                   conn: AsyncSession,
+                   params: Params,
+                   count_strategy: CountStrategy = CountStrategy.EXACT) -> Page:
+    raw_params = params.to_raw_params()
+
+    result = await conn.execute(query.limit(raw_params.limit).offset(raw_params.offset))
+    items = [row[0] if len(row) == 1 else tuple(row) for row in result.all()]
+
+    return Page.create(items=items, params=params, total=await _counters[count_strategy](conn, query))
 
+
+class CursorParams(BaseModel):
+    cursor: Optional[str] = Query(None, description="Cursor of the next page")
+    size: int = Query(50, ge=1, le=100, description="Page size")
+
+
+class CursorPage(Generic[S]):
+    def __init__(self, items: List[S], next_cursor: Optional[str]):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def __eq__(self, other):
+        return isinstance(other, CursorPage) and self.items == other.items and self.next_cursor == other.next_cursor
+
+
+class CursorPagination(GenericModel, Generic[T]):
+    next_cursor: Optional[str]
+    results: List[T]
+
+
+def encode_cursor(created_at: datetime, id_: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{id_}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, id_ = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), id_
+    except ValueError as e:
+        raise BadRequestException(
+            ErrorCode.INVALID_FORMAT,
+            "잘못된 커서입니다."
+        ) from e
+
+
+async def paginate_by_cursor(session: AsyncSession,
+                             query: Select,
+                             params: CursorParams,
+                             created_at: Column,
+                             id_: Column) -> CursorPage:
+    """ Keyset pagination ordered by (created_at, id) descending; the first selected entity provides the cursor. """
+    if params.cursor is not None:
+        cursor_created_at, cursor_id = decode_cursor(params.cursor)
+        query = query.where(or_(created_at < cursor_created_at,
+                                and_(created_at == cursor_created_at, id_ < cursor_id)))
+
+    result = await session.execute(query.order_by(desc(created_at), desc(id_)).limit(params.size + 1))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > params.size:
+        rows = rows[:params.size]
+        next_cursor = encode_cursor(rows[-1][0].created_at, rows[-1][0].id)
+
+    return CursorPage(items=[row[0] if len(row) == 1 else tuple(row) for row in rows], next_cursor=next_cursor)
+
+
+class PaginationFactory:
     async def create(self, t: Type[T], p: Page[S]):
         return Pagination(
             next_page_num=self.__build_next_page(p),
@@ -25,6 +157,12 @@ class PaginationFactory:
             results=[t.from_entity(item) for item in p.items]
         )
 
+    async def create_by_cursor(self, t: Type[T], p: CursorPage[S]):
+        return CursorPagination(
+            next_cursor=p.next_cursor,
+            results=[t.from_entity(item) for item in p.items]
+        )
+
     def __build_next_page(self, p: Page[S]):
         if p.pages - 1 < p.page + 1:
             return -1
@@ -4,17 +4,13 @@ from claon_admin.config.config import conf
 from claon_admin.config.redis import redis
 
 
-def save_refresh_token(refresh_token: str, user_id: str):
-    with redis.get_connection() as conn:
-        conn.set(refresh_token, user_id, ex=conf().REFRESH_TOKEN_EXPIRE_MINUTES * 60)
+async def save_refresh_token(refresh_token: str, user_id: str):
+    await redis.get_connection().set(refresh_token, user_id, ex=conf().REFRESH_TOKEN_EXPIRE_MINUTES * 60)
 
 
-def delete_refresh_token(refresh_token: str):
-    with redis.get_connection() as conn:
-        if conn.get(refresh_token) is not None:
-            conn.delete(refresh_token)
+async def delete_refresh_token(refresh_token: str) -> Optional[str]:
+    """ Consumes a refresh token, returning its user id only to the caller that actually removed it. """
+    async with redis.get_connection().pipeline(transaction=True) as pipe:
+        user_id, _ = await pipe.get(refresh_token).delete(refresh_token).execute()
+    return user_id
 
-
-def find_user_id_by_refresh_token(refresh_token: str) -> Optional[str]:
-    with redis.get_connection() as conn:
-        return conn.get(refresh_token)
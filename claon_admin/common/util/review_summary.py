@@ -0,0 +1,34 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.cache import TwoTierCache
+from claon_admin.common.util.db import call_after_commit
+from claon_admin.config.config import conf
+from claon_admin.config.redis import redis
+
+# Reviews are written by the main service, which does not evict this cache, so a new review shows up only after
+# REVIEW_SUMMARY_CACHE_TTL_SECONDS. Answers written here are evicted once their transaction commits.
+review_summary_cache = TwoTierCache(
+    prefix="review-summary:",
+    ttl=conf().REVIEW_SUMMARY_CACHE_TTL_SECONDS,
+    local_ttl=conf().REVIEW_SUMMARY_CACHE_LOCAL_TTL_SECONDS,
+    max_size=conf().REVIEW_SUMMARY_CACHE_MAX_SIZE,
+    redis=redis
+)
+
+
+async def find_review_summary(center_id: str) -> Optional[dict]:
+    return await review_summary_cache.get(center_id)
+
+
+async def save_review_summary(center_id: str, summary: dict):
+    await review_summary_cache.set(center_id, summary)
+
+
+async def evict_review_summary(center_id: str):
+    await review_summary_cache.delete(center_id)
+
+
+def evict_review_summary_after_commit(session: AsyncSession, center_id: str):
+    call_after_commit(session, review_summary_cache.delete_all, [center_id])
@@ -1,41 +1,121 @@
+import asyncio
+import functools
+import logging
 import mimetypes
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from tempfile import NamedTemporaryFile
+from typing import List
 
 from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.error.exception import InternalServerException, ErrorCode
+from claon_admin.common.util.db import call_after_commit
 from claon_admin.config.config import conf
-from claon_admin.config.s3 import s3
+from claon_admin.config.s3 import get_s3
 
+MIN_MULTIPART_CHUNK_SIZE = 5 * 1024 * 1024
+MAX_DELETE_BATCH_SIZE = 1000
 
-async def upload_file(file: UploadFile, domain: str, purpose: str):
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=conf().S3_MAX_WORKERS, thread_name_prefix="s3")
+_upload_semaphore = asyncio.Semaphore(conf().S3_UPLOAD_CONCURRENCY)
+
+
+async def _run(func, *args, **kwargs):
+    return await asyncio.get_running_loop().run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+def _build_base_url():
+    return "https://" + conf().BUCKET + ".s3." + conf().REGION_NAME + ".amazonaws.com"
+
+
+def build_url(key_name: str):
+    return os.path.join(_build_base_url(), key_name)
+
+
+async def _stream_upload(client, file: UploadFile, key_name: str, content_type: str):
+    chunk_size = max(conf().S3_MULTIPART_CHUNK_SIZE, MIN_MULTIPART_CHUNK_SIZE)
+    chunk = await file.read(chunk_size)
+
+    if len(chunk) < chunk_size:
+        await _run(client.put_object, Bucket=conf().BUCKET, Key=key_name, Body=chunk,
+                   ContentType=content_type, ACL="public-read")
+        return
+
+    upload = await _run(client.create_multipart_upload, Bucket=conf().BUCKET, Key=key_name,
+                        ContentType=content_type, ACL="public-read")
+    upload_id = upload["UploadId"]
+
+    try:
+        parts = []
+        while chunk:
+            part_number = len(parts) + 1
+            response = await _run(client.upload_part, Bucket=conf().BUCKET, Key=key_name, UploadId=upload_id,
+                                  PartNumber=part_number, Body=chunk)
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            chunk = await file.read(chunk_size)
+
+        await _run(client.complete_multipart_upload, Bucket=conf().BUCKET, Key=key_name, UploadId=upload_id,
+                   MultipartUpload={"Parts": parts})
+    except Exception:
+        await _run(client.abort_multipart_upload, Bucket=conf().BUCKET, Key=key_name, UploadId=upload_id)
+        raise
+
+
+async def upload_file(file: UploadFile, domain: str, purpose: str, client=None):
     file_extension = file.filename.split('.')[-1]
     key_name = os.path.join(domain, purpose, str(datetime.now().date()), str(uuid.uuid4()) + '.' + file_extension)
+    content_type = mimetypes.guess_type(f"{file.filename}")[0] or "application/octet-stream"
 
     try:
-        with NamedTemporaryFile() as temp_file:
-            temp_file.write(await file.read())
-            temp_file.seek(0)
-            s3.upload_fileobj(
-                temp_file,
-                conf().BUCKET,
-                key_name,
-                ExtraArgs={"ContentType": mimetypes.guess_type(f"{file.filename}")[0], "ACL": "public-read"}
-            )
-
-            return os.path.join("https://" + conf().BUCKET + ".s3." + conf().REGION_NAME + ".amazonaws.com", key_name)
+        async with _upload_semaphore:
+            await _stream_upload(client or get_s3(), file, key_name, content_type)
+
+        return build_url(key_name)
     except Exception as e:
         raise InternalServerException(ErrorCode.INTERNAL_SERVER_ERROR, "S3 객체 업로드를 실패했습니다.") from e
 
 
-async def delete_file(url: str):
-    prefix = "https://" + conf().BUCKET + ".s3." + conf().REGION_NAME + ".amazonaws.com"
-    key_name = url.replace(prefix, "")[1:]
+def _to_key_name(url: str):
+    return url.replace(_build_base_url(), "")[1:]
+
+
+async def delete_file(url: str, client=None):
+    key_name = _to_key_name(url)
 
     try:
-        s3.delete_object(Bucket=conf().BUCKET, Key=key_name)
+        await _run((client or get_s3()).delete_object, Bucket=conf().BUCKET, Key=key_name)
     except Exception as e:
         raise InternalServerException(ErrorCode.INTERNAL_SERVER_ERROR, "S3 객체 제거에 실패했습니다.") from e
+
+
+async def delete_files(urls: List[str], client=None) -> List[str]:
+    keys = [_to_key_name(url) for url in urls]
+    batches = [keys[i:i + MAX_DELETE_BATCH_SIZE] for i in range(0, len(keys), MAX_DELETE_BATCH_SIZE)]
+
+    results = await asyncio.gather(*[
+        _run((client or get_s3()).delete_objects, Bucket=conf().BUCKET,
+             Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True})
+        for batch in batches
+    ], return_exceptions=True)
+
+    failed_keys = []
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            logger.error("[S3] failed to delete %d objects: %s", len(batch), result)
+            failed_keys.extend(batch)
+            continue
+
+        for error in result.get("Errors", []):
+            logger.error("[S3] failed to delete %s: %s", error.get("Key"), error.get("Message"))
+            failed_keys.append(error.get("Key"))
+
+    return failed_keys
+
+
+def delete_files_after_commit(session: AsyncSession, urls: List[str]):
+    call_after_commit(session, delete_files, urls)
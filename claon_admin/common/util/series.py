@@ -0,0 +1,53 @@
+from array import array
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Iterable, List, Tuple
+
+
+def to_date(value: date) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class DailySeries:
+    """Daily counts from start_date (inclusive) to end_date (exclusive), backed by prefix sums."""
+
+    def __init__(self, start_date: date, end_date: date, values: Iterable[Tuple[date, int]]):
+        self.start_date = to_date(start_date)
+        self.end_date = to_date(end_date)
+
+        counts = array("q", [0]) * max((self.end_date - self.start_date).days, 0)
+        for day, count in values:
+            offset = (to_date(day) - self.start_date).days
+            if 0 <= offset < len(counts):
+                counts[offset] += count
+
+        self.counts = counts
+        self.prefix = array("q", accumulate(counts, initial=0))
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __offset(self, day: date):
+        return min(max((day - self.start_date).days, 0), len(self.counts))
+
+    def sum_between(self, start: date, end: date) -> int:
+        return self.prefix[self.__offset(end)] - self.prefix[self.__offset(start)]
+
+    def sum_last_days(self, days: int) -> int:
+        return self.sum_between(self.end_date - timedelta(days=days), self.end_date)
+
+    def last_days(self, days: int) -> List[Tuple[date, int]]:
+        offset = max(len(self.counts) - days, 0)
+        return [(self.start_date + timedelta(days=offset + i), count) for i, count in enumerate(self.counts[offset:])]
+
+    def complete_weeks(self) -> List[Tuple[date, int]]:
+        """Counts per week ending on Sunday, labelled by that Sunday; the trailing partial week is left out."""
+        last_day = self.end_date - timedelta(days=1)
+        sunday = self.start_date + timedelta(days=6 - self.start_date.weekday())
+
+        weeks = []
+        while sunday <= last_day:
+            weeks.append((sunday, self.sum_between(sunday - timedelta(days=6), sunday + timedelta(days=1))))
+            sunday += timedelta(days=7)
+
+        return weeks
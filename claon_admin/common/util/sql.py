@@ -0,0 +1,55 @@
+import json
+
+from sqlalchemy import Boolean, literal, func, cast, column, bindparam
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import ClauseElement, Executable
+from sqlalchemy.sql.functions import FunctionElement
+
+
+def json_array_values(dialect_name: str, array_column, key: str):
+    """ Table-valued unnesting of a JSON array column; returns the FROM element and the `key` of each object. """
+    if dialect_name == "postgresql":
+        elements = func.jsonb_array_elements(cast(array_column, JSONB)).table_valued(column("value", JSONB))
+        # The key is rendered inline so that the same expression in SELECT and GROUP BY is recognized as equal
+        return elements, elements.c.value.op("->>")(bindparam(None, key, literal_execute=True))
+
+    elements = func.json_each(array_column).table_valued("value")
+    return elements, func.json_extract(elements.c.value, f"$.{key}")
+
+
+class json_array_contains(FunctionElement):
+    """ True when a JSON array column has an object whose `key` equals `value`. """
+    type = Boolean()
+    name = "json_array_contains"
+    inherit_cache = True
+
+    def __init__(self, column, key: str, value: str):
+        super().__init__(column, literal(f"$.{key}"), literal(value), literal(json.dumps([{key: value}])))
+
+
+@compiles(json_array_contains, "postgresql")
+def _compile_json_array_contains_postgresql(element, compiler, **kw):
+    column, _, _, document = list(element.clauses)
+    # Matches the expression of the GIN index on CAST(column AS JSONB)
+    return f"CAST({compiler.process(column, **kw)} AS JSONB) @> CAST({compiler.process(document, **kw)} AS JSONB)"
+
+
+@compiles(json_array_contains, "sqlite")
+def _compile_json_array_contains_sqlite(element, compiler, **kw):
+    column, path, value, _ = list(element.clauses)
+    return f"EXISTS (SELECT 1 FROM json_each({compiler.process(column, **kw)}) " \
+           f"WHERE json_extract(json_each.value, {compiler.process(path, **kw)}) = {compiler.process(value, **kw)})"
+
+
+class explain(Executable, ClauseElement):
+    """ EXPLAIN (FORMAT JSON) of a select; binds go through the select's own compilation. """
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(explain, "postgresql")
+def _compile_explain_postgresql(element, compiler, **kw):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
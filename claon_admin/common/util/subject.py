@@ -0,0 +1,35 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.cache import TwoTierCache
+from claon_admin.common.util.db import call_after_commit
+from claon_admin.config.config import conf
+from claon_admin.config.redis import redis
+from claon_admin.model.auth import RequestUser
+
+subject_cache = TwoTierCache(
+    prefix="subject:",
+    ttl=conf().SUBJECT_CACHE_TTL_SECONDS,
+    local_ttl=conf().SUBJECT_CACHE_LOCAL_TTL_SECONDS,
+    max_size=conf().SUBJECT_CACHE_MAX_SIZE,
+    redis=redis,
+    dumps=RequestUser.json,
+    loads=RequestUser.parse_raw
+)
+
+
+async def find_subject(user_id: str) -> Optional[RequestUser]:
+    return await subject_cache.get(user_id)
+
+
+async def save_subject(subject: RequestUser):
+    await subject_cache.set(subject.id, subject)
+
+
+async def evict_subject(user_id: str):
+    await subject_cache.delete(user_id)
+
+
+def evict_subject_after_commit(session: AsyncSession, user_id: str):
+    call_after_commit(session, subject_cache.delete_all, [user_id])
@@ -6,13 +6,39 @@ from claon_admin.common.error.exception import UnauthorizedException, ErrorCode,
 from claon_admin.common.util.db import db
 from claon_admin.common.util.header import add_jwt_tokens
 from claon_admin.common.util.jwt import resolve_access_token, resolve_refresh_token, is_expired, create_access_token, \
-    reissue_refresh_token
-from claon_admin.common.util.redis import find_user_id_by_refresh_token
+    create_refresh_token
+from claon_admin.common.util.redis import delete_refresh_token
+from claon_admin.common.util.subject import find_subject, save_subject
 from claon_admin.container import Container
 from claon_admin.model.auth import RequestUser
 from claon_admin.schema.user import UserRepository
 
 
+async def load_subject(session: AsyncSession, user_repository: UserRepository, user_id: str) -> RequestUser:
+    subject = await find_subject(user_id)
+    if subject is not None:
+        return subject
+
+    user = await user_repository.find_by_id(session, user_id)
+    if user is None:
+        raise UnauthorizedException(
+            ErrorCode.USER_DOES_NOT_EXIST,
+            "Not existing user account."
+        )
+
+    subject = RequestUser(
+        id=user.id,
+        profile_image=user.profile_img,
+        nickname=user.nickname,
+        sns=user.sns,
+        email=user.email,
+        instagram_nickname=user.instagram_name,
+        role=user.role
+    )
+    await save_subject(subject)
+    return subject
+
+
 @inject
 async def get_subject(
     response: Response,
@@ -44,7 +70,7 @@ async def get_subject(
                     "Both access token and refresh token are expired."
                 )
 
-            user_id = find_user_id_by_refresh_token(refresh_token)
+            user_id = await delete_refresh_token(refresh_token)
             if user_id is None:
                 raise UnauthorizedException(
                     ErrorCode.INVALID_JWT,
@@ -54,24 +80,10 @@ async def get_subject(
             add_jwt_tokens(
                 response,
                 create_access_token(user_id),
-                reissue_refresh_token(refresh_token, user_id),
+                await create_refresh_token(user_id),
             )
 
-            user = await user_repository.find_by_id(session, user_id)
-            if user is None:
-                raise UnauthorizedException(
-                    ErrorCode.USER_DOES_NOT_EXIST,
-                    "Not existing user account."
-                )
-
-            return RequestUser(
-                id=user.id,
-                profile_img=user.profile_img,
-                nickname=user.nickname,
-                email=user.email,
-                instagram_nickname=user.instagram_name,
-                role=user.role
-            )
+            return await load_subject(session, user_repository, user_id)
         else:
             if is_expired(refresh_payload):
                 raise UnauthorizedException(
@@ -79,22 +91,7 @@ async def get_subject(
                     "Refresh token is expired."
                 )
 
-            user = await user_repository.find_by_id(session, access_payload.get("sub"))
-            if user is None:
-                raise UnauthorizedException(
-                    ErrorCode.USER_DOES_NOT_EXIST,
-                    "Not existing user account."
-                )
-
-            return RequestUser(
-                id=user.id,
-                profile_img=user.profile_img,
-                nickname=user.nickname,
-                sns=user.sns,
-                email=user.email,
-                instagram_nickname=user.instagram_name,
-                role=user.role
-            )
+            return await load_subject(session, user_repository, access_payload.get("sub"))
     except Exception as e:
         raise InternalServerException(
             ErrorCode.INTERNAL_SERVER_ERROR,
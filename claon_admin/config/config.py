@@ -1,11 +1,13 @@
+import functools
 from dataclasses import dataclass
 from os import environ, path
+from typing import Optional, Tuple
 from urllib.parse import quote
 
 from claon_admin.config.env import config, db_config, redis_config
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     TRUSTED_HOSTS = ["*"]
     ALLOW_SITE = ["*"]
@@ -13,8 +15,74 @@ class Config:
     BASE_DIR: str = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
     HTML_DIR: str = BASE_DIR + "/claon_admin/template"
 
-
-@dataclass
+    # S3 UPLOAD
+    S3_MAX_WORKERS: int = 8
+    S3_UPLOAD_CONCURRENCY: int = 4
+    S3_MULTIPART_CHUNK_SIZE: int = 8 * 1024 * 1024
+
+    # UPLOAD
+    UPLOAD_MAX_SIZE: int = 10_000_000  # 10MB
+    UPLOAD_MAX_SIZES: Tuple[Tuple[str, int], ...] = ()
+
+    # REQUEST LOG
+    LOG_BODY_MAX_BYTES: int = 2048
+    LOG_BODY_SAMPLE_RATE: float = 1.0
+
+    # HTTP CLIENT
+    HTTP_TIMEOUT_SECONDS: float = 5
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+
+    # JWKS CACHE
+    JWKS_DEFAULT_MAX_AGE_SECONDS: int = 300
+    JWKS_MIN_REFRESH_SECONDS: int = 60
+
+    # TOKEN CACHE
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+
+    # SUBJECT CACHE
+    SUBJECT_CACHE_TTL_SECONDS: int = 300
+    SUBJECT_CACHE_LOCAL_TTL_SECONDS: int = 5
+    SUBJECT_CACHE_MAX_SIZE: int = 10_000
+
+    # REVIEW SUMMARY CACHE
+    REVIEW_SUMMARY_CACHE_TTL_SECONDS: int = 300
+    REVIEW_SUMMARY_CACHE_LOCAL_TTL_SECONDS: int = 5
+    REVIEW_SUMMARY_CACHE_MAX_SIZE: int = 10_000
+
+    # CENTER NAME SEARCH CACHE
+    CENTER_NAME_CACHE_TTL_SECONDS: int = 10
+    CENTER_NAME_CACHE_MAX_SIZE: int = 10_000
+
+    # PAGINATION
+    PAGINATION_COUNT_CACHE_TTL_SECONDS: int = 30
+    PAGINATION_COUNT_CACHE_MAX_SIZE: int = 10_000
+    PAGINATION_ESTIMATE_EXACT_THRESHOLD: int = 1_000
+
+    # DB READ REPLICA
+    DB_READ_URLS: Tuple[str, ...] = ()
+    DB_READ_PIN_SECONDS: int = 0
+    DB_READ_PIN_MAX_SIZE: int = 10_000
+
+    # DB POOL
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[int] = None
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None
+
+    # Settings that must not be empty, checked when the config is created
+    REQUIRED_SETTINGS: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        missing = [name for name in self.REQUIRED_SETTINGS if not getattr(self, name)]
+        if missing:
+            raise ValueError(f"Please check config file, missing settings: {', '.join(missing)}")
+
+
+@dataclass(frozen=True)
 class LocalConfig(Config):
     DB_URL: str = "postgresql+asyncpg://{user_name}:{password}@{ip}:{port}/{db_name}".format(
         user_name="claon_user",
@@ -23,9 +91,16 @@ class LocalConfig(Config):
         port="5432",
         db_name="claon_db"
     )
+    DB_ECHO: bool = True
+    DB_POOL_SIZE: Optional[int] = 5
+    DB_MAX_OVERFLOW: Optional[int] = 5
+    DB_POOL_RECYCLE: Optional[int] = 1800
+    DB_POOL_TIMEOUT: Optional[int] = 30
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = 100
     REDIS_ENABLE: bool = True
     REDIS_HOST: str = "localhost"
     REDIS_PORT: str = "6379"
+    REDIS_MAX_CONNECTIONS: int = 20
 
     # JWT
     JWT_ALGORITHM = config.get("JWT", "ALGORITHM", fallback="")
@@ -46,18 +121,52 @@ class LocalConfig(Config):
     BUCKET = config.get("S3", "BUCKET", fallback="")
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProdConfig(Config):
+    REQUIRED_SETTINGS: Tuple[str, ...] = (
+        "SESSION_SECRET_KEY", "DB_USER_NAME", "DB_PASSWORD", "DB_HOST", "DB_PORT", "DB_NAME", "REDIS_HOST",
+        "REDIS_PORT", "JWT_ALGORITHM", "JWT_SECRET_KEY", "JWT_REFRESH_SECRET_KEY", "ACCESS_TOKEN_EXPIRE_MINUTES",
+        "REFRESH_TOKEN_EXPIRE_MINUTES", "GOOGLE_CLIENT_ID", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY",
+        "REGION_NAME", "BUCKET"
+    )
+    DB_USER_NAME = db_config.get("DB", "DB_USER_NAME", fallback="")
+    DB_PASSWORD = db_config.get("DB", "DB_PASSWORD", fallback="")
+    DB_HOST = db_config.get("DB", "IP", fallback="")
+    DB_PORT = db_config.get("DB", "PORT", fallback="")
+    DB_NAME = db_config.get("DB", "DB_NAME", fallback="")
     DB_URL: str = "postgresql+asyncpg://{user_name}:{password}@{ip}:{port}/{db_name}".format(
-        user_name=db_config.get("DB", "DB_USER_NAME", fallback=""),
-        password=quote(db_config.get("DB", "DB_PASSWORD", fallback="")),
-        ip=db_config.get("DB", "IP", fallback=""),
-        port=db_config.get("DB", "PORT", fallback=""),
-        db_name=db_config.get("DB", "DB_NAME", fallback="")
+        user_name=DB_USER_NAME,
+        password=quote(DB_PASSWORD),
+        ip=DB_HOST,
+        port=DB_PORT,
+        db_name=DB_NAME
+    )
+    DB_READ_URLS: Tuple[str, ...] = tuple(
+        "postgresql+asyncpg://{user_name}:{password}@{ip}:{port}/{db_name}".format(
+            user_name=db_config.get("DB", "DB_USER_NAME", fallback=""),
+            password=quote(db_config.get("DB", "DB_PASSWORD", fallback="")),
+            ip=ip.strip(),
+            port=db_config.get("DB", "PORT", fallback=""),
+            db_name=db_config.get("DB", "DB_NAME", fallback="")
+        ) for ip in db_config.get("DB_READ", "IPS", fallback="").split(",") if ip.strip()
     )
+    DB_READ_PIN_SECONDS: int = db_config.getint("DB_READ", "PIN_SECONDS", fallback=5)
+    UPLOAD_MAX_SIZE: int = config.getint("UPLOAD", "MAX_SIZE", fallback=10_000_000)
+    UPLOAD_MAX_SIZES: Tuple[Tuple[str, int], ...] = tuple(
+        (key, int(value)) for key, value in config.items("UPLOAD_PURPOSE")
+    ) if config.has_section("UPLOAD_PURPOSE") else ()
+    LOG_BODY_MAX_BYTES: int = config.getint("LOG", "BODY_MAX_BYTES", fallback=2048)
+    LOG_BODY_SAMPLE_RATE: float = config.getfloat("LOG", "BODY_SAMPLE_RATE", fallback=0.01)
+    DB_ECHO: bool = db_config.getboolean("POOL", "ECHO", fallback=False)
+    DB_POOL_SIZE: Optional[int] = db_config.getint("POOL", "POOL_SIZE", fallback=20)
+    DB_MAX_OVERFLOW: Optional[int] = db_config.getint("POOL", "MAX_OVERFLOW", fallback=10)
+    DB_POOL_RECYCLE: Optional[int] = db_config.getint("POOL", "POOL_RECYCLE", fallback=1800)
+    DB_POOL_TIMEOUT: Optional[int] = db_config.getint("POOL", "POOL_TIMEOUT", fallback=10)
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = db_config.getint("POOL", "STATEMENT_CACHE_SIZE", fallback=100)
     REDIS_ENABLE: bool = True
     REDIS_HOST: str = redis_config.get("REDIS", "IP", fallback="")
     REDIS_PORT: str = redis_config.get("REDIS", "PORT", fallback="")
+    REDIS_MAX_CONNECTIONS: int = redis_config.getint("REDIS", "MAX_CONNECTIONS", fallback=50)
 
     # JWT
     JWT_ALGORITHM = config.get("JWT", "ALGORITHM", fallback="")
@@ -78,14 +187,23 @@ class ProdConfig(Config):
     BUCKET = config.get("S3", "BUCKET", fallback="")
 
 
-@dataclass
+@dataclass(frozen=True)
 class TestConfig(Config):
     DB_URL: str = "sqlite+aiosqlite:///test.db"
     REDIS_ENABLE: bool = False
     AWS_ENABLE: bool = False
+    REGION_NAME = "ap-northeast-2"
+    BUCKET = "claon-test-bucket"
+    JWT_ALGORITHM = "HS256"
+    JWT_SECRET_KEY = "claon-test-secret"
+    JWT_REFRESH_SECRET_KEY = "claon-test-refresh-secret"
+    ACCESS_TOKEN_EXPIRE_MINUTES = 30
+    REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 14
 
 
+@functools.lru_cache(maxsize=None)
 def conf():
+    """ Settings of the API_ENV environment, created once per process. """
     if environ.get("API_ENV") is None or environ.get("API_ENV") == "local":
         return LocalConfig()
     elif environ.get("API_ENV") == "test":
@@ -94,3 +212,13 @@ def conf():
         return ProdConfig()
     else:
         raise ValueError("Please check environment")
+
+
+def reload_conf():
+    """ Creates the settings again from the class API_ENV selects now, e.g. in tests.
+
+    Config values and the config files are read once at import, and objects built from conf() (JWT verifiers,
+    HTTP and S3 clients, caches, executors) keep the settings they were created with.
+    """
+    conf.cache_clear()
+    return conf()
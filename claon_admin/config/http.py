@@ -0,0 +1,24 @@
+import functools
+
+from claon_admin.config.config import conf
+
+
+@functools.lru_cache(maxsize=None)
+def get_http_client():
+    import httpx  # pylint: disable=import-outside-toplevel
+
+    return httpx.AsyncClient(
+        timeout=conf().HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=conf().HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=conf().HTTP_MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
+
+
+async def close_http_client():
+    if get_http_client.cache_info().currsize == 0:
+        return
+
+    await get_http_client().aclose()
+    get_http_client.cache_clear()
@@ -1,4 +1,5 @@
 import logging
+import logging.config
 
 logging.config.fileConfig('logging.conf', disable_existing_loggers=False)
 
@@ -1,17 +1,40 @@
-import redis as redis_client
+from typing import Optional
+
+from redis import asyncio as redis_client
 
 from claon_admin.config.config import conf
 
 
 class RedisClient:
-    def __init__(self, host, port):
+    def __init__(self, host, port, max_connections):
         self.host = host
         self.port = port
+        self.max_connections = max_connections
+        self.pool: Optional[redis_client.ConnectionPool] = None
+        self.client: Optional[redis_client.Redis] = None
+
+    def connect(self):
+        if self.pool is None:
+            self.pool = redis_client.ConnectionPool(
+                host=self.host,
+                port=self.port,
+                db=0,
+                max_connections=self.max_connections,
+                decode_responses=True
+            )
+            self.client = redis_client.Redis(connection_pool=self.pool)
+
+    async def disconnect(self):
+        if self.pool is not None:
+            await self.pool.disconnect()
+            self.pool = None
+            self.client = None
 
-    def get_connection(self):
-        return redis_client.StrictRedis(host=self.host, port=self.port, db=0)
+    def get_connection(self) -> redis_client.Redis:
+        self.connect()
+        return self.client
 
 
 redis = None
 if conf().REDIS_ENABLE:
-    redis = RedisClient(host=conf().REDIS_HOST, port=conf().REDIS_PORT)
+    redis = RedisClient(host=conf().REDIS_HOST, port=conf().REDIS_PORT, max_connections=conf().REDIS_MAX_CONNECTIONS)
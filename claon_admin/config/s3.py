@@ -1,10 +1,12 @@
-import boto3
+import functools
 
 from claon_admin.config.config import conf
 
 
 class S3Client:
     def __init__(self, aws_access_key_id, aws_secret_access_key, region_name):
+        import boto3  # pylint: disable=import-outside-toplevel
+
         self.client = boto3.client(
             "s3",
             aws_access_key_id=aws_access_key_id,
@@ -13,9 +15,12 @@ class S3Client:
         )
 
 
-s3 = None
-if conf().AWS_ENABLE:
-    s3 = S3Client(
+@functools.lru_cache(maxsize=None)
+def get_s3():
+    if not conf().AWS_ENABLE:
+        return None
+
+    return S3Client(
         aws_access_key_id=conf().AWS_ACCESS_KEY_ID,
         aws_secret_access_key=conf().AWS_SECRET_ACCESS_KEY,
         region_name=conf().REGION_NAME,
@@ -4,7 +4,7 @@ from claon_admin.common.util.pagination import PaginationFactory
 from claon_admin.common.util.oauth import OAuthUserInfoProviderSupplier, GoogleUserInfoProvider, KakaoUserInfoProvider
 from claon_admin.schema.center import CenterRepository, CenterApprovedFileRepository, CenterHoldRepository, \
     CenterWallRepository, CenterFeeRepository, ReviewRepository, ReviewAnswerRepository
-from claon_admin.schema.post import PostRepository, PostCountHistoryRepository
+from claon_admin.schema.post import PostRepository, PostCountHistoryRepository, PostSummaryRepository
 from claon_admin.schema.user import UserRepository, LectorRepository, LectorApprovedFileRepository
 from claon_admin.service.admin import AdminService
 from claon_admin.service.center import CenterService
@@ -23,6 +23,7 @@ class Container(containers.DeclarativeContainer):
     center_wall_repository = providers.Factory(CenterWallRepository)
     post_repository = providers.Factory(PostRepository)
     post_count_history_repository = providers.Factory(PostCountHistoryRepository)
+    post_summary_repository = providers.Factory(PostSummaryRepository)
     review_repository = providers.Factory(ReviewRepository)
     review_answer_repository = providers.Factory(ReviewAnswerRepository)
     pagination_factory = providers.Factory(PaginationFactory)
@@ -57,7 +58,8 @@ class Container(containers.DeclarativeContainer):
         lector_repository=lector_repository,
         lector_approved_file_repository=lector_approved_file_repository,
         center_repository=center_repository,
-        center_approved_file_repository=center_approved_file_repository
+        center_approved_file_repository=center_approved_file_repository,
+        pagination_factory=pagination_factory
     )
 
     center_service = providers.Factory(
@@ -65,6 +67,7 @@ class Container(containers.DeclarativeContainer):
         center_repository=center_repository,
         post_repository=post_repository,
         post_count_history_repository=post_count_history_repository,
+        post_summary_repository=post_summary_repository,
         review_repository=review_repository,
         review_answer_repository=review_answer_repository,
         pagination_factory=pagination_factory
@@ -0,0 +1,62 @@
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Tuple
+
+from claon_admin.config.redis import redis, RedisClient
+
+JOB_LOCK_KEY_PREFIX = "job-lock:"
+
+
+class JobLock(ABC):
+    @abstractmethod
+    async def acquire(self, name: str, ttl: int) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def release(self, name: str, token: str):
+        pass
+
+
+class RedisJobLock(JobLock):
+    RELEASE_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, client: RedisClient):
+        self.client = client
+
+    async def acquire(self, name: str, ttl: int) -> Optional[str]:
+        token = str(uuid.uuid4())
+        if await self.client.get_connection().set(JOB_LOCK_KEY_PREFIX + name, token, nx=True, ex=ttl):
+            return token
+        return None
+
+    async def release(self, name: str, token: str):
+        await self.client.get_connection().eval(self.RELEASE_SCRIPT, 1, JOB_LOCK_KEY_PREFIX + name, token)
+
+
+class LocalJobLock(JobLock):
+    def __init__(self):
+        self.locks: Dict[str, Tuple[str, float]] = {}
+
+    async def acquire(self, name: str, ttl: int) -> Optional[str]:
+        current = time.monotonic()
+        lock = self.locks.get(name)
+        if lock is not None and lock[1] > current:
+            return None
+
+        token = str(uuid.uuid4())
+        self.locks[name] = (token, current + ttl)
+        return token
+
+    async def release(self, name: str, token: str):
+        lock = self.locks.get(name)
+        if lock is not None and lock[0] == token:
+            del self.locks[name]
+
+
+job_lock: JobLock = RedisJobLock(redis) if redis is not None else LocalJobLock()
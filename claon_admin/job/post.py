@@ -1,32 +1,82 @@
-from datetime import timedelta
+import asyncio
+from datetime import timedelta, date
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.util.db import db
 from claon_admin.common.util.time import now
+from claon_admin.job.runner import run_job
 from claon_admin.schema.center import CenterRepository
-from claon_admin.schema.post import PostRepository, PostCountHistoryRepository, PostCountHistory
+from claon_admin.model.post import PostSummaryResponseDto
+from claon_admin.schema.post import PostRepository, PostCountHistoryRepository, PostCountHistory, \
+    PostSummaryRepository, PostSummary
 
 scheduler = AsyncIOScheduler()
 
 
+async def aggregate_post_count(session: AsyncSession, start_date: date, end_date: date):
+    center_ids = await CenterRepository.find_all_ids_by_approved_true(session)
+
+    row_count = 0
+    reg_date = start_date
+    while reg_date < end_date:
+        post_count_by_center = await PostRepository.count_by_center_and_date(
+            session, center_ids, reg_date, reg_date + timedelta(days=1)
+        )
+
+        row_count += await PostCountHistoryRepository.upsert_all(session, [PostCountHistory(
+            center_id=center_id,
+            count=count,
+            reg_date=reg_date
+        ) for center_id, count in post_count_by_center.items()])
+        reg_date += timedelta(days=1)
+
+    return row_count
+
+
+async def refresh_post_summary(session: AsyncSession, base_date: date):
+    start_date = PostSummaryResponseDto.start_date_of(base_date)
+
+    for center_id in await CenterRepository.find_all_ids_by_approved_true(session):
+        total_count = await PostCountHistoryRepository.sum_count_by_center(session, center_id)
+        count_history_by_year = await PostCountHistoryRepository.find_by_center_and_date(
+            session, center_id, start_date, base_date
+        )
+
+        await PostSummaryRepository.save(session, PostSummary(
+            center_id=center_id,
+            base_date=base_date,
+            summary=PostSummaryResponseDto.summarize(base_date, total_count, count_history_by_year)
+        ))
+
+
 async def count_post_by_day():
     async with db.async_session_maker() as session:
-        center_ids = await CenterRepository.find_all_ids_by_approved_true(session)
-
         end_date = now().date()
         start_date = end_date - timedelta(days=1)
-        post_count_by_center = await PostRepository.count_by_center_and_date(session, center_ids, start_date, end_date)
 
-        await PostCountHistoryRepository.save_all(session, [PostCountHistory(
-            center_id=center_id,
-            count=count,
-            reg_date=start_date
-        ) for center_id, count in post_count_by_center])
+        last_reg_date = await PostCountHistoryRepository.find_last_reg_date(session)
+        if last_reg_date is not None:
+            start_date = min(last_reg_date + timedelta(days=1), start_date)
+
+        row_count = await aggregate_post_count(session, start_date, end_date)
+        await refresh_post_summary(session, end_date)
+        await session.commit()
+        return row_count
+
+
+async def backfill_post_count(start_date: date, end_date: date):
+    async with db.async_session_maker() as session:
+        row_count = await aggregate_post_count(session, start_date, end_date)
+        await PostSummaryRepository.delete_all(session)
+        await session.commit()
+        return row_count
 
 
 def add_job():
-    scheduler.add_job(count_post_by_day, "cron", hour=0, minute=0, second=0)
+    scheduler.add_job(run_job, "cron", args=["count_post_by_day", count_post_by_day],
+                      hour=0, minute=0, second=0, misfire_grace_time=60 * 60, coalesce=True)
 
 
 def start():
@@ -36,3 +86,15 @@ def start():
 
 def shutdown():
     scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill post count history")
+    parser.add_argument("command", choices=["backfill"])
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="first date to aggregate")
+    parser.add_argument("--end", type=date.fromisoformat, required=True, help="date to stop before (exclusive)")
+    args = parser.parse_args()
+
+    print(f"{asyncio.run(backfill_post_count(args.start, args.end))} rows written")
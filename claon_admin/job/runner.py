@@ -0,0 +1,43 @@
+import logging
+import time
+from typing import Callable, Awaitable, Optional
+
+from claon_admin.common.util.db import db
+from claon_admin.common.util.time import now
+from claon_admin.job.lock import job_lock
+from claon_admin.schema.job import JobHistory, JobHistoryRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def run_job(job_name: str, job: Callable[[], Awaitable[Optional[int]]], lock_ttl: int = 60 * 60):
+    # The lock is kept until it expires on success so that workers firing late skip the same run.
+    token = await job_lock.acquire(job_name, lock_ttl)
+    if token is None:
+        logger.info("[JOB] %s is already running on another worker", job_name)
+        return None
+
+    started_at = now()
+    started = time.perf_counter()
+    row_count, error = None, None
+    try:
+        row_count = await job()
+    except Exception as e:
+        error = repr(e)
+        await job_lock.release(job_name, token)
+        logger.exception("[JOB] %s failed", job_name)
+
+    async with db.async_session_maker() as session:
+        await JobHistoryRepository.save(session, JobHistory(
+            job_name=job_name,
+            started_at=started_at,
+            finished_at=now(),
+            duration=time.perf_counter() - started,
+            row_count=row_count,
+            succeeded=error is None,
+            error=error
+        ))
+        await session.commit()
+
+    logger.info("[JOB] %s finished: rows=%s, duration=%.3fs", job_name, row_count, time.perf_counter() - started)
+    return row_count
@@ -1,4 +1,3 @@
-import asyncio
 from os import environ
 
 import nest_asyncio
@@ -11,20 +10,17 @@ from starlette.middleware.sessions import SessionMiddleware
 from claon_admin.common.error.handler import add_http_exception_handler
 from claon_admin.common.util.db import db
 from claon_admin.config.config import conf
+from claon_admin.config.http import close_http_client
+from claon_admin.config.redis import redis
 from claon_admin.container import Container
 from claon_admin.job import post as job_post
 from claon_admin.middleware.file import LimitUploadSize
 from claon_admin.middleware.log import LoggerMiddleware
+from claon_admin.migration import check_schema_version
 from claon_admin.router import center, auth, admin, user, index
 
 nest_asyncio.apply()
 
-""" Initialize Database """
-if environ.get("API_ENV") != "test":
-    asyncio.run(db.create_database())
-else:
-    asyncio.run(db.create_drop_database())
-
 
 def create_app() -> FastAPI:
     claon_app = FastAPI()
@@ -67,12 +63,23 @@ app = create_app()
 
 @app.on_event("startup")
 async def startup():
+    """ Initialize Database """
+    if environ.get("API_ENV") != "test":
+        await check_schema_version(db)
+    else:
+        await db.create_drop_database()
+
+    if redis is not None:
+        redis.connect()
     job_post.start()
 
 
 @app.on_event("shutdown")
 async def shutdown():
     job_post.shutdown()
+    await close_http_client()
+    if redis is not None:
+        await redis.disconnect()
 
 if __name__ == "__main__":
     uvicorn.run('main:app', host='0.0.0.0', port=8000, reload=True)
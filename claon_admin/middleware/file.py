@@ -1,34 +1,92 @@
+import re
+from typing import Dict, Optional
+
 from starlette import status
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from claon_admin.common.enum import CenterUploadPurpose, LectorUploadPurpose, UserUploadPurpose
 from claon_admin.common.error.exception import ErrorCode
+from claon_admin.config.config import conf
 from claon_admin.config.log import logger
 
+# Upload routes by the purpose in their path; limits are keyed by "<domain>.<purpose>", e.g. "center.proof"
+UPLOAD_ROUTES = (
+    (re.compile(r"^/api/v1/centers/(?P<purpose>[^/]+)/file$"), "center", CenterUploadPurpose),
+    (re.compile(r"^/api/v1/users/(?P<purpose>[^/]+)/file$"), "lector", LectorUploadPurpose),
+    (re.compile(r"^/api/v1/users/(?P<purpose>profile)$"), "user", UserUploadPurpose),
+)
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class LimitUploadSize:
+    """ Rejects a multipart upload with 413 as soon as its streamed body crosses the limit of its route. """
+
+    def __init__(self, app: ASGIApp, max_size: Optional[int] = None, max_sizes: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.max_size = conf().UPLOAD_MAX_SIZE if max_size is None else max_size
+        self.max_sizes = dict(conf().UPLOAD_MAX_SIZES) if max_sizes is None else max_sizes
+
+    def limit_of(self, path: str) -> int:
+        for pattern, domain, purpose_type in UPLOAD_ROUTES:
+            match = pattern.match(path)
+            if match is not None and match.group("purpose") in {purpose.value for purpose in purpose_type}:
+                return self.max_sizes.get(f"{domain}.{match.group('purpose')}", self.max_size)
+        return self.max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        content_type = Headers(scope=scope).get("content-type") if scope["type"] == "http" else None
+        if scope["type"] != "http" or scope["method"] != "POST" \
+                or content_type is None or "multipart/form-data" not in content_type:
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limit_of(scope["path"])
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            await self.reject(scope, receive, send, limit)
+            return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def receive_with_limit() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise UploadTooLarge()
+            return message
+
+        async def send_unless_exceeded(message: Message):
+            nonlocal response_started
+            # The app may turn the aborted body into its own error response, which is replaced by 413
+            if exceeded:
+                return
+            response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive_with_limit, send_unless_exceeded)
+        except Exception:  # pylint: disable=broad-except
+            if not exceeded:
+                raise
+
+        if exceeded and not response_started:
+            await self.reject(scope, receive, send, limit)
 
-class LimitUploadSize(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-        self.max_uploaded_size = 10_000_000  # 10MB
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.method == "POST":
-            request_headers = dict(request.headers)
-            if request_headers.get('content-type') is not None \
-                    and "multipart/form-data" in request_headers['content-type']:
-                if 'content-length' not in request_headers:
-                    logger.error("[REQUEST] [%s] path: %s [RESPONSE] code: %d",
-                                 request.method, request.url.path, ErrorCode.LENGTH_REQUIRED.value)
-                    return JSONResponse(status_code=status.HTTP_411_LENGTH_REQUIRED,
-                                        content={"code": ErrorCode.LENGTH_REQUIRED.value,
-                                                 "message": "파일 요청 형식이 올바르지 않습니다."})
-                content_length = int(request_headers['content-length'])
-                if content_length > self.max_uploaded_size:
-                    logger.error("[REQUEST] [%s] path: %s [RESPONSE] code: %d",
-                                 request.method, request.url.path, ErrorCode.REQUEST_ENTITY_TOO_LARGE.value)
-                    return JSONResponse(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                                        content={"code": ErrorCode.REQUEST_ENTITY_TOO_LARGE.value,
-                                                 "message": "파일은 10MB 이하로 업로드 가능합니다."})
-        return await call_next(request)
+    @staticmethod
+    async def reject(scope: Scope, receive: Receive, send: Send, limit: int):
+        logger.error("[REQUEST] [%s] path: %s [RESPONSE] code: %d",
+                     scope["method"], scope["path"], ErrorCode.REQUEST_ENTITY_TOO_LARGE.value)
+        response = JSONResponse(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                                content={"code": ErrorCode.REQUEST_ENTITY_TOO_LARGE.value,
+                                         "message": f"파일은 {limit // 1_000_000}MB 이하로 업로드 가능합니다."})
+        await response(scope, receive, send)
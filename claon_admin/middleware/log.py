@@ -1,44 +1,80 @@
+import random
 import uuid
+from typing import Optional
 
-from fastapi import Request
-from starlette.concurrency import iterate_in_threadpool
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
-from starlette.types import Message
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from claon_admin.config.config import conf
 from claon_admin.config.log import logger
 
+SKIP_PATHS = ("/docs", "/redoc", "/openapi.json", "/log", "/status/db-pool")
 
-async def set_body(request: Request):
-    receive_ = await request._receive()
 
-    async def receive() -> Message:
-        return receive_
+class BodyTee:
+    """ First max_size bytes of a streamed body; the rest is only counted. """
 
-    request._receive = receive
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.head = bytearray()
+        self.size = 0
 
+    def write(self, chunk: bytes):
+        if len(self.head) < self.max_size:
+            self.head += chunk[:self.max_size - len(self.head)]
+        self.size += len(chunk)
 
-class LoggerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in ["/docs", "/redoc", "/openapi.json", "/log"]:
-            return await call_next(request)
+    def __str__(self):
+        body = self.head.decode("utf-8", errors="replace")
+        if self.size > len(self.head):
+            return f"{body}... (truncated, {self.size} bytes)"
+        return body
 
-        idem = ''.join(str(uuid.uuid4()))
-        request_headers = dict(request.headers)
-        logger.info("[%s] [REQUEST] [%s] path: %s", idem, request.method, request.url.path)
-        if request_headers.get('content-type') is not None and not (
-                "multipart/form-data" in request_headers['content-type']):
-            await set_body(request)
-            request_body = await request.body()
-            if request_body and not "multipart/form-data" in request_headers['content-type']:
-                logger.info("[%s] [REQUEST] body: %s", idem, request_body.decode('utf-8'))
 
-        response = await call_next(request)
+class LoggerMiddleware:
+    """
+    Logs each request and response while they stream through.
+    Bodies are logged for a sample of requests and for every error response, up to LOG_BODY_MAX_BYTES.
+    """
 
-        response_body = [chunk async for chunk in response.body_iterator]
-        response.body_iterator = iterate_in_threadpool(iter(response_body))
+    def __init__(self, app: ASGIApp, max_body_size: Optional[int] = None, sample_rate: Optional[float] = None):
+        self.app = app
+        self.max_body_size = conf().LOG_BODY_MAX_BYTES if max_body_size is None else max_body_size
+        self.sample_rate = conf().LOG_BODY_SAMPLE_RATE if sample_rate is None else sample_rate
 
-        logger.info("[%s] [RESPONSE] status_code: %d", idem, response.status_code)
-        logger.info("[%s] [RESPONSE] body: %s", idem, response_body[0].decode('utf-8'))
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        idem = str(uuid.uuid4())
+        logger.info("[%s] [REQUEST] [%s] path: %s", idem, scope["method"], scope["path"])
+
+        content_type = Headers(scope=scope).get("content-type")
+        request_body = BodyTee(self.max_body_size) \
+            if content_type is not None and "multipart/form-data" not in content_type else None
+        response_body = BodyTee(self.max_body_size)
+        status_code = 500
+
+        async def receive_with_log() -> Message:
+            message = await receive()
+            if request_body is not None and message["type"] == "http.request":
+                request_body.write(message.get("body", b""))
+            return message
+
+        async def send_with_log(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_body.write(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_with_log, send_with_log)
+        finally:
+            logger.info("[%s] [RESPONSE] status_code: %d", idem, status_code)
+            if status_code >= 400 or random.random() < self.sample_rate:
+                if request_body is not None and request_body.size:
+                    logger.info("[%s] [REQUEST] body: %s", idem, request_body)
+                logger.info("[%s] [RESPONSE] body: %s", idem, response_body)
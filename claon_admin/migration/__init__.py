@@ -0,0 +1,24 @@
+import os
+
+from claon_admin.common.util.db import Database
+
+MIGRATION_DIR = os.path.dirname(__file__)
+
+
+class SchemaVersionMismatchError(RuntimeError):
+    pass
+
+
+async def check_schema_version(database: Database):
+    from alembic.runtime.migration import MigrationContext  # pylint: disable=import-outside-toplevel
+    from alembic.script import ScriptDirectory  # pylint: disable=import-outside-toplevel
+
+    head = ScriptDirectory(MIGRATION_DIR).get_current_head()
+    async with database._engine.connect() as conn:
+        current = await conn.run_sync(lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision())
+
+    if current != head:
+        raise SchemaVersionMismatchError(
+            f"Database schema is at revision {current} but the application expects {head}; "
+            f"run 'alembic upgrade head' before starting the server"
+        )
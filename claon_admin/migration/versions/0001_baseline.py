@@ -0,0 +1,181 @@
+"""baseline
+
+Schema created by metadata.create_all before migrations were introduced.
+Existing databases should be stamped with this revision instead of upgraded.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 19:11:55.410888
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('tb_post_count_history',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('center_id', sa.String(length=255), nullable=False),
+    sa.Column('reg_date', sa.DateTime(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tb_post_count_history_id'), 'tb_post_count_history', ['id'], unique=False)
+    op.create_table('tb_user',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('oauth_id', sa.String(length=255), nullable=False),
+    sa.Column('nickname', sa.String(length=40), nullable=False),
+    sa.Column('profile_img', sa.TEXT(), nullable=False),
+    sa.Column('sns', sa.String(length=500), nullable=False),
+    sa.Column('email', sa.String(length=500), nullable=True),
+    sa.Column('instagram_name', sa.String(length=255), nullable=True),
+    sa.Column('role', sa.Enum('PENDING', 'NOT_APPROVED', 'ADMIN', 'USER', 'LECTOR', 'CENTER_ADMIN', name='role'),
+              nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('instagram_name'),
+    sa.UniqueConstraint('nickname'),
+    sa.UniqueConstraint('oauth_id')
+    )
+    op.create_table('tb_center',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('name', sa.String(length=30), nullable=False),
+    sa.Column('profile_img', sa.TEXT(), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=False),
+    sa.Column('detail_address', sa.String(length=255), nullable=True),
+    sa.Column('tel', sa.String(length=255), nullable=False),
+    sa.Column('web_url', sa.String(length=500), nullable=True),
+    sa.Column('instagram_name', sa.String(length=20), nullable=True),
+    sa.Column('youtube_url', sa.String(length=500), nullable=True),
+    sa.Column('approved', sa.Boolean(), nullable=False),
+    sa.Column('_center_img', sa.TEXT(), nullable=True),
+    sa.Column('_operating_time', sa.TEXT(), nullable=True),
+    sa.Column('_utility', sa.TEXT(), nullable=True),
+    sa.Column('_fee_img', sa.TEXT(), nullable=True),
+    sa.Column('user_id', sa.String(length=255), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_lector',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('is_setter', sa.Boolean(), nullable=False),
+    sa.Column('approved', sa.Boolean(), nullable=False),
+    sa.Column('_contest', sa.TEXT(), nullable=True),
+    sa.Column('_certificate', sa.TEXT(), nullable=True),
+    sa.Column('_career', sa.TEXT(), nullable=True),
+    sa.Column('user_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    op.create_table('tb_center_approved_file',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('url', sa.String(length=255), nullable=True),
+    sa.Column('user_id', sa.String(length=255), nullable=False),
+    sa.Column('center_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['tb_center.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_center_fee',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('membership_type', sa.Enum('PACKAGE', 'MEMBER', 'COURSE', name='membershiptype'), nullable=False),
+    sa.Column('price', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('period', sa.Integer(), nullable=False),
+    sa.Column('period_type', sa.Enum('WEEK', 'MONTH', name='periodtype'), nullable=False),
+    sa.Column('center_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['tb_center.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_center_hold',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('name', sa.String(length=10), nullable=True),
+    sa.Column('difficulty', sa.String(length=10), nullable=True),
+    sa.Column('is_color', sa.Boolean(), nullable=False),
+    sa.Column('center_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['tb_center.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_center_wall',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('name', sa.String(length=20), nullable=True),
+    sa.Column('type', sa.String(length=20), nullable=True),
+    sa.Column('center_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['tb_center.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_lector_approved_file',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('url', sa.String(length=255), nullable=True),
+    sa.Column('lector_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['lector_id'], ['tb_lector.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_post',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.String(length=500), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('_img', sa.TEXT(), nullable=False),
+    sa.Column('user_id', sa.String(length=255), nullable=False),
+    sa.Column('center_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['tb_center.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_review',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.String(length=500), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('_tag', sa.TEXT(), nullable=False),
+    sa.Column('user_id', sa.String(length=255), nullable=False),
+    sa.Column('center_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['tb_center.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_climbing_history',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('hold_id', sa.String(length=255), nullable=False),
+    sa.Column('difficulty', sa.String(length=10), nullable=False),
+    sa.Column('challenge_count', sa.Integer(), nullable=False),
+    sa.Column('wall_name', sa.String(length=20), nullable=False),
+    sa.Column('wall_type', sa.Enum('ENDURANCE', 'BOULDERING', name='walltype'), nullable=False),
+    sa.Column('post_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['tb_post.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_review_answer',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.String(length=500), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('review_id', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['review_id'], ['tb_review.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('review_id')
+    )
+
+
+def downgrade():
+    op.drop_table('tb_review_answer')
+    op.drop_table('tb_climbing_history')
+    op.drop_table('tb_review')
+    op.drop_table('tb_post')
+    op.drop_table('tb_lector_approved_file')
+    op.drop_table('tb_center_wall')
+    op.drop_table('tb_center_hold')
+    op.drop_table('tb_center_fee')
+    op.drop_table('tb_center_approved_file')
+    op.drop_table('tb_lector')
+    op.drop_table('tb_center')
+    op.drop_table('tb_user')
+    op.drop_index(op.f('ix_tb_post_count_history_id'), table_name='tb_post_count_history')
+    op.drop_table('tb_post_count_history')
+
+    for name in ['role', 'membershiptype', 'periodtype', 'walltype']:
+        sa.Enum(name=name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,34 @@
+"""add indexes for post and review range queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 19:20:00.000000
+"""
+from alembic import op
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases stamped at the baseline had tb_post_count_history created before this index was declared,
+    # and re-runs of the old aggregation job left duplicate rows. Each duplicate holds the full count of its
+    # day, so the latest row per (center_id, reg_date) is kept rather than the sum.
+    op.execute("DELETE FROM tb_post_count_history WHERE id NOT IN "
+               "(SELECT MAX(id) FROM tb_post_count_history GROUP BY center_id, reg_date)")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_post_count_history_center_id_reg_date "
+               "ON tb_post_count_history (center_id, reg_date)")
+    op.create_index('ix_post_center_id_created_at', 'tb_post', ['center_id', 'created_at'], unique=False)
+    op.create_index('ix_review_center_id_created_at', 'tb_review', ['center_id', 'created_at'], unique=False)
+    op.create_index('ix_climbing_history_post_id_hold_id', 'tb_climbing_history', ['post_id', 'hold_id'],
+                    unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_climbing_history_post_id_hold_id', table_name='tb_climbing_history')
+    op.drop_index('ix_review_center_id_created_at', table_name='tb_review')
+    op.drop_index('ix_post_center_id_created_at', table_name='tb_post')
+    op.drop_index('ux_post_count_history_center_id_reg_date', table_name='tb_post_count_history')
@@ -0,0 +1,21 @@
+"""add index for review visit counts
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 20:10:00.000000
+"""
+from alembic import op
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_post_center_id_user_id', 'tb_post', ['center_id', 'user_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_post_center_id_user_id', table_name='tb_post')
@@ -0,0 +1,24 @@
+"""add GIN index for review tag filters
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 20:40:00.000000
+"""
+from alembic import op
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Tags stay in the _tag TEXT column the main service writes; the index is on its JSONB cast.
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE INDEX ix_review_tag ON tb_review USING gin ((CAST(_tag AS JSONB)) jsonb_path_ops)")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index('ix_review_tag', table_name='tb_review')
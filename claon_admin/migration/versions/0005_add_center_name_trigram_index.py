@@ -0,0 +1,28 @@
+"""add trigram index for center name search
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 22:10:00.000000
+"""
+from alembic import op
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves the ILIKE '%name%' search of unclaimed centers in CenterRepository.find_by_name. The chosung regex
+    # lookups get little or no help, since a character class such as [라-맇] yields no trigrams.
+    # pg_trgm keeps only the characters LC_CTYPE classifies as alphanumeric, so under a C locale Hangul is dropped
+    # and Hangul names get no help either; the database needs a UTF-8 ctype such as ko_KR.UTF-8.
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX ix_center_name_trgm ON tb_center USING gin (name gin_trgm_ops) WHERE user_id IS NULL")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index('ix_center_name_trgm', table_name='tb_center')
@@ -0,0 +1,42 @@
+"""add job history and post summary tables
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 23:30:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('tb_job_history',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('job_name', sa.String(length=100), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=False),
+    sa.Column('duration', sa.Float(), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=True),
+    sa.Column('succeeded', sa.Boolean(), nullable=False),
+    sa.Column('error', sa.TEXT(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_job_history_job_name_started_at', 'tb_job_history', ['job_name', 'started_at'], unique=False)
+    op.create_table('tb_post_summary',
+    sa.Column('center_id', sa.String(length=255), nullable=False),
+    sa.Column('base_date', sa.Date(), nullable=False),
+    sa.Column('_summary', sa.TEXT(), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['tb_center.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('center_id')
+    )
+
+
+def downgrade():
+    op.drop_table('tb_post_summary')
+    op.drop_index('ix_job_history_job_name_started_at', table_name='tb_job_history')
+    op.drop_table('tb_job_history')
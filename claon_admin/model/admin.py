@@ -54,7 +54,10 @@ class CenterResponseDto(BaseModel):
     proof_list: List[str]
 
     @classmethod
-    def from_entity(cls, center: Center, approved_files: List[CenterApprovedFile]):
+    def from_entity(cls, center: Center, approved_files: Optional[List[CenterApprovedFile]] = None):
+        if approved_files is None:
+            approved_files = center.approved_files
+
         return CenterResponseDto(
             user_profile=UserProfileResponseDto.from_entity(center.user),
             center_id=center.id,
@@ -120,7 +123,10 @@ class LectorResponseDto(BaseModel):
     proof_list: List[str]
 
     @classmethod
-    def from_entity(cls, lector: Lector, approved_files: List[LectorApprovedFile]):
+    def from_entity(cls, lector: Lector, approved_files: Optional[List[LectorApprovedFile]] = None):
+        if approved_files is None:
+            approved_files = lector.approved_files
+
         return LectorResponseDto(
             user_profile=UserProfileResponseDto.from_entity(lector.user),
             is_setter=lector.is_setter,
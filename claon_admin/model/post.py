@@ -1,9 +1,9 @@
 from datetime import timedelta, date
 from typing import List
 
-import pandas as pd
 from pydantic import BaseModel
 
+from claon_admin.common.util.series import DailySeries
 from claon_admin.common.util.time import get_relative_time, get_weekday
 from claon_admin.schema.center import Post, Center
 from claon_admin.schema.post import PostCountHistory
@@ -52,10 +52,24 @@ class PostSummaryResponseDto(BaseModel):
                     end_date: date,
                     count_total: int,
                     count_history_by_year: List[PostCountHistory]):
+        return cls.from_summary(center, cls.summarize(end_date, count_total, count_history_by_year))
+
+    @classmethod
+    def from_summary(cls, center: Center, summary: dict):
+        return PostSummaryResponseDto(
+            center_id=center.id,
+            center_name=center.name,
+            **summary
+        )
+
+    @staticmethod
+    def start_date_of(end_date: date):
+        return end_date - timedelta(days=52 * 7 + end_date.weekday())
+
+    @classmethod
+    def summarize(cls, end_date: date, count_total: int, count_history_by_year: List[PostCountHistory]):
         if not count_history_by_year:
-            return PostSummaryResponseDto(
-                center_id=center.id,
-                center_name=center.name,
+            return dict(
                 count_today=0,
                 count_week=0,
                 count_month=0,
@@ -64,59 +78,21 @@ class PostSummaryResponseDto(BaseModel):
                 count_per_week=[]
             )
 
-        count_by_month, count_by_week, count_by_day = cls.__count_history(end_date, count_history_by_year)
-        data_per_day, data_per_week = cls.__get_data_per_period(end_date, count_history_by_year)
+        series = DailySeries(count_history_by_year[0].reg_date,
+                             end_date,
+                             [(history.reg_date, history.count) for history in count_history_by_year])
 
-        return PostSummaryResponseDto(
-            center_id=center.id,
-            center_name=center.name,
-            count_today=sum([history.count for history in count_by_day]),
-            count_week=sum([history.count for history in count_by_week]),
-            count_month=sum([history.count for history in count_by_month]),
+        return dict(
+            count_today=series.sum_last_days(1),
+            count_week=series.sum_last_days(7),
+            count_month=series.sum_last_days(4 * 7),
             count_total=count_total,
-            count_per_day=[PostCount(unit=get_weekday(day), count=data_per_day[day])
-                           for day in data_per_day],
-            count_per_week=[PostCount(unit=week.strftime("%Y-%m-%d"), count=data_per_week[week])
-                            for week in data_per_week]
+            count_per_day=[dict(unit=get_weekday(day), count=count)
+                           for day, count in series.last_days(7)],
+            count_per_week=[dict(unit=week.strftime("%Y-%m-%d"), count=count)
+                            for week, count in series.complete_weeks()]
         )
 
-    @classmethod
-    def __count_history(cls, standard_date: date, history_list: List[PostCountHistory]):
-        count_by_month = list(filter(lambda x: standard_date - timedelta(days=4 * 7) <= x.reg_date < standard_date,
-                                     history_list))
-        count_by_week = list(filter(lambda x: standard_date - timedelta(days=7) <= x.reg_date < standard_date,
-                                    count_by_month))
-        count_by_day = list(filter(lambda x: standard_date - timedelta(days=1) <= x.reg_date < standard_date,
-                                   count_by_week))
-
-        return count_by_month, count_by_week, count_by_day
-
-    @classmethod
-    def __get_data_per_period(cls, end_date: date, history_list: List[PostCountHistory]):
-        start_date = history_list[0].reg_date
-
-        data = []
-        for history in history_list:
-            data.append({
-                'reg_date': history.reg_date,
-                'count': history.count
-            })
-
-        data_default = pd.DataFrame(pd.date_range(start_date, end_date - timedelta(days=1), freq="D"),
-                                    columns=["reg_date"]).fillna(0)
-        data_per_week = pd.DataFrame(data)
-        data_per_week.reg_date = data_per_week.reg_date.astype("datetime64[ns]")
-        data_per_week = pd.merge(data_default, data_per_week, on="reg_date", how="left").fillna(0).set_index("reg_date")
-        data_per_day = data_per_week.iloc[-7:].T.to_dict("records")[0]
-        data_per_week = data_per_week.resample("W")["count"].sum().to_frame()
-
-        if end_date.weekday() > 0:
-            data_per_week = data_per_week[0:-1]
-
-        data_per_week = data_per_week.T.to_dict("records")[0]
-
-        return data_per_day, data_per_week
-
 
 class PostCommentResponseDto(BaseModel):
     user_id: str
@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple
 from pydantic import BaseModel, validator
 
 from claon_admin.common.util.time import get_relative_time
-from claon_admin.schema.center import Review, ReviewAnswer
+from claon_admin.schema.center import Center, Review, ReviewAnswer
 
 
 class ReviewAnswerRequestDto(BaseModel):
@@ -72,3 +72,20 @@ class ReviewSummaryResponseDto(BaseModel):
     count_not_answered: int
     count_answered: int
     review_count_by_tag_list: List[ReviewTagDto]
+
+    @classmethod
+    def from_summary(cls, center: Center, summary: dict):
+        return ReviewSummaryResponseDto(
+            center_id=center.id,
+            center_name=center.name,
+            **summary
+        )
+
+    @staticmethod
+    def summarize(count_total: int, count_answered: int, count_by_tag: List[Tuple[str, int]]):
+        return dict(
+            count_total=count_total,
+            count_answered=count_answered,
+            count_not_answered=count_total - count_answered,
+            review_count_by_tag_list=[dict(tag=tag, count=count) for tag, count in count_by_tag]
+        )
@@ -1,11 +1,11 @@
-from typing import List
-
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
+from fastapi_pagination import Params
 from fastapi_utils.cbv import cbv
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.util.db import db
+from claon_admin.common.util.pagination import Pagination
 from claon_admin.config.auth import get_subject
 from claon_admin.container import Container
 from claon_admin.model.admin import LectorResponseDto, CenterResponseDto
@@ -22,11 +22,12 @@ class AdminRouter:
                  admin_service: AdminService = Depends(Provide[Container.admin_service])):
         self.admin_service = admin_service
 
-    @router.get("/lectors/approve", response_model=List[LectorResponseDto])
+    @router.get("/lectors/approve", response_model=Pagination[LectorResponseDto])
     async def find_approval_pending_lectors(self,
-                                            session: AsyncSession = Depends(db.get_db),
+                                            params: Params = Depends(),
+                                            session: AsyncSession = Depends(db.get_read_db),
                                             subject: RequestUser = Depends(get_subject)):
-        return await self.admin_service.get_unapproved_lectors(session, subject)
+        return await self.admin_service.get_unapproved_lectors(session, subject, params)
 
     @router.post('/lectors/{lector_id}/approve')
     async def approve_lector(self,
@@ -42,11 +43,12 @@ class AdminRouter:
                             subject: RequestUser = Depends(get_subject)):
         return await self.admin_service.reject_lector(session, subject, lector_id)
 
-    @router.get('/centers/approve', response_model=List[CenterResponseDto])
+    @router.get('/centers/approve', response_model=Pagination[CenterResponseDto])
     async def find_approval_pending_centers(self,
-                                            session: AsyncSession = Depends(db.get_db),
+                                            params: Params = Depends(),
+                                            session: AsyncSession = Depends(db.get_read_db),
                                             subject: RequestUser = Depends(get_subject)):
-        return await self.admin_service.get_unapproved_centers(session, subject)
+        return await self.admin_service.get_unapproved_centers(session, subject, params)
 
     @router.post('/centers/{center_id}/approve')
     async def approve_center(self,
@@ -8,7 +8,7 @@ from fastapi_utils.cbv import cbv
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.util.db import db
-from claon_admin.common.util.pagination import Pagination
+from claon_admin.common.util.pagination import Pagination, CursorPagination, CursorParams
 from claon_admin.config.auth import get_subject
 from claon_admin.container import Container
 from claon_admin.model.auth import RequestUser
@@ -34,7 +34,7 @@ class CenterRouter:
     @router.get('/name/{name}', response_model=List[CenterNameResponseDto])
     async def get_name(self,
                        name: str,
-                       session: AsyncSession = Depends(db.get_db)):
+                       session: AsyncSession = Depends(db.get_read_db)):
         return await self.center_service.find_centers_by_name(session=session, name=name)
 
     @router.get('/{center_id}', response_model=CenterResponseDto)
@@ -52,7 +52,7 @@ class CenterRouter:
 
     @router.get('/', response_model=Pagination[CenterBriefResponseDto])
     async def find_centers(self,
-                           session: AsyncSession = Depends(db.get_db),
+                           session: AsyncSession = Depends(db.get_read_db),
                            params: Params = Depends(),
                            subject: RequestUser = Depends(get_subject)):
         return await self.center_service.find_centers(session=session, params=params, subject=subject)
@@ -76,6 +76,32 @@ class CenterRouter:
                      session: AsyncSession = Depends(db.get_db)):
         pass
 
+    @router.get('/{center_id}/posts/summary', response_model=PostSummaryResponseDto)
+    async def find_posts_summary_by_center(self,
+                                           center_id: str,
+                                           session: AsyncSession = Depends(db.get_db),
+                                           subject: RequestUser = Depends(get_subject)):
+        return await self.center_service.find_posts_summary_by_center(session, subject, center_id)
+
+    @router.get('/{center_id}/posts/cursor', response_model=CursorPagination[PostBriefResponseDto])
+    async def find_posts_by_center_with_cursor(self,
+                                               center_id: str,
+                                               start: date,
+                                               end: date,
+                                               hold_id: Optional[str] = None,
+                                               params: CursorParams = Depends(),
+                                               session: AsyncSession = Depends(db.get_read_db),
+                                               subject: RequestUser = Depends(get_subject)):
+        return await self.center_service.find_posts_by_center_with_cursor(
+            session=session,
+            subject=subject,
+            params=params,
+            hold_id=hold_id,
+            center_id=center_id,
+            start=start,
+            end=end
+        )
+
     @router.get('/{center_id}/posts/{post_id}', response_model=PostResponseDto)
     async def find_post(self,
                         center_id: str,
@@ -97,7 +123,7 @@ class CenterRouter:
                                    end: date,
                                    hold_id: Optional[str] = None,
                                    params: Params = Depends(),
-                                   session: AsyncSession = Depends(db.get_db),
+                                   session: AsyncSession = Depends(db.get_read_db),
                                    subject: RequestUser = Depends(get_subject)):
         return await self.center_service.find_posts_by_center(
             session=session,
@@ -109,12 +135,26 @@ class CenterRouter:
             end=end
         )
 
-    @router.get('/{center_id}/posts/summary', response_model=PostSummaryResponseDto)
-    async def find_posts_summary_by_center(self,
-                                           center_id: str,
-                                           session: AsyncSession = Depends(db.get_db),
-                                           subject: RequestUser = Depends(get_subject)):
-        return await self.center_service.find_posts_summary_by_center(session, subject, center_id)
+    @router.get('/{center_id}/reviews/cursor', response_model=CursorPagination[ReviewBriefResponseDto])
+    async def find_reviews_by_center_with_cursor(self,
+                                                 center_id: str,
+                                                 start: date,
+                                                 end: date,
+                                                 tag: Optional[str] = None,
+                                                 is_answered: Optional[bool] = None,
+                                                 params: CursorParams = Depends(),
+                                                 session: AsyncSession = Depends(db.get_read_db),
+                                                 subject: RequestUser = Depends(get_subject)):
+        return await self.center_service.find_reviews_by_center_with_cursor(
+            session=session,
+            subject=subject,
+            params=params,
+            center_id=center_id,
+            start=start,
+            end=end,
+            tag=tag,
+            is_answered=is_answered
+        )
 
     @router.get('/{center_id}/reviews', response_model=Pagination[ReviewBriefResponseDto])
     async def find_reviews_by_center(self,
@@ -124,7 +164,7 @@ class CenterRouter:
                                      tag: Optional[str] = None,
                                      is_answered: Optional[bool] = None,
                                      params: Params = Depends(),
-                                     session: AsyncSession = Depends(db.get_db),
+                                     session: AsyncSession = Depends(db.get_read_db),
                                      subject: RequestUser = Depends(get_subject)):
         return await self.center_service.find_reviews_by_center(
             session=session,
@@ -140,8 +180,13 @@ class CenterRouter:
     @router.get('/{center_id}/reviews/summary', response_model=ReviewSummaryResponseDto)
     async def find_reviews_summary_by_center(self,
                                              center_id: str,
-                                             session: AsyncSession = Depends(db.get_db)):
-        pass
+                                             session: AsyncSession = Depends(db.get_read_db),
+                                             subject: RequestUser = Depends(get_subject)):
+        return await self.center_service.find_reviews_summary_by_center(
+            session=session,
+            subject=subject,
+            center_id=center_id
+        )
 
     @router.post('/{center_id}/reviews/{review_id}', response_model=ReviewAnswerResponseDto)
     async def create_review_answer(self,
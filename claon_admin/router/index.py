@@ -1,14 +1,24 @@
 import asyncio
+import functools
 from os import environ
 
-from fastapi import APIRouter, WebSocket, Request
-from starlette.templating import Jinja2Templates
+from fastapi import APIRouter, WebSocket, Request, Depends
 
+from claon_admin.common.enum import Role
+from claon_admin.common.error.exception import UnauthorizedException, ErrorCode
+from claon_admin.common.util.db import db
+from claon_admin.config.auth import get_subject
 from claon_admin.config.config import conf
+from claon_admin.model.auth import RequestUser
 
 router = APIRouter()
 
-templates = Jinja2Templates(directory=conf().HTML_DIR)
+
+@functools.lru_cache(maxsize=None)
+def get_templates():
+    from starlette.templating import Jinja2Templates  # pylint: disable=import-outside-toplevel
+
+    return Jinja2Templates(directory=conf().HTML_DIR)
 
 
 async def log_reader(log_file_name: str, n=5):
@@ -45,4 +55,15 @@ async def get(request: Request):
         "log_file": "info.log",
         "domain": "admin-server.claon.life" if environ.get("API_ENV") == "prod" else "localhost"
     }
-    return templates.TemplateResponse("log.html", {"request": request, "context": context})
+    return get_templates().TemplateResponse("log.html", {"request": request, "context": context})
+
+
+@router.get("/status/db-pool")
+async def get_db_pool_status(subject: RequestUser = Depends(get_subject)):
+    if subject.role != Role.ADMIN:
+        raise UnauthorizedException(
+            ErrorCode.NONE_ADMIN_ACCOUNT,
+            "어드민 권한이 없습니다."
+        )
+
+    return db.pool_status()
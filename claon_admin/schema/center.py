@@ -1,44 +1,59 @@
-import json
+import re
 from datetime import date
 from typing import List, Optional
 from uuid import uuid4
 
 from fastapi_pagination import Params
-from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import String, Column, ForeignKey, Boolean, select, exists, Integer, DateTime, Enum, delete, and_, \
-    desc, func, null
+    desc, func, null, Index, true, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship, selectinload, backref
 from sqlalchemy.dialects.postgresql import TEXT
 
 from claon_admin.common.enum import PeriodType, MembershipType
+from claon_admin.common.util.center_name import CENTER_NAME_SEARCH_LIMIT, evict_center_names_after_commit
 from claon_admin.common.util.db import Base
+from claon_admin.common.util.hangul import has_chosung, to_chosung_pattern
+from claon_admin.common.util.json_column import JsonArray, JsonValue, normalize
+from claon_admin.common.util.pagination import CursorParams, paginate_by_cursor, paginate, CountStrategy
+from claon_admin.common.util.review_summary import evict_review_summary_after_commit
+from claon_admin.common.util.sql import json_array_contains, json_array_values
 from claon_admin.schema.post import Post
 
 
-class OperatingTime:
+class OperatingTime(JsonValue):
+    __slots__ = ('day_of_week', 'start_time', 'end_time')
+
     def __init__(self, day_of_week: str, start_time: str, end_time: str):
         self.day_of_week = day_of_week
         self.start_time = start_time
         self.end_time = end_time
 
 
-class Utility:
+class Utility(JsonValue):
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name = name
 
 
-class CenterImage:
+class CenterImage(JsonValue):
+    __slots__ = ('url',)
+
     def __init__(self, url: str):
         self.url = url
 
 
-class CenterFeeImage:
+class CenterFeeImage(JsonValue):
+    __slots__ = ('url',)
+
     def __init__(self, url: str):
         self.url = url
 
 
-class ReviewTag:
+class ReviewTag(JsonValue):
+    __slots__ = ('word',)
+
     def __init__(self, word: str):
         self.word = word
 
@@ -56,65 +71,50 @@ class Center(Base):
     youtube_url = Column(String(length=500))
     approved = Column(Boolean, default=False, nullable=False)
 
-    _center_img = Column(TEXT)
-    _operating_time = Column(TEXT)
-    _utility = Column(TEXT)
-    _fee_img = Column(TEXT)
+    _center_img = Column(JsonArray(CenterImage))
+    _operating_time = Column(JsonArray(OperatingTime))
+    _utility = Column(JsonArray(Utility))
+    _fee_img = Column(JsonArray(CenterFeeImage))
 
     fees = relationship("CenterFee", back_populates="center", cascade="all, delete-orphan")
     holds = relationship("CenterHold", back_populates="center", cascade="all, delete-orphan")
     walls = relationship("CenterWall", back_populates="center", cascade="all, delete-orphan")
+    approved_files = relationship("CenterApprovedFile", back_populates="center", cascade="all,delete")
 
     user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="SET NULL"))
     user = relationship("User", backref=backref("Center"))
 
     @property
-    def center_img(self):
-        if self._center_img is None:
-            return []
-
-        values = json.loads(self._center_img)
-        return [CenterImage(value['url']) for value in values]
+    def center_img(self) -> List[CenterImage]:
+        return self._center_img or []
 
     @center_img.setter
     def center_img(self, values: List[CenterImage]):
-        self._center_img = json.dumps([value.__dict__ for value in values], default=str)
+        self._center_img = normalize(values)
 
     @property
-    def operating_time(self):
-        if self._operating_time is None:
-            return []
-
-        values = json.loads(self._operating_time)
-        return [OperatingTime(value['day_of_week'], value['start_time'], value['end_time']) for value in values]
+    def operating_time(self) -> List[OperatingTime]:
+        return self._operating_time or []
 
     @operating_time.setter
     def operating_time(self, values: List[OperatingTime]):
-        self._operating_time = json.dumps([value.__dict__ for value in values], default=str)
+        self._operating_time = normalize(values)
 
     @property
-    def utility(self):
-        if self._utility is None:
-            return []
-
-        values = json.loads(self._utility)
-        return [Utility(value['name']) for value in values]
+    def utility(self) -> List[Utility]:
+        return self._utility or []
 
     @utility.setter
     def utility(self, values: List[Utility]):
-        self._utility = json.dumps([value.__dict__ for value in values], default=str)
+        self._utility = normalize(values)
 
     @property
-    def fee_img(self):
-        if self._fee_img is None:
-            return []
-
-        data = json.loads(self._fee_img)
-        return [CenterFeeImage(e['url']) for e in data]
+    def fee_img(self) -> List[CenterFeeImage]:
+        return self._fee_img or []
 
     @fee_img.setter
     def fee_img(self, values: List[CenterFeeImage]):
-        self._fee_img = json.dumps([value.__dict__ for value in values], default=str)
+        self._fee_img = normalize(values)
 
 
 class CenterFee(Base):
@@ -160,15 +160,18 @@ class CenterApprovedFile(Base):
     user_id = Column(String(length=255), ForeignKey('tb_user.id', ondelete="CASCADE"), nullable=False)
     user = relationship("User", backref=backref("CenterApprovedFile", passive_deletes=True))
     center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False)
-    center = relationship("Center", backref=backref("CenterApprovedFile", cascade="all,delete"))
+    center = relationship("Center", back_populates="approved_files")
 
 
 class Review(Base):
     __tablename__ = "tb_review"
+    __table_args__ = (
+        Index("ix_review_center_id_created_at", "center_id", "created_at"),
+    )
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     content = Column(String(length=500), nullable=False)
     created_at = Column(DateTime, nullable=False)
-    _tag = Column(TEXT, nullable=False)
+    _tag = Column(JsonArray(ReviewTag), nullable=False)
     answer = relationship("ReviewAnswer", back_populates="review", uselist=False, cascade="all, delete-orphan")
 
     user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False)
@@ -177,16 +180,12 @@ class Review(Base):
     center = relationship("Center", backref=backref("Review"))
 
     @property
-    def tag(self):
-        if self._tag is None:
-            return []
-
-        values = json.loads(self._tag)
-        return [ReviewTag(value['word']) for value in values]
+    def tag(self) -> List[ReviewTag]:
+        return self._tag or []
 
     @tag.setter
     def tag(self, values: List[ReviewTag]):
-        self._tag = json.dumps([value.__dict__ for value in values], default=str)
+        self._tag = normalize(values)
 
 
 class ReviewAnswer(Base):
@@ -204,6 +203,7 @@ class CenterRepository:
     async def save(session: AsyncSession, center: Center):
         session.add(center)
         await session.merge(center)
+        evict_center_names_after_commit(session, center.name)
         return center
 
     @staticmethod
@@ -232,22 +232,38 @@ class CenterRepository:
 
     @staticmethod
     async def delete(session: AsyncSession, center: Center):
+        evict_center_names_after_commit(session, center.name)
         return await session.delete(center)
 
     @staticmethod
-    async def find_all_by_approved_false(session: AsyncSession):
-        result = await session.execute(select(Center).where(Center.approved.is_(False))
-                                       .options(selectinload(Center.user))
-                                       .options(selectinload(Center.holds))
-                                       .options(selectinload(Center.walls))
-                                       .options(selectinload(Center.fees)))
-        return result.scalars().all()
+    async def find_all_by_approved_false(session: AsyncSession, params: Params):
+        query = select(Center).where(Center.approved.is_(False)) \
+            .order_by(Center.id) \
+            .options(selectinload(Center.user)) \
+            .options(selectinload(Center.holds)) \
+            .options(selectinload(Center.walls)) \
+            .options(selectinload(Center.fees)) \
+            .options(selectinload(Center.approved_files))
+        return await paginate(query=query, conn=session, params=params)
 
     @staticmethod
-    async def find_by_name(session:AsyncSession, name: str):
+    async def find_by_name(session: AsyncSession, name: str):
+        # Ranked as in rank_center_name: exact match, then prefix match, then shorter names.
+        # ix_center_name_trgm serves the ILIKE search; the chosung classes such as [라-맇] yield no trigrams,
+        # so the regex mostly scans the unclaimed centers.
+        if has_chosung(name):
+            pattern = to_chosung_pattern(name)
+            condition = Center.name.regexp_match(pattern)
+            rank = case((Center.name.regexp_match("^" + pattern), 1), else_=2)
+        else:
+            escaped = re.sub(r"([\\%_])", r"\\\1", name)
+            condition = Center.name.ilike(f"%{escaped}%", escape="\\")
+            rank = case((Center.name == name, 0), (Center.name.ilike(f"{escaped}%", escape="\\"), 1), else_=2)
+
         result = await session.execute(select(Center)
-                                       .where(and_(Center.name.contains(name), Center.user_id == null()))
-                                       .limit(5))
+                                       .where(and_(condition, Center.user_id == null()))
+                                       .order_by(rank, func.length(Center.name), Center.name)
+                                       .limit(CENTER_NAME_SEARCH_LIMIT))
         return result.scalars().all()
 
     @staticmethod
@@ -346,30 +362,30 @@ class ReviewRepository:
     async def save(session: AsyncSession, review: Review):
         session.add(review)
         await session.merge(review)
+        evict_review_summary_after_commit(session, review.center_id or review.center.id)
         return review
 
     @staticmethod
-    async def find_reviews_by_center(session: AsyncSession,
-                                     params: Params,
-                                     center_id: str,
-                                     start: date,
-                                     end: date,
-                                     tag: Optional[str],
-                                     is_answered: Optional[bool]):
-        query = select(Review, func.count(Post.id)) \
-            .select_from(Review) \
-            .join(Post, and_(Review.user_id == Post.user_id, Review.center_id == Post.center_id)) \
+    def __reviews_by_center_query(center_id: str,
+                                  start: date,
+                                  end: date,
+                                  tag: Optional[str],
+                                  is_answered: Optional[bool]):
+        visit_count = select(func.count(Post.id)) \
+            .where(and_(Post.center_id == Review.center_id, Post.user_id == Review.user_id)) \
+            .correlate(Review) \
+            .scalar_subquery()
+
+        query = select(Review, visit_count) \
             .where(and_(Review.center_id == center_id,
                         Review.created_at >= start,
                         Review.created_at < end)) \
-            .group_by(Review.id) \
-            .order_by(desc(Review.created_at)) \
             .options(selectinload(Review.user)) \
             .options(selectinload(Review.center)) \
             .options(selectinload(Review.answer))
 
         if tag is not None:
-            query = query.where(Review._tag.like(f'%{{"word": "{tag}"%'))
+            query = query.where(json_array_contains(Review._tag, "word", tag))
 
         if is_answered is not None:
             if is_answered is False:
@@ -377,7 +393,32 @@ class ReviewRepository:
             else:
                 query = query.where(Review.answer != null())
 
-        return await paginate(query=query, conn=session, params=params)
+        return query
+
+    @staticmethod
+    async def find_reviews_by_center(session: AsyncSession,
+                                     params: Params,
+                                     center_id: str,
+                                     start: date,
+                                     end: date,
+                                     tag: Optional[str],
+                                     is_answered: Optional[bool]):
+        query = ReviewRepository.__reviews_by_center_query(center_id, start, end, tag, is_answered) \
+            .order_by(desc(Review.created_at))
+
+        return await paginate(query=query, conn=session, params=params, count_strategy=CountStrategy.CACHED)
+
+    @staticmethod
+    async def find_reviews_by_center_with_cursor(session: AsyncSession,
+                                                 params: CursorParams,
+                                                 center_id: str,
+                                                 start: date,
+                                                 end: date,
+                                                 tag: Optional[str],
+                                                 is_answered: Optional[bool]):
+        query = ReviewRepository.__reviews_by_center_query(center_id, start, end, tag, is_answered)
+
+        return await paginate_by_cursor(session, query, params, Review.created_at, Review.id)
 
     @staticmethod
     async def find_by_id_and_center_id(session: AsyncSession,
@@ -388,22 +429,63 @@ class ReviewRepository:
 
         return result.scalars().one_or_none()
 
+    @staticmethod
+    async def summarize_by_center(session: AsyncSession, center_id: str):
+        """ Review/answer counts and the tag histogram in one statement; the histogram needs its own GROUP BY. """
+        counts = select(func.count(Review.id).label("count_total"),
+                        func.count(ReviewAnswer.id).label("count_answered")) \
+            .select_from(Review) \
+            .outerjoin(ReviewAnswer, ReviewAnswer.review_id == Review.id) \
+            .where(Review.center_id == center_id) \
+            .subquery()
+
+        tags, word = json_array_values(session.bind.dialect.name, Review._tag, "word")
+        count_by_tag = select(word.label("tag"), func.count().label("tag_count")) \
+            .select_from(Review) \
+            .join(tags, true()) \
+            .where(Review.center_id == center_id) \
+            .group_by(word) \
+            .subquery()
+
+        result = await session.execute(select(counts.c.count_total, counts.c.count_answered,
+                                              count_by_tag.c.tag, count_by_tag.c.tag_count)
+                                       .select_from(counts)
+                                       .outerjoin(count_by_tag, true())
+                                       .order_by(desc(count_by_tag.c.tag_count), count_by_tag.c.tag))
+        rows = result.all()
+
+        count_total, count_answered = rows[0].count_total, rows[0].count_answered
+        return count_total, count_answered, [(row.tag, row.tag_count) for row in rows if row.tag is not None]
+
 
 class ReviewAnswerRepository:
+    @staticmethod
+    async def __evict_review_summary(session: AsyncSession, answer: ReviewAnswer):
+        if answer.review_id is None:
+            evict_review_summary_after_commit(session, answer.review.center_id)
+            return
+
+        review = await session.get(Review, answer.review_id)
+        if review is not None:
+            evict_review_summary_after_commit(session, review.center_id)
+
     @staticmethod
     async def save(session: AsyncSession, answer: ReviewAnswer):
         session.add(answer)
         await session.merge(answer)
+        await ReviewAnswerRepository.__evict_review_summary(session, answer)
         return answer
 
     @staticmethod
     async def update(session: AsyncSession, answer: ReviewAnswer, content: str):
         answer.content = content
         await session.merge(answer)
+        await ReviewAnswerRepository.__evict_review_summary(session, answer)
         return answer
 
     @staticmethod
     async def delete(session: AsyncSession, answer: ReviewAnswer):
+        await ReviewAnswerRepository.__evict_review_summary(session, answer)
         await session.delete(answer)
 
     @staticmethod
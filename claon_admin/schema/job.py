@@ -0,0 +1,40 @@
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy import Column, String, DateTime, Float, Integer, Boolean, Index, select, desc, and_
+from sqlalchemy.dialects.postgresql import TEXT
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.db import Base
+
+
+class JobHistory(Base):
+    __tablename__ = 'tb_job_history'
+    __table_args__ = (
+        Index("ix_job_history_job_name_started_at", "job_name", "started_at"),
+    )
+    id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
+    job_name = Column(String(length=100), nullable=False)
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=False)
+    duration = Column(Float, nullable=False)
+    row_count = Column(Integer)
+    succeeded = Column(Boolean, nullable=False)
+    error = Column(TEXT)
+
+
+class JobHistoryRepository:
+    @staticmethod
+    async def save(session: AsyncSession, history: JobHistory):
+        session.add(history)
+        await session.merge(history)
+        return history
+
+    @staticmethod
+    async def find_last_success_by_job_name(session: AsyncSession, job_name: str) -> Optional[JobHistory]:
+        result = await session.execute(select(JobHistory)
+                                       .where(and_(JobHistory.job_name == job_name,
+                                                   JobHistory.succeeded.is_(True)))
+                                       .order_by(desc(JobHistory.started_at))
+                                       .limit(1))
+        return result.scalars().first()
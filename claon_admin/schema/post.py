@@ -1,29 +1,38 @@
 import json
-from datetime import date
+from datetime import date, datetime
 from typing import List, Optional
 from uuid import uuid4
 
 from fastapi_pagination import Params
-from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import Column, String, DateTime, TEXT, ForeignKey, Integer, Enum, and_, select, desc, func, asc
+from sqlalchemy import Column, String, DateTime, TEXT, ForeignKey, Integer, Enum, and_, select, desc, func, asc, \
+    Index, Date, delete
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship, backref, selectinload
 
 from claon_admin.common.enum import WallType
 from claon_admin.common.util.db import Base
+from claon_admin.common.util.json_column import JsonArray, JsonValue, normalize
+from claon_admin.common.util.pagination import CursorParams, paginate_by_cursor, paginate, CountStrategy
 
 
-class PostImage:
+class PostImage(JsonValue):
+    __slots__ = ('url',)
+
     def __init__(self, url: str):
         self.url = url
 
 
 class Post(Base):
     __tablename__ = 'tb_post'
+    __table_args__ = (
+        Index("ix_post_center_id_created_at", "center_id", "created_at"),
+        Index("ix_post_center_id_user_id", "center_id", "user_id"),
+    )
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     content = Column(String(length=500), nullable=False)
     created_at = Column(DateTime, nullable=False)
-    _img = Column(TEXT, nullable=False)
+    _img = Column(JsonArray(PostImage), nullable=False)
     histories = relationship("ClimbingHistory", back_populates="post", cascade="all, delete-orphan")
 
     user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False)
@@ -32,20 +41,19 @@ class Post(Base):
     center = relationship("Center", backref=backref("Post"))
 
     @property
-    def img(self):
-        if self._img is None:
-            return []
-
-        values = json.loads(self._img)
-        return [PostImage(value['url']) for value in values]
+    def img(self) -> List[PostImage]:
+        return self._img or []
 
     @img.setter
     def img(self, values: List[PostImage]):
-        self._img = json.dumps([value.__dict__ for value in values], default=str)
+        self._img = normalize(values)
 
 
 class ClimbingHistory(Base):
     __tablename__ = 'tb_climbing_history'
+    __table_args__ = (
+        Index("ix_climbing_history_post_id_hold_id", "post_id", "hold_id"),
+    )
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     hold_id = Column(String(length=255), nullable=False)
     difficulty = Column(String(length=10), nullable=False)
@@ -59,12 +67,30 @@ class ClimbingHistory(Base):
 
 class PostCountHistory(Base):
     __tablename__ = 'tb_post_count_history'
+    __table_args__ = (
+        Index("ux_post_count_history_center_id_reg_date", "center_id", "reg_date", unique=True),
+    )
     id = Column(Integer, primary_key=True, index=True)
     center_id = Column(String(length=255), nullable=False)
     reg_date = Column(DateTime, nullable=False)
     count = Column(Integer, nullable=False)
 
 
+class PostSummary(Base):
+    __tablename__ = 'tb_post_summary'
+    center_id = Column(String(length=255), ForeignKey("tb_center.id", ondelete="CASCADE"), primary_key=True)
+    base_date = Column(Date, nullable=False)
+    _summary = Column(TEXT, nullable=False)
+
+    @property
+    def summary(self):
+        return json.loads(self._summary)
+
+    @summary.setter
+    def summary(self, value: dict):
+        self._summary = json.dumps(value, default=str)
+
+
 class PostRepository:
     @staticmethod
     async def save(session: AsyncSession, post: Post):
@@ -73,12 +99,7 @@ class PostRepository:
         return post
 
     @staticmethod
-    async def find_posts_by_center(session: AsyncSession,
-                                   params: Params,
-                                   center_id: str,
-                                   hold_id: Optional[str],
-                                   start: date,
-                                   end: date):
+    def __posts_by_center_query(center_id: str, hold_id: Optional[str], start: date, end: date):
         query = select(Post).where(and_(Post.center_id == center_id,
                                         Post.created_at >= start,
                                         Post.created_at < end))
@@ -88,9 +109,30 @@ class PostRepository:
                 .join(ClimbingHistory) \
                 .where(ClimbingHistory.hold_id == hold_id)
 
-        query = query.order_by(desc(Post.created_at)).options(selectinload(Post.user))
+        return query.options(selectinload(Post.user))
 
-        return await paginate(query=query, conn=session, params=params)
+    @staticmethod
+    async def find_posts_by_center(session: AsyncSession,
+                                   params: Params,
+                                   center_id: str,
+                                   hold_id: Optional[str],
+                                   start: date,
+                                   end: date):
+        query = PostRepository.__posts_by_center_query(center_id, hold_id, start, end) \
+            .order_by(desc(Post.created_at))
+
+        return await paginate(query=query, conn=session, params=params, count_strategy=CountStrategy.CACHED)
+
+    @staticmethod
+    async def find_posts_by_center_with_cursor(session: AsyncSession,
+                                               params: CursorParams,
+                                               center_id: str,
+                                               hold_id: Optional[str],
+                                               start: date,
+                                               end: date):
+        query = PostRepository.__posts_by_center_query(center_id, hold_id, start, end)
+
+        return await paginate_by_cursor(session, query, params, Post.created_at, Post.id)
 
     @staticmethod
     async def count_by_center_and_date(session: AsyncSession, center_ids: List[str], start: date, end: date):
@@ -123,6 +165,30 @@ class PostCountHistoryRepository:
         [await session.merge(history) for history in histories]
         return histories
 
+    @staticmethod
+    async def upsert_all(session: AsyncSession, histories: List[PostCountHistory], batch_size: int = 500):
+        insert = postgresql.insert if session.bind.dialect.name == "postgresql" else sqlite.insert
+
+        for i in range(0, len(histories), batch_size):
+            query = insert(PostCountHistory).values([
+                {"center_id": history.center_id, "reg_date": history.reg_date, "count": history.count}
+                for history in histories[i:i + batch_size]
+            ])
+            await session.execute(query.on_conflict_do_update(
+                index_elements=[PostCountHistory.center_id, PostCountHistory.reg_date],
+                set_={"count": query.excluded.count}
+            ))
+
+        return len(histories)
+
+    @staticmethod
+    async def find_last_reg_date(session: AsyncSession) -> Optional[date]:
+        result = await session.execute(select(func.max(PostCountHistory.reg_date)))
+        last_reg_date = result.scalar()
+        if isinstance(last_reg_date, datetime):
+            return last_reg_date.date()
+        return last_reg_date
+
     @staticmethod
     async def sum_count_by_center(session: AsyncSession, center_id: str):
         result = await session.execute(select(func.sum(PostCountHistory.count))
@@ -138,3 +204,30 @@ class PostCountHistoryRepository:
                                                    PostCountHistory.reg_date < end))
                                        .order_by(asc(PostCountHistory.reg_date)))
         return result.scalars().all()
+
+
+class PostSummaryRepository:
+    @staticmethod
+    async def find_by_center_and_base_date(session: AsyncSession, center_id: str, base_date: date):
+        result = await session.execute(select(PostSummary)
+                                       .where(and_(PostSummary.center_id == center_id,
+                                                   PostSummary.base_date == base_date)))
+        return result.scalars().one_or_none()
+
+    @staticmethod
+    async def save(session: AsyncSession, summary: PostSummary):
+        insert = postgresql.insert if session.bind.dialect.name == "postgresql" else sqlite.insert
+
+        query = insert(PostSummary).values(center_id=summary.center_id,
+                                           base_date=summary.base_date,
+                                           _summary=summary._summary)
+        await session.execute(query.on_conflict_do_update(
+            index_elements=[PostSummary.center_id],
+            set_={"base_date": query.excluded.base_date, "_summary": query.excluded["_summary"]}
+        ))
+
+        return summary
+
+    @staticmethod
+    async def delete_all(session: AsyncSession):
+        await session.execute(delete(PostSummary))
@@ -1,8 +1,8 @@
-import json
 from datetime import date
 from typing import List
 from uuid import uuid4
 
+from fastapi_pagination import Params
 from sqlalchemy import Column, String, Enum, Boolean, ForeignKey, select, exists, and_, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship, backref, selectinload
@@ -10,23 +10,32 @@ from sqlalchemy.dialects.postgresql import TEXT
 
 from claon_admin.common.enum import Role
 from claon_admin.common.util.db import Base
+from claon_admin.common.util.json_column import JsonArray, JsonValue, normalize
+from claon_admin.common.util.pagination import paginate
+from claon_admin.common.util.subject import evict_subject_after_commit
 
 
-class Contest:
+class Contest(JsonValue):
+    __slots__ = ('year', 'title', 'name')
+
     def __init__(self, year: int, title: str, name: str):
         self.year = year
         self.title = title
         self.name = name
 
 
-class Certificate:
+class Certificate(JsonValue):
+    __slots__ = ('acquisition_date', 'rate', 'name')
+
     def __init__(self, acquisition_date: date, rate: int, name: str):
         self.acquisition_date = acquisition_date
         self.rate = rate
         self.name = name
 
 
-class Career:
+class Career(JsonValue):
+    __slots__ = ('start_date', 'end_date', 'name')
+
     def __init__(self, start_date: date, end_date: date, name: str):
         self.start_date = start_date
         self.end_date = end_date
@@ -57,48 +66,37 @@ class Lector(Base):
     is_setter = Column(Boolean, default=False, nullable=False)
     approved = Column(Boolean, default=False, nullable=False)
 
-    _contest = Column(TEXT)
-    _certificate = Column(TEXT)
-    _career = Column(TEXT)
+    _contest = Column(JsonArray(Contest))
+    _certificate = Column(JsonArray(Certificate))
+    _career = Column(JsonArray(Career))
 
     user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), unique=True, nullable=False)
     user = relationship("User", backref=backref("Lector"))
+    approved_files = relationship("LectorApprovedFile", back_populates="lector", cascade="all,delete")
 
     @property
-    def contest(self):
-        if self._contest is None:
-            return []
-
-        values = json.loads(self._contest)
-        return [Contest(value['year'], value['title'], value['name']) for value in values]
+    def contest(self) -> List[Contest]:
+        return self._contest or []
 
     @contest.setter
     def contest(self, values: List[Contest]):
-        self._contest = json.dumps([value.__dict__ for value in values], default=str)
+        self._contest = normalize(values)
 
     @property
-    def certificate(self):
-        if self._certificate is None:
-            return []
-
-        values = json.loads(self._certificate)
-        return [Certificate(value['acquisition_date'], value['rate'], value['name']) for value in values]
+    def certificate(self) -> List[Certificate]:
+        return self._certificate or []
 
     @certificate.setter
     def certificate(self, values: List[Certificate]):
-        self._certificate = json.dumps([value.__dict__ for value in values], default=str)
+        self._certificate = normalize(values)
 
     @property
-    def career(self):
-        if self._career is None:
-            return []
-
-        values = json.loads(self._career)
-        return [Career(value['start_date'], value['end_date'], value['name']) for value in values]
+    def career(self) -> List[Career]:
+        return self._career or []
 
     @career.setter
     def career(self, values: List[Career]):
-        self._career = json.dumps([value.__dict__ for value in values], default=str)
+        self._career = normalize(values)
 
 
 class LectorApprovedFile(Base):
@@ -107,7 +105,7 @@ class LectorApprovedFile(Base):
     url = Column(String(length=255))
 
     lector_id = Column(String(length=255), ForeignKey('tb_lector.id', ondelete="CASCADE"), nullable=False)
-    lector = relationship("Lector", backref=backref("LectorApprovedFile", cascade="all,delete"))
+    lector = relationship("Lector", back_populates="approved_files")
 
 
 class UserRepository:
@@ -151,6 +149,7 @@ class UserRepository:
     async def update_role(session: AsyncSession, user: User, role: Role):
         user.role = role
         await session.merge(user)
+        evict_subject_after_commit(session, user.id)
         return user
 
 
@@ -182,14 +181,14 @@ class LectorRepository:
         return lector
 
     @staticmethod
-    async def find_all_by_approved_false(session: AsyncSession):
-        result = await session.execute(
-            select(Lector)
-            .where(Lector.approved.is_(False))
-            .options(selectinload(Lector.user))
-        )
+    async def find_all_by_approved_false(session: AsyncSession, params: Params):
+        query = select(Lector) \
+            .where(Lector.approved.is_(False)) \
+            .order_by(Lector.id) \
+            .options(selectinload(Lector.user)) \
+            .options(selectinload(Lector.approved_files))
 
-        return result.scalars().all()
+        return await paginate(query=query, conn=session, params=params)
 
 
 class LectorApprovedFileRepository:
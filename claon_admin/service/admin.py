@@ -1,7 +1,10 @@
+from fastapi_pagination import Params
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.error.exception import BadRequestException, ErrorCode, UnauthorizedException, NotFoundException
-from claon_admin.common.util.s3 import delete_file
+from claon_admin.common.util.pagination import PaginationFactory
+from claon_admin.common.util.s3 import delete_files_after_commit
+from claon_admin.common.util.subject import evict_subject_after_commit
 from claon_admin.model.auth import RequestUser
 from claon_admin.model.admin import CenterResponseDto, LectorResponseDto
 from claon_admin.common.enum import Role
@@ -15,12 +18,14 @@ class AdminService:
                  lector_repository: LectorRepository,
                  lector_approved_file_repository: LectorApprovedFileRepository,
                  center_repository: CenterRepository,
-                 center_approved_file_repository: CenterApprovedFileRepository):
+                 center_approved_file_repository: CenterApprovedFileRepository,
+                 pagination_factory: PaginationFactory):
         self.user_repository = user_repository
         self.lector_repository = lector_repository
         self.lector_approved_file_repository = lector_approved_file_repository
         self.center_repository = center_repository
         self.center_approved_file_repository = center_approved_file_repository
+        self.pagination_factory = pagination_factory
 
     async def approve_lector(self, session: AsyncSession, subject: RequestUser, lector_id: str):
         if subject.role != Role.ADMIN:
@@ -42,7 +47,7 @@ class AdminService:
 
         approved_files = await self.lector_approved_file_repository.find_all_by_lector_id(session, lector_id)
         await self.lector_approved_file_repository.delete_all_by_lector_id(session, lector_id)
-        [await delete_file(e.url) for e in approved_files]
+        delete_files_after_commit(session, [e.url for e in approved_files])
 
         return LectorResponseDto.from_entity(lector, approved_files)
 
@@ -62,8 +67,9 @@ class AdminService:
             )
 
         approved_files = await self.lector_approved_file_repository.find_all_by_lector_id(session, lector_id)
-        [await delete_file(e.url) for e in approved_files]
+        delete_files_after_commit(session, [e.url for e in approved_files])
 
+        evict_subject_after_commit(session, lector.user_id)
         return await self.lector_repository.delete(session, lector)
 
     async def approve_center(self, session: AsyncSession, subject: RequestUser, center_id: str):
@@ -91,7 +97,7 @@ class AdminService:
 
         approved_files = await self.center_approved_file_repository.find_all_by_center_id(session, center_id)
         await self.center_approved_file_repository.delete_all_by_center_id(session, center_id)
-        [await delete_file(e.url) for e in approved_files]
+        delete_files_after_commit(session, [e.url for e in approved_files])
 
         return CenterResponseDto.from_entity(center, approved_files)
 
@@ -111,31 +117,22 @@ class AdminService:
             )
 
         approved_files = await self.center_approved_file_repository.find_all_by_center_id(session, center_id)
-        [await delete_file(e.url) for e in approved_files]
+        delete_files_after_commit(session, [e.url for e in approved_files])
         await self.center_repository.delete(session, center)
 
-    async def get_unapproved_lectors(self, session: AsyncSession, subject: RequestUser):
+        if center.user_id is not None:
+            evict_subject_after_commit(session, center.user_id)
+
+    async def get_unapproved_lectors(self, session: AsyncSession, subject: RequestUser, params: Params):
         if subject.role != Role.ADMIN:
             raise UnauthorizedException(ErrorCode.NONE_ADMIN_ACCOUNT, "어드민 권한이 없습니다.")
 
-        lectors = await self.lector_repository.find_all_by_approved_false(session)
-        result = list()
-
-        for lector in lectors:
-            lector_approved_file = await self.lector_approved_file_repository.find_all_by_lector_id(session, lector.id)
-            result.append(LectorResponseDto.from_entity(lector, lector_approved_file))
-
-        return result
+        pages = await self.lector_repository.find_all_by_approved_false(session, params)
+        return await self.pagination_factory.create(LectorResponseDto, pages)
 
-    async def get_unapproved_centers(self, session: AsyncSession, subject: RequestUser):
+    async def get_unapproved_centers(self, session: AsyncSession, subject: RequestUser, params: Params):
         if subject.role != Role.ADMIN:
             raise UnauthorizedException(ErrorCode.NONE_ADMIN_ACCOUNT, "어드민 권한이 없습니다.")
 
-        centers = await self.center_repository.find_all_by_approved_false(session)
-        result = list()
-
-        for center in centers:
-            center_approved_file = await self.center_approved_file_repository.find_all_by_center_id(session, center.id)
-            result.append(CenterResponseDto.from_entity(center, center_approved_file))
-
-        return result
+        pages = await self.center_repository.find_all_by_approved_false(session, params)
+        return await self.pagination_factory.create(CenterResponseDto, pages)
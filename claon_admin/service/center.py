@@ -1,4 +1,4 @@
-from datetime import date, timedelta
+from datetime import date
 from typing import Optional
 
 from fastapi import UploadFile
@@ -7,16 +7,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.enum import CenterUploadPurpose, Role
 from claon_admin.common.error.exception import BadRequestException, ErrorCode, UnauthorizedException, NotFoundException
-from claon_admin.common.util.pagination import PaginationFactory
+from claon_admin.common.util.center_name import find_center_names, normalize_center_name, save_center_names
+from claon_admin.common.util.pagination import PaginationFactory, CursorParams
+from claon_admin.common.util.review_summary import find_review_summary, save_review_summary
 from claon_admin.common.util.s3 import upload_file
 from claon_admin.common.util.time import now
 from claon_admin.model.auth import RequestUser
 from claon_admin.model.file import UploadFileResponseDto
 from claon_admin.model.post import PostBriefResponseDto, PostSummaryResponseDto
-from claon_admin.model.review import ReviewBriefResponseDto, ReviewAnswerRequestDto, ReviewAnswerResponseDto
+from claon_admin.model.review import ReviewBriefResponseDto, ReviewAnswerRequestDto, ReviewAnswerResponseDto, \
+    ReviewSummaryResponseDto
 from claon_admin.model.center import CenterNameResponseDto, CenterBriefResponseDto
-from claon_admin.schema.center import CenterRepository, ReviewRepository, ReviewAnswerRepository, ReviewAnswer
-from claon_admin.schema.post import PostRepository, PostCountHistoryRepository
+from claon_admin.schema.center import CenterRepository, ReviewRepository, ReviewAnswerRepository, ReviewAnswer, Center
+from claon_admin.schema.post import PostRepository, PostCountHistoryRepository, PostSummaryRepository, PostSummary
 
 
 class CenterService:
@@ -24,24 +27,19 @@ class CenterService:
                  center_repository: CenterRepository,
                  post_repository: PostRepository,
                  post_count_history_repository: PostCountHistoryRepository,
+                 post_summary_repository: PostSummaryRepository,
                  review_repository: ReviewRepository,
                  review_answer_repository: ReviewAnswerRepository,
                  pagination_factory: PaginationFactory):
         self.center_repository = center_repository
         self.post_repository = post_repository
         self.post_count_history_repository = post_count_history_repository
+        self.post_summary_repository = post_summary_repository
         self.review_repository = review_repository
         self.review_answer_repository = review_answer_repository
         self.pagination_factory = pagination_factory
 
-    async def find_posts_by_center(self,
-                                   session: AsyncSession,
-                                   subject: RequestUser,
-                                   params: Params,
-                                   center_id: str,
-                                   hold_id: Optional[str],
-                                   start: date,
-                                   end: date):
+    async def __find_center_of_admin(self, session: AsyncSession, subject: RequestUser, center_id: str):
         center = await self.center_repository.find_by_id(session, center_id)
         if center is None:
             raise NotFoundException(
@@ -55,6 +53,10 @@ class CenterService:
                 "암장 관리자가 아닙니다."
             )
 
+        return center
+
+    @staticmethod
+    def __validate_hold(center: Center, hold_id: Optional[str]):
         if hold_id is not None:
             hold_ids = [h.id for h in center.holds]
             if hold_id not in hold_ids:
@@ -63,6 +65,25 @@ class CenterService:
                     "해당 홀드가 암장에 존재하지 않습니다."
                 )
 
+    @staticmethod
+    def __validate_date_range(start: date, end: date):
+        if (end - start).days > 365 or (end - start).days < 0:
+            raise BadRequestException(
+                ErrorCode.WRONG_DATE_RANGE,
+                "잘못된 날짜 범위입니다."
+            )
+
+    async def find_posts_by_center(self,
+                                   session: AsyncSession,
+                                   subject: RequestUser,
+                                   params: Params,
+                                   center_id: str,
+                                   hold_id: Optional[str],
+                                   start: date,
+                                   end: date):
+        center = await self.__find_center_of_admin(session, subject, center_id)
+        self.__validate_hold(center, hold_id)
+
         pages = await self.post_repository.find_posts_by_center(
             session=session,
             params=params,
@@ -74,6 +95,28 @@ class CenterService:
 
         return await self.pagination_factory.create(PostBriefResponseDto, pages)
 
+    async def find_posts_by_center_with_cursor(self,
+                                               session: AsyncSession,
+                                               subject: RequestUser,
+                                               params: CursorParams,
+                                               center_id: str,
+                                               hold_id: Optional[str],
+                                               start: date,
+                                               end: date):
+        center = await self.__find_center_of_admin(session, subject, center_id)
+        self.__validate_hold(center, hold_id)
+
+        page = await self.post_repository.find_posts_by_center_with_cursor(
+            session=session,
+            params=params,
+            center_id=center_id,
+            hold_id=hold_id,
+            start=start,
+            end=end
+        )
+
+        return await self.pagination_factory.create_by_cursor(PostBriefResponseDto, page)
+
     async def find_reviews_by_center(self,
                                      session: AsyncSession,
                                      subject: RequestUser,
@@ -83,24 +126,8 @@ class CenterService:
                                      end: date,
                                      tag: Optional[str],
                                      is_answered: Optional[bool]):
-        center = await self.center_repository.find_by_id(session, center_id)
-        if center is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "해당 암장이 존재하지 않습니다."
-            )
-
-        if center.user.id != subject.id:
-            raise UnauthorizedException(
-                ErrorCode.NOT_ACCESSIBLE,
-                "암장 관리자가 아닙니다."
-            )
-
-        if (end - start).days > 365 or (end - start).days < 0:
-            raise BadRequestException(
-                ErrorCode.WRONG_DATE_RANGE,
-                "잘못된 날짜 범위입니다."
-            )
+        await self.__find_center_of_admin(session, subject, center_id)
+        self.__validate_date_range(start, end)
 
         pages = await self.review_repository.find_reviews_by_center(
             session=session,
@@ -114,6 +141,30 @@ class CenterService:
 
         return await self.pagination_factory.create(ReviewBriefResponseDto, pages)
 
+    async def find_reviews_by_center_with_cursor(self,
+                                                 session: AsyncSession,
+                                                 subject: RequestUser,
+                                                 params: CursorParams,
+                                                 center_id: str,
+                                                 start: date,
+                                                 end: date,
+                                                 tag: Optional[str],
+                                                 is_answered: Optional[bool]):
+        await self.__find_center_of_admin(session, subject, center_id)
+        self.__validate_date_range(start, end)
+
+        page = await self.review_repository.find_reviews_by_center_with_cursor(
+            session=session,
+            params=params,
+            center_id=center_id,
+            start=start,
+            end=end,
+            tag=tag,
+            is_answered=is_answered
+        )
+
+        return await self.pagination_factory.create_by_cursor(ReviewBriefResponseDto, page)
+
     async def create_review_answer(self,
                                    session: AsyncSession,
                                    subject: RequestUser,
@@ -241,41 +292,58 @@ class CenterService:
     async def find_centers_by_name(self,
                                    session: AsyncSession,
                                    name: str):
-        centers = await self.center_repository.find_by_name(session, name)
-        return [CenterNameResponseDto.from_entity(center) for center in centers]
+        name = normalize_center_name(name)
+        if not name:
+            return []
+
+        centers = find_center_names(name)
+        if centers is None:
+            centers = [CenterNameResponseDto.from_entity(center).dict()
+                       for center in await self.center_repository.find_by_name(session, name)]
+            save_center_names(name, centers)
+
+        return [CenterNameResponseDto(**center) for center in centers]
 
     async def find_posts_summary_by_center(self,
                                            session: AsyncSession,
                                            subject: RequestUser,
                                            center_id: str):
-        center = await self.center_repository.find_by_id(session, center_id)
-        if center is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "해당 암장이 존재하지 않습니다."
+        center = await self.__find_center_of_admin(session, subject, center_id)
+
+        base_date = now().date()
+        summary = await self.post_summary_repository.find_by_center_and_base_date(session, center.id, base_date)
+        if summary is None:
+            total_count = await self.post_count_history_repository.sum_count_by_center(session, center.id)
+            count_history_by_year = await self.post_count_history_repository.find_by_center_and_date(
+                session,
+                center.id,
+                PostSummaryResponseDto.start_date_of(base_date),
+                base_date
             )
 
-        if center.user.id != subject.id:
-            raise UnauthorizedException(
-                ErrorCode.NOT_ACCESSIBLE,
-                "암장 관리자가 아닙니다."
-            )
+            summary = await self.post_summary_repository.save(session, PostSummary(
+                center_id=center.id,
+                base_date=base_date,
+                summary=PostSummaryResponseDto.summarize(base_date, total_count, count_history_by_year)
+            ))
 
-        total_count = await self.post_count_history_repository.sum_count_by_center(session, center.id)
+        return PostSummaryResponseDto.from_summary(center, summary.summary)
 
-        end_date = now().date()
-        start_date = end_date - timedelta(days=52 * 7 + end_date.weekday())
-        count_history_by_year = await self.post_count_history_repository.find_by_center_and_date(session,
-                                                                                                 center.id,
-                                                                                                 start_date,
-                                                                                                 end_date)
+    async def find_reviews_summary_by_center(self,
+                                             session: AsyncSession,
+                                             subject: RequestUser,
+                                             center_id: str):
+        center = await self.__find_center_of_admin(session, subject, center_id)
 
-        return PostSummaryResponseDto.from_entity(
-            center,
-            end_date,
-            total_count,
-            count_history_by_year
-        )
+        summary = await find_review_summary(center.id)
+        if summary is None:
+            count_total, count_answered, count_by_tag = \
+                await self.review_repository.summarize_by_center(session, center.id)
+
+            summary = ReviewSummaryResponseDto.summarize(count_total, count_answered, count_by_tag)
+            await save_review_summary(center.id, summary)
+
+        return ReviewSummaryResponseDto.from_summary(center, summary)
 
     async def find_centers(self,
                            session: AsyncSession,
@@ -161,7 +161,7 @@ class UserService:
 
         return JwtResponseDto(
             access_token=create_access_token(user.id),
-            refresh_token=create_refresh_token(user.id),
+            refresh_token=await create_refresh_token(user.id),
             is_signed_up=user.is_signed_up(),
             profile=UserProfileResponseDto.from_entity(user)
         )
@@ -206,7 +206,7 @@ class UserService:
 
         return JwtResponseDto(
             access_token=create_access_token(user.id),
-            refresh_token=create_refresh_token(user.id),
+            refresh_token=await create_refresh_token(user.id),
             is_signed_up=is_signed_up,
             profile=UserProfileResponseDto.from_entity(user)
         )
@@ -6,6 +6,30 @@ import pytest
 nest_asyncio.apply()
 
 
+class FakeRedisClient:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def get_connection(self):
+        return self.connection
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     yield asyncio.get_event_loop()
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    from claon_admin.common.util.pagination import count_cache  # pylint: disable=import-outside-toplevel
+
+    count_cache.clear()
+    yield
+    count_cache.clear()
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+
+    return FakeRedisClient(fakeredis.FakeAsyncRedis(decode_responses=True))
@@ -0,0 +1,16 @@
+import pytest
+from sqlalchemy import delete
+
+from claon_admin.schema.job import JobHistory
+
+
+@pytest.fixture
+async def db():
+    from claon_admin.common.util.db import db  # pylint: disable=import-outside-toplevel
+
+    await db.create_database()
+    yield db
+
+    async with db.async_session_maker() as session:
+        await session.execute(delete(JobHistory))
+        await session.commit()
@@ -0,0 +1,81 @@
+import pytest
+
+from claon_admin.job.lock import JobLock, LocalJobLock, RedisJobLock, JOB_LOCK_KEY_PREFIX
+
+
+@pytest.fixture
+def redis_job_lock(redis_client):
+    pytest.importorskip("lupa")
+
+    return RedisJobLock(redis_client)
+
+
+@pytest.mark.describe("Test case for job lock")
+class TestJobLock(object):
+    @pytest.mark.it("Fail case: lock without acquire and release cannot be created")
+    def test_incomplete_job_lock(self):
+        # given
+        class IncompleteJobLock(JobLock):
+            async def acquire(self, name: str, ttl: int):
+                return None
+
+        with pytest.raises(TypeError):
+            # when
+            IncompleteJobLock()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: local lock is held until released")
+    async def test_local_job_lock(self):
+        # given
+        job_lock = LocalJobLock()
+        token = await job_lock.acquire("job", 60)
+
+        # when
+        held = await job_lock.acquire("job", 60)
+        await job_lock.release("job", token)
+
+        # then
+        assert token is not None
+        assert held is None
+        assert await job_lock.acquire("job", 60) is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: local lock is not released with another token")
+    async def test_local_job_lock_release_with_other_token(self):
+        # given
+        job_lock = LocalJobLock()
+        await job_lock.acquire("job", 60)
+
+        # when
+        await job_lock.release("job", "other token")
+
+        # then
+        assert await job_lock.acquire("job", 60) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: redis lock is held until released")
+    async def test_redis_job_lock(self, redis_job_lock: RedisJobLock):
+        # given
+        token = await redis_job_lock.acquire("job", 60)
+
+        # when
+        held = await redis_job_lock.acquire("job", 60)
+        await redis_job_lock.release("job", token)
+
+        # then
+        assert token is not None
+        assert held is None
+        assert await redis_job_lock.acquire("job", 60) is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: redis lock only deletes its own token")
+    async def test_redis_job_lock_release_with_other_token(self, redis_job_lock: RedisJobLock):
+        # given
+        token = await redis_job_lock.acquire("job", 60)
+
+        # when
+        await redis_job_lock.release("job", "other token")
+
+        # then
+        assert await redis_job_lock.client.get_connection().get(JOB_LOCK_KEY_PREFIX + "job") == token
+        assert await redis_job_lock.acquire("job", 60) is None
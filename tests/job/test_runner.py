@@ -0,0 +1,74 @@
+from unittest.mock import patch, AsyncMock
+
+import pytest
+from sqlalchemy import select
+
+from claon_admin.job.lock import LocalJobLock
+from claon_admin.job.runner import run_job
+from claon_admin.schema.job import JobHistory
+
+
+async def find_histories(db, job_name: str):
+    async with db.async_session_maker() as session:
+        result = await session.execute(select(JobHistory).where(JobHistory.job_name == job_name))
+        return result.scalars().all()
+
+
+@pytest.mark.describe("Test case for job runner")
+class TestRunJob(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: run is recorded and the lock is kept")
+    async def test_run_job(self, db):
+        # given
+        job_lock = LocalJobLock()
+        job = AsyncMock(return_value=10)
+
+        with patch("claon_admin.job.runner.job_lock", job_lock):
+            # when
+            result = await run_job("test_run_job", job)
+
+        # then
+        assert result == 10
+        job.assert_awaited_once()
+        assert await job_lock.acquire("test_run_job", 60) is None
+        histories = await find_histories(db, "test_run_job")
+        assert len(histories) == 1
+        assert histories[0].succeeded
+        assert histories[0].row_count == 10
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: job is skipped while the lock is held")
+    async def test_run_job_with_held_lock(self, db):
+        # given
+        job_lock = LocalJobLock()
+        await job_lock.acquire("test_run_job_with_held_lock", 60)
+        job = AsyncMock(return_value=10)
+
+        with patch("claon_admin.job.runner.job_lock", job_lock):
+            # when
+            result = await run_job("test_run_job_with_held_lock", job)
+
+        # then
+        assert result is None
+        job.assert_not_awaited()
+        assert await find_histories(db, "test_run_job_with_held_lock") == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: failed run is recorded and the lock is released")
+    async def test_run_job_with_error(self, db):
+        # given
+        job_lock = LocalJobLock()
+        job = AsyncMock(side_effect=RuntimeError("failed"))
+
+        with patch("claon_admin.job.runner.job_lock", job_lock):
+            # when
+            result = await run_job("test_run_job_with_error", job)
+
+        # then
+        assert result is None
+        assert await job_lock.acquire("test_run_job_with_error", 60) is not None
+        histories = await find_histories(db, "test_run_job_with_error")
+        assert len(histories) == 1
+        assert not histories[0].succeeded
+        assert histories[0].row_count is None
+        assert histories[0].error == "RuntimeError('failed')"
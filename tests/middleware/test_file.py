@@ -0,0 +1,98 @@
+import httpx
+import pytest
+from fastapi import FastAPI, UploadFile
+
+from claon_admin.middleware.file import LimitUploadSize
+
+MULTIPART = "multipart/form-data; boundary=boundary"
+
+
+def multipart_body(size: int) -> bytes:
+    return b"--boundary\r\n" \
+           b'Content-Disposition: form-data; name="file"; filename="test.png"\r\n' \
+           b"Content-Type: image/png\r\n\r\n" + b"x" * size + b"\r\n--boundary--\r\n"
+
+
+async def chunked(body: bytes, chunk_size: int = 1024):
+    for offset in range(0, len(body), chunk_size):
+        yield body[offset:offset + chunk_size]
+
+
+def create_client(**kwargs):
+    app = FastAPI()
+
+    @app.post("/api/v1/centers/{purpose}/file")
+    async def upload(purpose: str, file: UploadFile):
+        return {"purpose": purpose, "size": len(await file.read())}
+
+    @app.post("/echo")
+    async def echo(body: dict):
+        return body
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=LimitUploadSize(app, **kwargs)),
+                             base_url="http://test")
+
+
+@pytest.mark.describe('Test case for upload size limit middleware')
+class TestLimitUploadSize(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it('Upload within the limit is passed through')
+    async def test_upload_within_limit(self):
+        async with create_client(max_size=10_000) as client:
+            # when
+            response = await client.post("/api/v1/centers/image/file", content=multipart_body(5_000),
+                                         headers={"content-type": MULTIPART})
+
+        # then
+        assert response.status_code == 200
+        assert response.json() == {"purpose": "image", "size": 5_000}
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Declared content length over the limit is rejected before reading the body')
+    async def test_upload_with_large_content_length(self):
+        async with create_client(max_size=10_000) as client:
+            # when
+            response = await client.post("/api/v1/centers/image/file", content=multipart_body(20_000),
+                                         headers={"content-type": MULTIPART})
+
+        # then
+        assert response.status_code == 413
+        assert response.json()["code"] == 41300
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Chunked upload is counted while it streams')
+    async def test_chunked_upload(self):
+        async with create_client(max_size=10_000) as client:
+            # when
+            accepted = await client.post("/api/v1/centers/image/file", content=chunked(multipart_body(5_000)),
+                                         headers={"content-type": MULTIPART})
+            rejected = await client.post("/api/v1/centers/image/file", content=chunked(multipart_body(20_000)),
+                                         headers={"content-type": MULTIPART})
+
+        # then
+        assert accepted.status_code == 200
+        assert rejected.status_code == 413
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Limit follows the upload purpose')
+    async def test_upload_with_purpose_limit(self):
+        async with create_client(max_size=10_000, max_sizes={"center.proof": 30_000}) as client:
+            # when
+            proof = await client.post("/api/v1/centers/proof/file", content=chunked(multipart_body(20_000)),
+                                      headers={"content-type": MULTIPART})
+            image = await client.post("/api/v1/centers/image/file", content=chunked(multipart_body(20_000)),
+                                      headers={"content-type": MULTIPART})
+
+        # then
+        assert proof.status_code == 200
+        assert image.status_code == 413
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Non multipart request is not limited')
+    async def test_json_request(self):
+        async with create_client(max_size=10) as client:
+            # when
+            response = await client.post("/echo", json={"content": "x" * 100})
+
+        # then
+        assert response.status_code == 200
@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from claon_admin.middleware.log import LoggerMiddleware, BodyTee
+
+
+async def echo(request: Request):
+    body = await request.json()
+    return JSONResponse(body, status_code=body.get("status", 200))
+
+
+async def stream(request: Request):
+    async def chunks():
+        for _ in range(10):
+            yield b"x" * 100
+
+    return StreamingResponse(chunks())
+
+
+def create_client(**kwargs):
+    app = LoggerMiddleware(Starlette(routes=[Route("/echo", echo, methods=["POST"]), Route("/stream", stream)]),
+                           **kwargs)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def logged(mock_logger, kind: str):
+    return [call.args[2:] for call in mock_logger.info.call_args_list if call.args[0].endswith(kind)]
+
+
+@pytest.mark.describe('Test case for logger middleware')
+class TestLoggerMiddleware(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it('Bodies of sampled requests are logged')
+    async def test_log_body(self):
+        with patch("claon_admin.middleware.log.logger") as mock_logger:
+            async with create_client(max_body_size=1024, sample_rate=1.0) as client:
+                # when
+                response = await client.post("/echo", content=b'{"name":"claon"}',
+                                             headers={"content-type": "application/json"})
+
+        # then
+        assert response.json() == {"name": "claon"}
+        assert logged(mock_logger, "status_code: %d") == [(200,)]
+        assert [str(body) for body, in logged(mock_logger, "[REQUEST] body: %s")] == ['{"name":"claon"}']
+        assert [str(body) for body, in logged(mock_logger, "[RESPONSE] body: %s")] == ['{"name":"claon"}']
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Bodies are logged only on errors when the request is not sampled')
+    async def test_log_body_on_error(self):
+        with patch("claon_admin.middleware.log.logger") as mock_logger:
+            async with create_client(max_body_size=1024, sample_rate=0.0) as client:
+                # when
+                await client.post("/echo", content=b'{"status":200}', headers={"content-type": "application/json"})
+                await client.post("/echo", content=b'{"status":400}', headers={"content-type": "application/json"})
+
+        # then
+        assert logged(mock_logger, "status_code: %d") == [(200,), (400,)]
+        assert [str(body) for body, in logged(mock_logger, "[RESPONSE] body: %s")] == ['{"status":400}']
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Streamed response is passed through and its log is truncated')
+    async def test_log_streaming_body(self):
+        with patch("claon_admin.middleware.log.logger") as mock_logger:
+            async with create_client(max_body_size=10, sample_rate=1.0) as client:
+                # when
+                response = await client.get("/stream")
+
+        # then
+        assert response.content == b"x" * 1000
+        assert [str(body) for body, in logged(mock_logger, "[RESPONSE] body: %s")] == \
+               ["xxxxxxxxxx... (truncated, 1000 bytes)"]
+
+    @pytest.mark.it('Tee keeps at most max size bytes')
+    def test_body_tee(self):
+        # given
+        tee = BodyTee(5)
+
+        # when
+        tee.write(b"abc")
+        tee.write(b"defg")
+
+        # then
+        assert tee.head == b"abcde"
+        assert tee.size == 7
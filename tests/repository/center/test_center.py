@@ -2,7 +2,7 @@ import pytest
 from fastapi_pagination import Params, Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from claon_admin.schema.center import Center
+from claon_admin.schema.center import Center, CenterApprovedFile
 from claon_admin.schema.user import User
 from tests.repository.center.conftest import center_repository, center_hold_repository, center_wall_repository, \
     center_fee_repository, center_approved_file_repository
@@ -155,16 +155,20 @@ class TestCenterRepository(object):
     async def test_find_all_center_by_approved_false(
             self,
             session: AsyncSession,
-            center_fixture: Center
+            center_fixture: Center,
+            center_approved_file_fixture: CenterApprovedFile
     ):
         # given
         center_fixture.approved = False
+        params = Params(page=1, size=10)
 
         # when
-        result = await center_repository.find_all_by_approved_false(session)
+        pages: Page[Center] = await center_repository.find_all_by_approved_false(session, params)
 
         # then
-        assert result == [center_fixture]
+        assert pages.items == [center_fixture]
+        assert pages.total == 1
+        assert pages.items[0].approved_files == [center_approved_file_fixture]
 
     @pytest.mark.asyncio
     async def test_find_centers_by_name(
@@ -179,6 +183,54 @@ class TestCenterRepository(object):
         # then
         assert result == [another_center_fixture]
 
+    @pytest.mark.asyncio
+    async def test_find_centers_by_name_ranked(
+            self,
+            session: AsyncSession,
+            another_center_fixture: Center
+    ):
+        # given
+        prefix_center = await center_repository.save(session, Center(
+            name="test climbing gym",
+            profile_img="https://prefix.test.profile.png",
+            address="prefix_test_address",
+            tel="010-1234-5678",
+            approved=True
+        ))
+        exact_center = await center_repository.save(session, Center(
+            name="Test",
+            profile_img="https://exact.test.profile.png",
+            address="exact_test_address",
+            tel="010-1234-5678",
+            approved=True
+        ))
+
+        # when
+        result = await center_repository.find_by_name(session, "Test")
+
+        # then
+        assert result == [exact_center, prefix_center, another_center_fixture]
+
+    @pytest.mark.asyncio
+    async def test_find_centers_by_chosung(
+            self,
+            session: AsyncSession
+    ):
+        # given
+        center = await center_repository.save(session, Center(
+            name="더클라임 강남",
+            profile_img="https://chosung.test.profile.png",
+            address="chosung_test_address",
+            tel="010-1234-5678",
+            approved=True
+        ))
+
+        # then
+        assert await center_repository.find_by_name(session, "ㅋㄹㅇ") == [center]
+        assert await center_repository.find_by_name(session, "클라ㅇ") == [center]
+        assert await center_repository.find_by_name(session, "ㄱㄴ") == [center]
+        assert await center_repository.find_by_name(session, "ㅋㄹㅁ") == []
+
     @pytest.mark.asyncio
     async def test_find_centers(
             self,
@@ -4,6 +4,9 @@ import pytest
 from fastapi_pagination import Params, Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from claon_admin.common.util.pagination import CursorParams, CursorPage
+from claon_admin.common.util.db import AFTER_COMMIT_CALLBACKS
+from claon_admin.common.util.review_summary import find_review_summary, save_review_summary
 from claon_admin.schema.center import Center, Review, ReviewAnswer, Post
 from claon_admin.schema.user import User
 from tests.repository.center.conftest import review_repository, review_answer_repository
@@ -48,6 +51,47 @@ class TestReviewRepository(object):
             is_answered=None
         ) == Page.create(items=[(review_fixture, 1)], params=params, total=1)
 
+    @pytest.mark.asyncio
+    async def test_find_reviews_by_center_without_visit(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_fixture: Review
+    ):
+        # given
+        params = Params(page=1, size=10)
+
+        # then
+        assert await review_repository.find_reviews_by_center(
+            session=session,
+            params=params,
+            center_id=center_fixture.id,
+            start=datetime(2022, 3, 1),
+            end=datetime(2023, 2, 28),
+            tag=None,
+            is_answered=None
+        ) == Page.create(items=[(review_fixture, 0)], params=params, total=1)
+
+    @pytest.mark.asyncio
+    async def test_find_reviews_by_center_with_cursor(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_fixture: Review,
+            post_fixture: Post,
+            review_answer_fixture: ReviewAnswer
+    ):
+        # then
+        assert await review_repository.find_reviews_by_center_with_cursor(
+            session=session,
+            params=CursorParams(cursor=None, size=10),
+            center_id=center_fixture.id,
+            start=datetime(2022, 3, 1),
+            end=datetime(2023, 2, 28),
+            tag=None,
+            is_answered=None
+        ) == CursorPage(items=[(review_fixture, 1)], next_cursor=None)
+
     @pytest.mark.asyncio
     async def test_find_reviews_by_center_with_tag(
             self,
@@ -71,6 +115,28 @@ class TestReviewRepository(object):
             is_answered=None
         ) == Page.create(items=[(review_fixture, 1)], params=params, total=1)
 
+    @pytest.mark.asyncio
+    async def test_find_reviews_by_center_with_partial_tag(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_fixture: Review,
+            post_fixture: Post
+    ):
+        # given
+        params = Params(page=1, size=10)
+
+        # then
+        assert await review_repository.find_reviews_by_center(
+            session=session,
+            params=params,
+            center_id=center_fixture.id,
+            start=datetime(2022, 3, 1),
+            end=datetime(2023, 2, 28),
+            tag="ta",
+            is_answered=None
+        ) == Page.create(items=[], params=params, total=0)
+
     @pytest.mark.asyncio
     async def test_find_reviews_with_by_center_only_not_answered(
             self,
@@ -108,6 +174,51 @@ class TestReviewRepository(object):
             center_fixture.id
         ) == review_fixture
 
+    @pytest.mark.asyncio
+    async def test_summarize_by_center(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_fixture: Review,
+            review_answer_fixture: ReviewAnswer
+    ):
+        # then
+        assert await review_repository.summarize_by_center(session, center_fixture.id) == \
+               (1, 1, [("tag", 1), ("tag2", 1)])
+
+    @pytest.mark.asyncio
+    async def test_summarize_by_center_not_answered(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_fixture: Review
+    ):
+        # then
+        assert await review_repository.summarize_by_center(session, center_fixture.id) == \
+               (1, 0, [("tag", 1), ("tag2", 1)])
+
+    @pytest.mark.asyncio
+    async def test_summarize_by_center_without_review(self, session: AsyncSession, center_fixture: Center):
+        # then
+        assert await review_repository.summarize_by_center(session, center_fixture.id) == (0, 0, [])
+
+    @pytest.mark.asyncio
+    async def test_save_review_keeps_review_summary_until_commit(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_fixture: Review
+    ):
+        # given
+        await save_review_summary(center_fixture.id, dict(count_total=0))
+
+        # when
+        await review_repository.save(session, review_fixture)
+
+        # then
+        assert await find_review_summary(center_fixture.id) is not None
+        assert any(center_fixture.id in items for items in session.info[AFTER_COMMIT_CALLBACKS].values())
+
 
 @pytest.mark.describe("Test case for review answer repository")
 class TestReviewAnswerRepository(object):
@@ -122,6 +233,23 @@ class TestReviewAnswerRepository(object):
         assert review_answer_fixture.content == "content"
         assert review_answer_fixture.created_at == datetime(2023, 1, 2)
 
+    @pytest.mark.asyncio
+    async def test_save_review_answer_keeps_review_summary_until_commit(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_answer_fixture: ReviewAnswer
+    ):
+        # given
+        await save_review_summary(center_fixture.id, dict(count_total=0))
+
+        # when
+        await review_answer_repository.save(session, review_answer_fixture)
+
+        # then
+        assert await find_review_summary(center_fixture.id) is not None
+        assert any(center_fixture.id in items for items in session.info[AFTER_COMMIT_CALLBACKS].values())
+
     @pytest.mark.asyncio
     async def test_update_review_answer(
             self,
@@ -4,7 +4,7 @@ import pytest
 
 @pytest.fixture(scope="session", autouse=True)
 async def db():
-    from claon_admin.common.util.db import db
+    from claon_admin.common.util.db import db  # pylint: disable=import-outside-toplevel
 
     asyncio.run(db.drop_database())
     asyncio.run(db.create_database())
@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.time import now
+from claon_admin.schema.job import JobHistoryRepository, JobHistory
+
+job_history_repository = JobHistoryRepository()
+
+
+@pytest.fixture
+async def job_history_list_fixture(session: AsyncSession):
+    started_at = now()
+    histories = [
+        JobHistory(
+            job_name="count_post_by_day",
+            started_at=started_at - timedelta(days=2),
+            finished_at=started_at - timedelta(days=2),
+            duration=1.5,
+            row_count=10,
+            succeeded=True
+        ),
+        JobHistory(
+            job_name="count_post_by_day",
+            started_at=started_at - timedelta(days=1),
+            finished_at=started_at - timedelta(days=1),
+            duration=2.0,
+            row_count=20,
+            succeeded=True
+        ),
+        JobHistory(
+            job_name="count_post_by_day",
+            started_at=started_at,
+            finished_at=started_at,
+            duration=0.1,
+            succeeded=False,
+            error="RuntimeError()"
+        )
+    ]
+
+    for history in histories:
+        await job_history_repository.save(session, history)
+
+    yield histories
+    await session.rollback()
@@ -0,0 +1,35 @@
+from typing import List
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.schema.job import JobHistory
+from tests.repository.job.conftest import job_history_repository
+
+
+@pytest.mark.describe('Test case for job history repository')
+class TestJobHistoryRepository(object):
+    @pytest.mark.asyncio
+    async def test_find_last_success_by_job_name(
+            self,
+            session: AsyncSession,
+            job_history_list_fixture: List[JobHistory]
+    ):
+        # when
+        result = await job_history_repository.find_last_success_by_job_name(session, "count_post_by_day")
+
+        # then
+        assert result.id == job_history_list_fixture[1].id
+        assert result.row_count == 20
+
+    @pytest.mark.asyncio
+    async def test_find_last_success_by_unknown_job_name(
+            self,
+            session: AsyncSession,
+            job_history_list_fixture: List[JobHistory]
+    ):
+        # when
+        result = await job_history_repository.find_last_success_by_job_name(session, "unknown")
+
+        # then
+        assert result is None
@@ -8,7 +8,7 @@ from claon_admin.common.util.time import now
 from claon_admin.schema.center import Center, CenterWall, CenterHold, CenterImage, OperatingTime, Utility, \
     CenterFeeImage, CenterRepository, CenterHoldRepository, CenterWallRepository
 from claon_admin.schema.post import Post, PostImage, ClimbingHistory, PostRepository, ClimbingHistoryRepository, \
-    PostCountHistoryRepository, PostCountHistory
+    PostCountHistoryRepository, PostCountHistory, PostSummaryRepository, PostSummary
 from claon_admin.schema.user import User, UserRepository
 
 user_repository = UserRepository()
@@ -17,6 +17,7 @@ center_hold_repository = CenterHoldRepository()
 center_wall_repository = CenterWallRepository()
 post_repository = PostRepository()
 post_count_history_repository = PostCountHistoryRepository()
+post_summary_repository = PostSummaryRepository()
 climbing_history_repository = ClimbingHistoryRepository()
 
 
@@ -127,6 +128,25 @@ async def post_fixture(session: AsyncSession, user_fixture: User, center_fixture
     await session.rollback()
 
 
+@pytest.fixture
+async def post_list_fixture(session: AsyncSession, user_fixture: User, center_fixture: Center):
+    created_at = now()
+    posts = [
+        Post(
+            user=user_fixture,
+            center=center_fixture,
+            content=f"content {i}",
+            created_at=created_at - timedelta(hours=i // 2),
+            img=[PostImage(url="url")]
+        )
+        for i in range(5)
+    ]
+
+    posts = [await post_repository.save(session, post) for post in posts]
+    yield sorted(posts, key=lambda post: (post.created_at, post.id), reverse=True)
+    await session.rollback()
+
+
 @pytest.fixture
 async def another_post_fixture(session: AsyncSession, user_fixture: User, another_center_fixture: Center):
     post = Post(
@@ -210,3 +230,15 @@ async def climbing_history_fixture(session: AsyncSession, post_fixture: Post, ce
     history = await climbing_history_repository.save(session, history)
     yield history
     await session.rollback()
+
+
+@pytest.fixture
+async def post_summary_fixture(session: AsyncSession, center_fixture: Center):
+    summary = await post_summary_repository.save(session, PostSummary(
+        center_id=center_fixture.id,
+        base_date=now().date(),
+        summary=dict(count_today=1, count_total=10)
+    ))
+
+    yield summary
+    await session.rollback()
@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
+from typing import List
 
 import pytest
 from fastapi_pagination import Params, Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.enum import WallType
+from claon_admin.common.util.pagination import CursorParams, CursorPage
 from claon_admin.common.util.time import now
 from claon_admin.schema.center import Center
 from claon_admin.schema.post import Post, ClimbingHistory
@@ -86,6 +88,50 @@ class TestPostRepository(object):
             end=now()
         ) == Page.create(items=[post_fixture], params=params, total=1)
 
+    @pytest.mark.asyncio
+    async def test_find_posts_by_center_with_cursor(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_list_fixture: List[Post]
+    ):
+        # given
+        results, cursor = [], None
+
+        # when
+        for _ in range(3):
+            page = await post_repository.find_posts_by_center_with_cursor(
+                session=session,
+                params=CursorParams(cursor=cursor, size=2),
+                center_id=center_fixture.id,
+                hold_id=None,
+                start=now() - timedelta(days=1),
+                end=now() + timedelta(days=1)
+            )
+            results.extend(page.items)
+            cursor = page.next_cursor
+
+        # then
+        assert results == post_list_fixture
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_find_posts_by_center_with_cursor_not_included_hold(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_fixture: Post
+    ):
+        # then
+        assert await post_repository.find_posts_by_center_with_cursor(
+            session=session,
+            params=CursorParams(cursor=None, size=2),
+            center_id=center_fixture.id,
+            hold_id="not included hold id",
+            start=now() - timedelta(days=1),
+            end=now() + timedelta(days=1)
+        ) == CursorPage(items=[], next_cursor=None)
+
     @pytest.mark.asyncio
     async def test_count_by_center_and_date(
             self,
@@ -2,6 +2,7 @@ from datetime import timedelta
 from typing import List
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.util.time import now
@@ -56,3 +57,38 @@ class TestPostCountHistoryRepository(object):
             assert result[i].center_id == post_count_history_list_fixture[i].center_id
             assert result[i].count == post_count_history_list_fixture[i].count
             assert result[i].reg_date == post_count_history_list_fixture[i].reg_date
+
+    @pytest.mark.asyncio
+    async def test_upsert_all(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_count_history_fixture: PostCountHistory
+    ):
+        # given
+        histories = [
+            PostCountHistory(center_id=center_fixture.id, count=20, reg_date=now().date()),
+            PostCountHistory(center_id=center_fixture.id, count=5, reg_date=now().date() - timedelta(days=1))
+        ]
+
+        # when
+        row_count = await post_count_history_repository.upsert_all(session, histories)
+
+        # then
+        result = await session.execute(select(PostCountHistory.reg_date, PostCountHistory.count)
+                                       .where(PostCountHistory.center_id == center_fixture.id)
+                                       .order_by(PostCountHistory.reg_date))
+        assert row_count == 2
+        assert [count for _, count in result.all()] == [5, 20]
+
+    @pytest.mark.asyncio
+    async def test_find_last_reg_date(
+            self,
+            session: AsyncSession,
+            post_count_history_list_fixture: List[PostCountHistory]
+    ):
+        # when
+        result = await post_count_history_repository.find_last_reg_date(session)
+
+        # then
+        assert result == now().date() - timedelta(weeks=1)
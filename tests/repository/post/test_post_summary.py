@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.time import now
+from claon_admin.schema.center import Center
+from claon_admin.schema.post import PostSummary
+from tests.repository.post.conftest import post_summary_repository
+
+
+@pytest.mark.describe('Test case for post summary repository')
+class TestPostSummaryRepository(object):
+    @pytest.mark.asyncio
+    async def test_find_by_center_and_base_date(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_summary_fixture: PostSummary
+    ):
+        # when
+        result = await post_summary_repository.find_by_center_and_base_date(session, center_fixture.id, now().date())
+
+        # then
+        assert result.summary == {"count_today": 1, "count_total": 10}
+
+    @pytest.mark.asyncio
+    async def test_find_by_center_and_outdated_base_date(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_summary_fixture: PostSummary
+    ):
+        # when
+        result = await post_summary_repository.find_by_center_and_base_date(
+            session, center_fixture.id, now().date() + timedelta(days=1)
+        )
+
+        # then
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_save_existing_summary(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_summary_fixture: PostSummary
+    ):
+        # when
+        await post_summary_repository.save(session, PostSummary(
+            center_id=center_fixture.id,
+            base_date=now().date(),
+            summary={"count_today": 2}
+        ))
+
+        # then
+        result = await post_summary_repository.find_by_center_and_base_date(session, center_fixture.id, now().date())
+        assert result.summary == {"count_today": 2}
+
+    @pytest.mark.asyncio
+    async def test_delete_all(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_summary_fixture: PostSummary
+    ):
+        # when
+        await post_summary_repository.delete_all(session)
+
+        # then
+        assert await post_summary_repository.find_by_center_and_base_date(
+            session, center_fixture.id, now().date()
+        ) is None
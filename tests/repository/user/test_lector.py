@@ -1,4 +1,5 @@
 import pytest
+from fastapi_pagination import Params, Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.schema.user import User, Lector, LectorApprovedFile
@@ -117,10 +118,16 @@ class TestLectorRepository(object):
     async def test_find_all_lector_by_approved_false(
             self,
             session: AsyncSession,
-            lector_fixture: Lector
+            lector_fixture: Lector,
+            lector_approved_file_fixture: LectorApprovedFile
     ):
+        # given
+        params = Params(page=1, size=10)
+
         # when
-        result = await lector_repository.find_all_by_approved_false(session)
+        pages: Page[Lector] = await lector_repository.find_all_by_approved_false(session, params)
 
         # then
-        assert result == [lector_fixture]
+        assert pages.items == [lector_fixture]
+        assert pages.total == 1
+        assert pages.items[0].approved_files == [lector_approved_file_fixture]
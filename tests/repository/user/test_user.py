@@ -2,6 +2,9 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.enum import Role
+from claon_admin.common.util.db import AFTER_COMMIT_CALLBACKS
+from claon_admin.common.util.subject import save_subject, find_subject
+from claon_admin.model.auth import RequestUser
 from claon_admin.schema.user import User
 from tests.repository.user.conftest import user_repository
 
@@ -192,3 +195,15 @@ class TestUserRepository(object):
 
         # then
         assert result.role == role
+
+    @pytest.mark.asyncio
+    async def test_update_role_keeps_cached_subject_until_commit(self, session: AsyncSession, user_fixture: User):
+        # given
+        await save_subject(RequestUser(id=user_fixture.id, sns=user_fixture.sns, role=user_fixture.role))
+
+        # when
+        await user_repository.update_role(session, user_fixture, Role.LECTOR)
+
+        # then
+        assert await find_subject(user_fixture.id) is not None
+        assert any(user_fixture.id in items for items in session.info[AFTER_COMMIT_CALLBACKS].values())
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from claon_admin.common.util.pagination import PaginationFactory
 from claon_admin.schema.center import CenterRepository, CenterApprovedFileRepository
 from claon_admin.schema.user import UserRepository, LectorRepository, LectorApprovedFileRepository
 from claon_admin.service.admin import AdminService
@@ -19,13 +20,15 @@ def mock_repo():
     lector_approved_file_repository = AsyncMock(spec=LectorApprovedFileRepository)
     center_repository = AsyncMock(spec=CenterRepository)
     center_approved_file_repository = AsyncMock(spec=CenterApprovedFileRepository)
+    pagination_factory = AsyncMock(spec=PaginationFactory)
 
     return {
         "user": user_repository,
         "lector": lector_repository,
         "lector_approved_file": lector_approved_file_repository,
         "center": center_repository,
-        "center_approved_file": center_approved_file_repository
+        "center_approved_file": center_approved_file_repository,
+        "pagination_factory": pagination_factory
     }
 
 
@@ -36,7 +39,8 @@ def admin_service(mock_repo: dict):
         mock_repo["lector"],
         mock_repo["lector_approved_file"],
         mock_repo["center"],
-        mock_repo["center_approved_file"]
+        mock_repo["center_approved_file"],
+        mock_repo["pagination_factory"]
     )
 
 
@@ -14,10 +14,10 @@ from claon_admin.service.admin import AdminService
 class TestApproveCenter(object):
     @pytest.mark.asyncio
     @pytest.mark.it("Success case")
-    @patch("claon_admin.service.admin.delete_file")
+    @patch("claon_admin.service.admin.delete_files_after_commit")
     async def test_success(
             self,
-            mock_delete_file,
+            mock_delete_files_after_commit,
             mock_repo: dict,
             admin_service: AdminService,
             center_fixture: Center,
@@ -41,6 +41,7 @@ class TestApproveCenter(object):
         # then
         assert result.approved
         assert result.user_profile.role == Role.CENTER_ADMIN
+        mock_delete_files_after_commit.assert_called_once_with(None, [e.url for e in center_approved_files_fixture])
 
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: request user is not admin")
@@ -1,9 +1,11 @@
 from typing import List
 
 import pytest
+from fastapi_pagination import Params, Page
 
 from claon_admin.common.enum import Role
 from claon_admin.common.error.exception import UnauthorizedException, ErrorCode
+from claon_admin.common.util.pagination import Pagination
 from claon_admin.model.admin import CenterResponseDto
 from claon_admin.model.auth import RequestUser
 from claon_admin.schema.center import Center, CenterApprovedFile
@@ -24,17 +26,25 @@ class TestGetUnapprovedCenters(object):
         # given
         response = CenterResponseDto.from_entity(center_fixture, center_approved_files_fixture)
         request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.ADMIN)
-        mock_repo["center"].find_all_by_approved_false.side_effect = [[center_fixture]]
-        mock_repo["center_approved_file"].find_all_by_center_id.side_effect = [center_approved_files_fixture]
+        params = Params(page=1, size=10)
+        center_fixture.approved_files = center_approved_files_fixture
+        center_page = Page(items=[center_fixture], params=params, total=1)
+        mock_repo["center"].find_all_by_approved_false.side_effect = [center_page]
+        mock_repo["pagination_factory"].create.side_effect = [Pagination(
+            next_page_num=-1,
+            previous_page_num=-1,
+            total_num=1,
+            results=[CenterResponseDto.from_entity(item) for item in center_page.items]
+        )]
 
         # when
-        result: List[CenterResponseDto] = await admin_service.get_unapproved_centers(None, request_user)
+        result: Pagination[CenterResponseDto] = await admin_service.get_unapproved_centers(None, request_user, params)
 
         # then
-        assert len(result) == 1
-        assert mock_repo["center"].find_all_by_approved_false.call_count == len(result)
+        assert len(result.results) == 1
+        mock_repo["center"].find_all_by_approved_false.assert_called_once_with(None, params)
 
-        for center in result:
+        for center in result.results:
             assert center == response
 
     @pytest.mark.asyncio
@@ -48,12 +58,10 @@ class TestGetUnapprovedCenters(object):
     ):
         # given
         request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.PENDING)
-        mock_repo["center"].find_all_by_approved_false.side_effect = [[center_fixture]]
-        mock_repo["center_approved_file"].find_all_by_center_id.side_effect = [center_approved_files_fixture]
 
         with pytest.raises(UnauthorizedException) as exception:
             # when
-            await admin_service.get_unapproved_centers(None, request_user)
+            await admin_service.get_unapproved_centers(None, request_user, Params(page=1, size=10))
 
         # then
         assert exception.value.code == ErrorCode.NONE_ADMIN_ACCOUNT
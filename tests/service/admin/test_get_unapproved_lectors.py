@@ -1,9 +1,11 @@
 from typing import List
 
 import pytest
+from fastapi_pagination import Params, Page
 
 from claon_admin.common.enum import Role
 from claon_admin.common.error.exception import UnauthorizedException, ErrorCode
+from claon_admin.common.util.pagination import Pagination
 from claon_admin.model.admin import LectorResponseDto
 from claon_admin.model.auth import RequestUser
 from claon_admin.schema.user import Lector, LectorApprovedFile
@@ -24,17 +26,25 @@ class TestGetUnapprovedLectors(object):
         # given
         response = LectorResponseDto.from_entity(lector_fixture, lector_approved_files_fixture)
         request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.ADMIN)
-        mock_repo["lector"].find_all_by_approved_false.side_effect = [[lector_fixture]]
-        mock_repo["lector_approved_file"].find_all_by_lector_id.side_effect = [lector_approved_files_fixture]
+        params = Params(page=1, size=10)
+        lector_fixture.approved_files = lector_approved_files_fixture
+        lector_page = Page(items=[lector_fixture], params=params, total=1)
+        mock_repo["lector"].find_all_by_approved_false.side_effect = [lector_page]
+        mock_repo["pagination_factory"].create.side_effect = [Pagination(
+            next_page_num=-1,
+            previous_page_num=-1,
+            total_num=1,
+            results=[LectorResponseDto.from_entity(item) for item in lector_page.items]
+        )]
 
         # when
-        result: List[LectorResponseDto] = await admin_service.get_unapproved_lectors(None, request_user)
+        result: Pagination[LectorResponseDto] = await admin_service.get_unapproved_lectors(None, request_user, params)
 
         # then
-        assert len(result) == 1
-        assert mock_repo["lector"].find_all_by_approved_false.call_count == len(result)
+        assert len(result.results) == 1
+        mock_repo["lector"].find_all_by_approved_false.assert_called_once_with(None, params)
 
-        for lector in result:
+        for lector in result.results:
             assert lector == response
 
     @pytest.mark.asyncio
@@ -48,12 +58,10 @@ class TestGetUnapprovedLectors(object):
     ):
         # given
         request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.PENDING)
-        mock_repo["lector"].find_all_by_approved_false.side_effect = [[lector_fixture]]
-        mock_repo["lector_approved_file"].find_all_by_lector_id.side_effect = [lector_approved_files_fixture]
 
         with pytest.raises(UnauthorizedException) as exception:
             # when
-            await admin_service.get_unapproved_lectors(None, request_user)
+            await admin_service.get_unapproved_lectors(None, request_user, Params(page=1, size=10))
 
         # then
         assert exception.value.code == ErrorCode.NONE_ADMIN_ACCOUNT
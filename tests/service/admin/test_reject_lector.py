@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from claon_admin.common.enum import Role
@@ -11,8 +13,10 @@ from claon_admin.service.admin import AdminService
 class TestRejectLector:
     @pytest.mark.asyncio
     @pytest.mark.it("Success case")
+    @patch("claon_admin.service.admin.evict_subject_after_commit")
     async def test_reject_lector(
             self,
+            mock_evict_subject_after_commit,
             mock_repo: dict,
             admin_service: AdminService,
             lector_fixture: Lector
@@ -29,6 +33,7 @@ class TestRejectLector:
 
         # then
         assert result is lector_fixture
+        mock_evict_subject_after_commit.assert_called_once_with(None, lector_fixture.user_id)
 
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: request user is not admin")
@@ -11,7 +11,7 @@ from claon_admin.common.util.time import now
 from claon_admin.schema.center import CenterRepository, ReviewRepository, ReviewAnswerRepository, Center, CenterImage, \
     OperatingTime, Utility, CenterFeeImage, CenterHold, CenterWall, Review, ReviewTag, ReviewAnswer
 from claon_admin.schema.post import PostRepository, Post, PostImage, ClimbingHistory, PostCountHistoryRepository, \
-    PostCountHistory
+    PostCountHistory, PostSummaryRepository
 from claon_admin.schema.user import User
 from claon_admin.service.center import CenterService
 
@@ -21,6 +21,7 @@ def mock_repo():
     center_repository = AsyncMock(spec=CenterRepository)
     post_repository = AsyncMock(spec=PostRepository)
     post_count_history_repository = AsyncMock(spec=PostCountHistoryRepository)
+    post_summary_repository = AsyncMock(spec=PostSummaryRepository)
     review_repository = AsyncMock(spec=ReviewRepository)
     review_answer_repository = AsyncMock(spec=ReviewAnswerRepository)
     pagination_factory = AsyncMock(spec=PaginationFactory)
@@ -29,6 +30,7 @@ def mock_repo():
         "center": center_repository,
         "post": post_repository,
         "post_count_history": post_count_history_repository,
+        "post_summary": post_summary_repository,
         "review": review_repository,
         "review_answer": review_answer_repository,
         "pagination_factory": pagination_factory
@@ -41,6 +43,7 @@ def center_service(mock_repo: dict):
         mock_repo["center"],
         mock_repo["post"],
         mock_repo["post_count_history"],
+        mock_repo["post_summary"],
         mock_repo["review"],
         mock_repo["review_answer"],
         mock_repo["pagination_factory"]
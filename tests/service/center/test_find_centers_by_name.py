@@ -1,10 +1,18 @@
 import pytest
 
+from claon_admin.common.util.center_name import center_name_cache
 from claon_admin.model.center import CenterNameResponseDto
 from claon_admin.schema.center import Center
 from claon_admin.service.center import CenterService
 
 
+@pytest.fixture(autouse=True)
+def clear_center_name_cache():
+    center_name_cache.clear()
+    yield
+    center_name_cache.clear()
+
+
 @pytest.mark.describe("Test case for find centers by name")
 class TestFindCentersByName(object):
     @pytest.mark.asyncio
@@ -25,3 +33,37 @@ class TestFindCentersByName(object):
         # then
         assert len(result) == 1
         assert response in result
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: following keystrokes are served from the cache")
+    async def test_find_centers_by_name_with_cache(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        response = CenterNameResponseDto.from_entity(center_fixture)
+        mock_repo["center"].find_by_name.side_effect = [[center_fixture]]
+        await center_service.find_centers_by_name(None, center_fixture.name[:2])
+
+        # when
+        result = await center_service.find_centers_by_name(None, f" {center_fixture.name} ")
+
+        # then
+        assert result == [response]
+        mock_repo["center"].find_by_name.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: blank name")
+    async def test_find_centers_by_blank_name(
+            self,
+            center_service: CenterService,
+            mock_repo: dict
+    ):
+        # when
+        result = await center_service.find_centers_by_name(None, " ")
+
+        # then
+        assert result == []
+        mock_repo["center"].find_by_name.assert_not_called()
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+
+from claon_admin.common.enum import Role
+from claon_admin.common.error.exception import NotFoundException, ErrorCode, UnauthorizedException
+from claon_admin.common.util.pagination import CursorPagination, CursorParams, CursorPage
+from claon_admin.model.auth import RequestUser
+from claon_admin.model.post import PostBriefResponseDto
+from claon_admin.schema.center import Center
+from claon_admin.schema.post import Post
+from claon_admin.service.center import CenterService
+
+
+@pytest.mark.describe("Test case for find posts by center with cursor")
+class TestFindPostsByCenterWithCursor(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    async def test_find_posts_by_center_with_cursor(
+            self,
+            mock_repo: dict,
+            center_fixture: Center,
+            post_fixture: Post,
+            center_service: CenterService
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        params = CursorParams(cursor=None, size=1)
+        post_page = CursorPage(items=[post_fixture], next_cursor="next")
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["post"].find_posts_by_center_with_cursor.side_effect = [post_page]
+        mock_repo["pagination_factory"].create_by_cursor.side_effect = [CursorPagination(
+            next_cursor="next",
+            results=[PostBriefResponseDto.from_entity(post_fixture)]
+        )]
+
+        # when
+        pages: CursorPagination[PostBriefResponseDto] = await center_service.find_posts_by_center_with_cursor(
+            session=None,
+            subject=request_user,
+            params=params,
+            center_id=center_fixture.id,
+            hold_id=None,
+            start=datetime(2022, 4, 1),
+            end=datetime(2023, 3, 31)
+        )
+
+        # then
+        assert pages.next_cursor == "next"
+        assert pages.results[0].post_id == post_fixture.id
+        mock_repo["pagination_factory"].create_by_cursor.assert_called_once_with(PostBriefResponseDto, post_page)
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: center is not found")
+    async def test_find_posts_by_center_with_cursor_with_wrong_center_id(
+            self,
+            mock_repo: dict,
+            center_service: CenterService
+    ):
+        # given
+        request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [None]
+
+        with pytest.raises(NotFoundException) as exception:
+            # when
+            await center_service.find_posts_by_center_with_cursor(
+                None,
+                request_user,
+                CursorParams(cursor=None, size=10),
+                "wrong id",
+                None,
+                datetime(2022, 4, 1),
+                datetime(2023, 3, 31)
+            )
+
+        # then
+        assert exception.value.code == ErrorCode.DATA_DOES_NOT_EXIST
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: request is not center admin")
+    async def test_find_posts_by_center_with_cursor_not_center_admin(
+            self,
+            mock_repo: dict,
+            center_fixture: Center,
+            center_service: CenterService
+    ):
+        # given
+        request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+
+        with pytest.raises(UnauthorizedException) as exception:
+            # when
+            await center_service.find_posts_by_center_with_cursor(
+                None,
+                request_user,
+                CursorParams(cursor=None, size=10),
+                center_fixture.id,
+                None,
+                datetime(2022, 4, 1),
+                datetime(2023, 3, 31)
+            )
+
+        # then
+        assert exception.value.code == ErrorCode.NOT_ACCESSIBLE
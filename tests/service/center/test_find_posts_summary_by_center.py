@@ -6,7 +6,8 @@ from claon_admin.common.enum import Role
 from claon_admin.common.error.exception import UnauthorizedException, ErrorCode, NotFoundException
 from claon_admin.model.auth import RequestUser
 from claon_admin.schema.center import Center, Post
-from claon_admin.schema.post import PostCountHistory
+from claon_admin.common.util.time import now
+from claon_admin.schema.post import PostCountHistory, PostSummary
 from claon_admin.service.center import CenterService
 
 
@@ -30,6 +31,8 @@ class TestFindPostsSummaryByCenter(object):
         mock_repo["center"].find_by_id.side_effect = [center_fixture]
         mock_repo["post_count_history"].sum_count_by_center.side_effect = [30]
         mock_repo["post_count_history"].find_by_center_and_date.side_effect = [post_count_history_list_fixture]
+        mock_repo["post_summary"].find_by_center_and_base_date.side_effect = [None]
+        mock_repo["post_summary"].save.side_effect = lambda session, summary: summary
 
         # when
         results = await center_service.find_posts_summary_by_center(None,
@@ -47,6 +50,45 @@ class TestFindPostsSummaryByCenter(object):
         assert results.count_per_day[-1].count == 10
         assert len(results.count_per_week) == 52
         assert results.count_per_week[-1].count == 10
+        mock_repo["post_summary"].save.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: summary is already computed")
+    async def test_find_posts_summary_by_center_with_summary(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["post_summary"].find_by_center_and_base_date.side_effect = [PostSummary(
+            center_id=center_fixture.id,
+            base_date=now().date(),
+            summary=dict(
+                count_today=1,
+                count_week=2,
+                count_month=3,
+                count_total=4,
+                count_per_day=[dict(unit="월", count=1)],
+                count_per_week=[dict(unit="2022-12-26", count=2)]
+            )
+        )]
+
+        # when
+        results = await center_service.find_posts_summary_by_center(None,
+                                                                    request_user,
+                                                                    center_fixture.id)
+
+        # then
+        assert results.center_id == center_fixture.id
+        assert results.center_name == center_fixture.name
+        assert results.count_today == 1
+        assert results.count_total == 4
+        assert results.count_per_week[0].count == 2
+        mock_repo["post_count_history"].sum_count_by_center.assert_not_called()
+        mock_repo["post_summary"].save.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: center is not found")
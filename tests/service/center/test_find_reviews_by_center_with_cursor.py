@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import pytest
+
+from claon_admin.common.enum import Role
+from claon_admin.common.error.exception import ErrorCode, BadRequestException
+from claon_admin.common.util.pagination import CursorPagination, CursorParams, CursorPage
+from claon_admin.model.auth import RequestUser
+from claon_admin.model.review import ReviewBriefResponseDto
+from claon_admin.schema.center import Center, Review
+from claon_admin.service.center import CenterService
+
+
+@pytest.mark.describe("Test case for find reviews by center with cursor")
+class TestFindReviewsByCenterWithCursor(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    async def test_find_reviews_by_center_with_cursor(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center,
+            review_fixture: Review
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        review_page = CursorPage(items=[(review_fixture, 1)], next_cursor=None)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["review"].find_reviews_by_center_with_cursor.side_effect = [review_page]
+        mock_repo["pagination_factory"].create_by_cursor.side_effect = [CursorPagination(
+            next_cursor=None,
+            results=[ReviewBriefResponseDto.from_entity((review_fixture, 1))]
+        )]
+
+        # when
+        pages: CursorPagination[ReviewBriefResponseDto] = await center_service.find_reviews_by_center_with_cursor(
+            None,
+            request_user,
+            CursorParams(cursor=None, size=10),
+            center_fixture.id,
+            datetime(2022, 4, 1),
+            datetime(2023, 3, 31),
+            None,
+            None
+        )
+
+        # then
+        assert pages.next_cursor is None
+        assert pages.results[0].review_id == review_fixture.id
+        mock_repo["pagination_factory"].create_by_cursor.assert_called_once_with(ReviewBriefResponseDto, review_page)
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: invalid date range")
+    async def test_find_reviews_by_center_with_cursor_with_invalid_date(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await center_service.find_reviews_by_center_with_cursor(
+                None,
+                request_user,
+                CursorParams(cursor=None, size=10),
+                center_fixture.id,
+                datetime(2023, 4, 1),
+                datetime(2022, 3, 31),
+                None,
+                None
+            )
+
+        # then
+        assert exception.value.code == ErrorCode.WRONG_DATE_RANGE
@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.enum import Role
+from claon_admin.common.error.exception import UnauthorizedException, ErrorCode, NotFoundException
+from claon_admin.model.auth import RequestUser
+from claon_admin.schema.center import Center
+from claon_admin.service.center import CenterService
+
+
+@pytest.mark.describe("Test case for find reviews summary by center")
+class TestFindReviewsSummaryByCenter(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    async def test_find_reviews_summary_by_center(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["review"].summarize_by_center.side_effect = [(3, 1, [("tag", 2), ("tag2", 1)])]
+
+        with patch("claon_admin.service.center.find_review_summary", return_value=None), \
+                patch("claon_admin.service.center.save_review_summary") as save_review_summary:
+            # when
+            results = await center_service.find_reviews_summary_by_center(None,
+                                                                          request_user,
+                                                                          center_fixture.id)
+
+        # then
+        assert results.center_id == center_fixture.id
+        assert results.center_name == center_fixture.name
+        assert results.count_total == 3
+        assert results.count_answered == 1
+        assert results.count_not_answered == 2
+        assert [(tag.tag, tag.count) for tag in results.review_count_by_tag_list] == [("tag", 2), ("tag2", 1)]
+        save_review_summary.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: summary is cached")
+    async def test_find_reviews_summary_by_center_with_cache(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        summary = dict(
+            count_total=2,
+            count_answered=2,
+            count_not_answered=0,
+            review_count_by_tag_list=[dict(tag="tag", count=2)]
+        )
+
+        with patch("claon_admin.service.center.find_review_summary", return_value=summary), \
+                patch("claon_admin.service.center.save_review_summary") as save_review_summary:
+            # when
+            results = await center_service.find_reviews_summary_by_center(None,
+                                                                          request_user,
+                                                                          center_fixture.id)
+
+        # then
+        assert results.count_total == 2
+        assert results.review_count_by_tag_list[0].tag == "tag"
+        mock_repo["review"].summarize_by_center.assert_not_called()
+        save_review_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: center is not found")
+    async def test_find_reviews_summary_by_center_with_not_exist_center(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [None]
+        wrong_id = "wrong id"
+
+        with pytest.raises(NotFoundException) as exception:
+            # when
+            await center_service.find_reviews_summary_by_center(None, request_user, wrong_id)
+
+        # then
+        assert exception.value.code == ErrorCode.DATA_DOES_NOT_EXIST
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: request user is not center admin")
+    async def test_find_reviews_summary_by_center_with_not_center_admin(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+
+        with pytest.raises(UnauthorizedException) as exception:
+            # when
+            await center_service.find_reviews_summary_by_center(None, request_user, center_fixture.id)
+
+        # then
+        assert exception.value.code == ErrorCode.NOT_ACCESSIBLE
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import Response
+from jose import jwt
+
+from claon_admin.common.enum import Role
+from claon_admin.common.error.exception import InternalServerException
+from claon_admin.common.util.jwt import create_refresh_token, resolve_refresh_token
+from claon_admin.common.util.subject import save_subject, evict_subject
+from claon_admin.config.auth import get_subject
+from claon_admin.config.config import conf
+from claon_admin.model.auth import RequestUser
+
+
+def make_expired_access_token(user_id: str) -> str:
+    return jwt.encode({"sub": user_id, "exp": int(time.time()) - 60}, conf().JWT_SECRET_KEY, conf().JWT_ALGORITHM)
+
+
+@pytest.fixture
+async def subject():
+    subject = RequestUser(id="user_id", sns="test@gmail.com", nickname="test", role=Role.LECTOR)
+    await save_subject(subject)
+    yield subject
+    await evict_subject(subject.id)
+
+
+@pytest.mark.describe("Test case for get subject")
+class TestGetSubject(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: expired access token is reissued with a new refresh token")
+    async def test_reissue(self, redis_client, subject: RequestUser):
+        with patch("claon_admin.common.util.redis.redis", redis_client):
+            # given
+            refresh_token = await create_refresh_token(subject.id)
+            response = Response()
+
+            # when
+            result = await get_subject(response, make_expired_access_token(subject.id), refresh_token,
+                                       session=None, user_repository=None)
+
+        # then
+        assert result == subject
+        reissued = response.headers["refresh-token"]
+        assert reissued != refresh_token
+        assert resolve_refresh_token(reissued)
+        assert await redis_client.get_connection().get(reissued) == subject.id
+        assert await redis_client.get_connection().exists(refresh_token) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: refresh token cannot be used by two concurrent refreshes")
+    async def test_double_refresh(self, redis_client, subject: RequestUser):
+        with patch("claon_admin.common.util.redis.redis", redis_client):
+            # given
+            refresh_token = await create_refresh_token(subject.id)
+            access_token = make_expired_access_token(subject.id)
+
+            # when
+            results = await asyncio.gather(
+                get_subject(Response(), access_token, refresh_token, session=None, user_repository=None),
+                get_subject(Response(), access_token, refresh_token, session=None, user_repository=None),
+                return_exceptions=True
+            )
+
+        # then
+        assert results.count(subject) == 1
+        assert len([r for r in results if isinstance(r, InternalServerException)]) == 1
+        assert await redis_client.get_connection().dbsize() == 1
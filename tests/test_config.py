@@ -0,0 +1,55 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from claon_admin.config import config
+
+
+@pytest.mark.describe('Test case for config')
+class TestConfigLoading(object):
+    @pytest.mark.it('Settings are created once per process')
+    def test_conf_is_cached(self):
+        assert config.conf() is config.conf()
+        assert isinstance(config.conf(), config.TestConfig)
+
+    @pytest.mark.it('Settings cannot be changed')
+    def test_conf_is_frozen(self):
+        with pytest.raises(FrozenInstanceError):
+            config.conf().DB_URL = "sqlite+aiosqlite:///other.db"
+
+    @pytest.mark.it('Reload creates the settings again')
+    def test_reload_conf(self):
+        # given
+        before = config.conf()
+
+        # when
+        after = config.reload_conf()
+
+        # then
+        assert after is not before
+        assert after is config.conf()
+        assert after == before
+
+    @pytest.mark.it('Reload selects the settings by the current API_ENV')
+    def test_reload_conf_with_changed_api_env(self, monkeypatch):
+        # given
+        monkeypatch.setenv("API_ENV", "unknown")
+
+        try:
+            with pytest.raises(ValueError):
+                # when
+                config.reload_conf()
+        finally:
+            monkeypatch.setenv("API_ENV", "test")
+            config.reload_conf()
+
+        # then
+        assert isinstance(config.conf(), config.TestConfig)
+
+    @pytest.mark.it('Prod settings fail fast on missing secrets')
+    def test_prod_config_with_missing_secrets(self):
+        with pytest.raises(ValueError) as exception:
+            config.ProdConfig()
+
+        assert "JWT_SECRET_KEY" in str(exception.value)
+        assert "DB_PASSWORD" in str(exception.value)
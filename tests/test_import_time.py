@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_BUDGET_MS = int(os.environ.get("IMPORT_TIME_BUDGET_MS", 2000))
+LAZY_MODULES = ("boto3", "botocore", "httpx", "jinja2", "pandas")
+
+
+@pytest.fixture(scope="module")
+def import_profile():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import claon_admin.main"],
+        env={**os.environ, "API_ENV": "test"},
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+
+    return profile
+
+
+@pytest.mark.describe('Test case for import time of the application')
+class TestImportTime(object):
+    @pytest.mark.it('Heavy libraries are not imported until they are used')
+    def test_lazy_modules(self, import_profile: dict):
+        assert [name for name in LAZY_MODULES if name in import_profile] == []
+
+    @pytest.mark.it('Importing the application stays within the budget')
+    def test_import_time_budget(self, import_profile: dict):
+        assert import_profile["claon_admin.main"] / 1000 < IMPORT_TIME_BUDGET_MS
@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import text, inspect
+from alembic import command
+from alembic.config import Config
+
+from claon_admin.common.util.db import Database
+from claon_admin.migration import check_schema_version, SchemaVersionMismatchError
+
+
+@pytest.fixture
+async def migration(tmp_path):
+    db_url = f"sqlite+aiosqlite:///{tmp_path}/migration.db"
+    config = Config("alembic.ini")
+    config.attributes["db_url"] = db_url
+    database = Database(db_url=db_url)
+
+    yield config, database
+    await database._engine.dispose()
+
+
+@pytest.mark.describe('Test case for schema migration')
+class TestMigration(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it('Migrations produce the schema declared by the models')
+    async def test_upgrade_matches_models(self, migration):
+        # given
+        config, database = migration
+
+        # when
+        command.upgrade(config, "head")
+
+        # then
+        command.check(config)
+        await check_schema_version(database)
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Startup check fails when the schema is behind')
+    async def test_check_schema_version_with_outdated_schema(self, migration):
+        # given
+        config, database = migration
+        command.upgrade(config, "0001")
+
+        with pytest.raises(SchemaVersionMismatchError):
+            # when
+            await check_schema_version(database)
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Baseline database is upgraded with the tables added after it')
+    async def test_upgrade_from_baseline(self, migration):
+        # given
+        config, database = migration
+        command.upgrade(config, "0001")
+        async with database._engine.begin() as conn:
+            await conn.execute(text(
+                "INSERT INTO tb_post_count_history (id, center_id, reg_date, count) VALUES "
+                "(1, 'center', '2026-10-01 00:00:00', 3), (2, 'center', '2026-10-01 00:00:00', 3), "
+                "(3, 'center', '2026-10-02 00:00:00', 5)"
+            ))
+
+        # when
+        command.upgrade(config, "head")
+
+        # then
+        async with database._engine.connect() as conn:
+            table_names = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+            rows = (await conn.execute(text("SELECT id, count FROM tb_post_count_history ORDER BY id"))).all()
+
+        assert {"tb_job_history", "tb_post_summary"} <= set(table_names)
+        assert [tuple(row) for row in rows] == [(2, 3), (3, 5)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Migrations can be reverted')
+    async def test_downgrade(self, migration):
+        # given
+        config, database = migration
+        command.upgrade(config, "head")
+
+        # when
+        command.downgrade(config, "base")
+
+        # then
+        with pytest.raises(SchemaVersionMismatchError):
+            await check_schema_version(database)
@@ -0,0 +1,52 @@
+import os
+
+import boto3
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from claon_admin.common.util.db import db, Base
+from claon_admin.config.config import conf
+from claon_admin.schema import center, job, post, user  # noqa: F401 pylint: disable=unused-import
+
+
+@pytest.fixture
+def s3_client():
+    moto = pytest.importorskip("moto")
+
+    with moto.mock_aws():
+        client = boto3.client(
+            "s3",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+            region_name=conf().REGION_NAME
+        )
+        client.create_bucket(
+            Bucket=conf().BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": conf().REGION_NAME}
+        )
+        yield client
+
+
+@pytest.fixture
+async def session():
+    await db.create_database()
+    async with db.async_session_maker() as session:
+        yield session
+        await session.rollback()
+
+
+@pytest.fixture
+async def postgres_session():
+    db_url = os.environ.get("TEST_POSTGRES_URL")
+    if db_url is None:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    engine = create_async_engine(db_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        yield session
+        await session.rollback()
+
+    await engine.dispose()
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+from claon_admin.common.enum import Role
+from claon_admin.common.util.cache import TTLCache, TwoTierCache
+from claon_admin.model.auth import RequestUser
+
+
+@pytest.mark.describe("Test case for ttl cache")
+class TestTTLCache(object):
+    @pytest.mark.it("Success case: expired items are evicted")
+    def test_evict_expired(self):
+        # given
+        cache = TTLCache(ttl=0.05)
+        cache.set("expired", 1)
+        time.sleep(0.1)
+        cache.set("alive", 2)
+
+        # when
+        cache.evict_expired()
+
+        # then
+        assert len(cache) == 1
+        assert cache.get("alive") == 2
+
+
+@pytest.mark.describe("Test case for two tier cache")
+class TestTwoTierCache(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: value is shared through redis")
+    async def test_get_from_redis(self, redis_client):
+        # given
+        writer = TwoTierCache("test:", ttl=60, local_ttl=5, max_size=10, redis=redis_client,
+                              dumps=RequestUser.json, loads=RequestUser.parse_raw)
+        reader = TwoTierCache("test:", ttl=60, local_ttl=5, max_size=10, redis=redis_client,
+                              dumps=RequestUser.json, loads=RequestUser.parse_raw)
+        subject = RequestUser(id="user", sns="test@claon.com", role=Role.USER)
+
+        # when
+        await writer.set("user", subject)
+        result = await reader.get("user")
+
+        # then
+        assert result == subject
+        assert reader.local.get("user") == subject
+        assert 0 < await redis_client.get_connection().ttl("test:user") <= 60
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: delete evicts both tiers")
+    async def test_delete_all(self, redis_client):
+        # given
+        cache = TwoTierCache("test:", ttl=60, local_ttl=5, max_size=10, redis=redis_client)
+        await cache.set("a", dict(count=1))
+        await cache.set("b", dict(count=2))
+
+        # when
+        await cache.delete_all(["a", "b", "a"])
+
+        # then
+        assert await cache.get("a") is None
+        assert await cache.get("b") is None
+        assert await redis_client.get_connection().exists("test:a", "test:b") == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: local cache keeps values for the full ttl without redis")
+    async def test_without_redis(self):
+        # given
+        cache = TwoTierCache("test:", ttl=60, local_ttl=5, max_size=10, redis=None)
+
+        # when
+        await cache.set("a", dict(count=1))
+
+        # then
+        assert cache.local.ttl == 60
+        assert await cache.get("a") == dict(count=1)
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.center_name import center_name_cache, find_center_names, save_center_names, \
+    match_center_name, evict_center_names, evict_center_names_after_commit
+from claon_admin.common.util.db import AFTER_COMMIT_CALLBACKS, _background_tasks
+from claon_admin.common.util.hangul import to_chosung_pattern, has_chosung
+
+
+@pytest.fixture(autouse=True)
+def clear_center_name_cache():
+    center_name_cache.clear()
+    yield
+    center_name_cache.clear()
+
+
+@pytest.mark.describe('Test case for center name search')
+class TestCenterName(object):
+    @pytest.mark.it('Chosung stands for every syllable it starts')
+    def test_to_chosung_pattern(self):
+        assert has_chosung("클ㄹ")
+        assert not has_chosung("클라임")
+        assert to_chosung_pattern("클ㄹ") == "클[라-맇]"
+        assert to_chosung_pattern("a.b") == "a\\.b"
+
+    @pytest.mark.it('Name matches case-insensitively or by chosung')
+    def test_match_center_name(self):
+        assert match_center_name("climb", "The Climb")
+        assert match_center_name("ㄷㅋㄹ", "더클라임")
+        assert not match_center_name("ㄷㄹ", "더클라임")
+
+    @pytest.mark.it('Complete result of a shorter prefix is narrowed instead of a miss')
+    def test_find_center_names_by_prefix(self):
+        # given
+        save_center_names("클", [dict(name="클라임"), dict(name="더클라임"), dict(name="클럽")])
+
+        # then
+        assert find_center_names("클라") == [dict(name="클라임"), dict(name="더클라임")]
+        assert find_center_names("클ㄹ") == [dict(name="클럽"), dict(name="클라임"), dict(name="더클라임")]
+
+    @pytest.mark.it('Truncated result of a shorter prefix is not narrowed')
+    def test_find_center_names_by_truncated_prefix(self):
+        # given
+        save_center_names("클", [dict(name=f"클라임 {i}") for i in range(5)])
+
+        # then
+        assert find_center_names("클라") is None
+
+    @pytest.mark.it('Eviction drops every cached query')
+    def test_evict_center_names(self):
+        # given
+        save_center_names("클", [])
+
+        # when
+        evict_center_names()
+
+        # then
+        assert find_center_names("클") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Eviction waits for the commit')
+    async def test_evict_center_names_after_commit(self, session: AsyncSession):
+        # given
+        save_center_names("클", [])
+
+        # when
+        evict_center_names_after_commit(session, "클라임")
+        assert find_center_names("클") == []
+        await session.commit()
+        await asyncio.gather(*_background_tasks)
+
+        # then
+        assert find_center_names("클") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Rollback keeps the cached queries')
+    async def test_keep_center_names_after_rollback(self, session: AsyncSession):
+        # given
+        save_center_names("클", [])
+        await session.execute(text("SELECT 1"))
+
+        # when
+        evict_center_names_after_commit(session, "클라임")
+        await session.rollback()
+
+        # then
+        assert AFTER_COMMIT_CALLBACKS not in session.info
+        assert find_center_names("클") == []
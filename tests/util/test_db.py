@@ -0,0 +1,212 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from claon_admin.common.enum import Role
+from claon_admin.common.error.exception import UnauthorizedException, ErrorCode
+from claon_admin.common.util.db import Database, call_after_commit, _background_tasks
+from claon_admin.model.auth import RequestUser
+from claon_admin.schema.job import JobHistory
+from claon_admin.router.index import get_db_pool_status
+
+
+@pytest.fixture
+async def pooled_database(tmp_path):
+    database = Database(db_url=f"sqlite+aiosqlite:///{tmp_path}/pool.db", pool_size=2, max_overflow=1)
+    yield database
+    await database._engine.dispose()
+
+
+@pytest.fixture
+async def replicated_database(tmp_path):
+    database = Database(db_url=f"sqlite+aiosqlite:///{tmp_path}/primary.db",
+                        read_db_urls=[f"sqlite+aiosqlite:///{tmp_path}/replica-{i}.db" for i in range(2)],
+                        read_pin_seconds=0.2,
+                        read_pin_key=lambda request: request.headers.get("user"))
+    await database.create_database()
+    yield database
+
+    for engine in [database._engine, *database._read_engines]:
+        await engine.dispose()
+
+
+def create_request(user_id: str):
+    return Request({"type": "http", "headers": [(b"user", user_id.encode())]})
+
+
+async def read_database_name(database: Database, request: Request):
+    sessions = database.get_read_db(request)
+    session = await sessions.__anext__()
+    await sessions.aclose()
+    return session.bind.url.database.rsplit("/", 1)[-1]
+
+
+async def write(database: Database, request: Request):
+    sessions = database.get_db(request)
+    session = await sessions.__anext__()
+    session.add(JobHistory(job_name="pin", started_at=datetime(2023, 1, 1), finished_at=datetime(2023, 1, 1),
+                           duration=1.0, succeeded=True))
+    with pytest.raises(StopAsyncIteration):
+        await sessions.__anext__()
+
+
+@pytest.mark.describe("Test case for read replica routing")
+class TestReadRouting(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: reads go to the replicas in turn")
+    async def test_round_robin(self, replicated_database: Database):
+        # given
+        request = create_request("user")
+
+        # when
+        names = [await read_database_name(replicated_database, request) for _ in range(4)]
+
+        # then
+        assert names == ["replica-0.db", "replica-1.db", "replica-0.db", "replica-1.db"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: reads of a user are pinned to the primary after a write")
+    async def test_pin_to_primary_after_write(self, replicated_database: Database):
+        # given
+        await write(replicated_database, create_request("writer"))
+
+        # when
+        writer = await read_database_name(replicated_database, create_request("writer"))
+        other = await read_database_name(replicated_database, create_request("other"))
+
+        # then
+        assert writer == "primary.db"
+        assert other.startswith("replica-")
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: pin expires")
+    async def test_pin_expires(self, replicated_database: Database):
+        # given
+        await write(replicated_database, create_request("writer"))
+
+        # when
+        await asyncio.sleep(0.3)
+        name = await read_database_name(replicated_database, create_request("writer"))
+
+        # then
+        assert name.startswith("replica-")
+        assert len(replicated_database._pinned) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: read only request is not pinned")
+    async def test_read_only_request_is_not_pinned(self, replicated_database: Database):
+        # given
+        sessions = replicated_database.get_db(create_request("reader"))
+        await sessions.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await sessions.__anext__()
+
+        # when
+        name = await read_database_name(replicated_database, create_request("reader"))
+
+        # then
+        assert name.startswith("replica-")
+
+
+@pytest.mark.describe("Test case for database pool status")
+class TestPoolStatus(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: checked out connections are counted")
+    async def test_pool_status(self, pooled_database: Database):
+        # given
+        first = await pooled_database._engine.connect()
+        second = await pooled_database._engine.connect()
+        third = await pooled_database._engine.connect()
+
+        # when
+        checked_out = pooled_database.pool_status()
+        for connection in (first, second, third):
+            await connection.close()
+        checked_in = pooled_database.pool_status()
+
+        # then
+        assert checked_out["primary"]["pool"] == "TimedQueuePool"
+        assert checked_out["primary"]["size"] == 2
+        assert checked_out["primary"]["checked_out"] == 3
+        assert checked_out["primary"]["overflow"] == 1
+        assert checked_out["primary"]["checkout_count"] == 3
+        assert checked_out["primary"]["max_wait_ms"] >= checked_out["primary"]["avg_wait_ms"] >= 0
+        assert checked_out["replicas"] == []
+        assert checked_in["primary"]["checked_out"] == 0
+        assert checked_in["primary"]["checked_in"] == 2
+
+    @pytest.mark.it("Success case: default pool reports only its type")
+    def test_pool_status_without_pool_size(self, tmp_path):
+        # given
+        database = Database(db_url=f"sqlite+aiosqlite:///{tmp_path}/default.db")
+
+        # when
+        status = database.pool_status()
+
+        # then
+        assert status["primary"] == {"pool": database._engine.pool.__class__.__name__}
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: request user is not admin")
+    async def test_get_db_pool_status_with_non_admin(self):
+        with pytest.raises(UnauthorizedException) as exception:
+            # when
+            await get_db_pool_status(RequestUser(id="123456", sns="test@claon.com", role=Role.USER))
+
+        # then
+        assert exception.value.code == ErrorCode.NONE_ADMIN_ACCOUNT
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: admin reads the pool status")
+    async def test_get_db_pool_status(self):
+        # when
+        status = await get_db_pool_status(RequestUser(id="123456", sns="test@claon.com", role=Role.ADMIN))
+
+        # then
+        assert "primary" in status
+
+
+@pytest.mark.describe("Test case for after commit callbacks")
+class TestCallAfterCommit(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: callback is awaited once with every queued item after commit")
+    async def test_call_after_commit(self, session: AsyncSession):
+        # given
+        calls = []
+
+        async def callback(items):
+            calls.append(items)
+
+        # when
+        call_after_commit(session, callback, ["a", "b"])
+        call_after_commit(session, callback, ["c"])
+        assert calls == []
+        await session.commit()
+        await asyncio.gather(*_background_tasks)
+
+        # then
+        assert calls == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: rollback drops the queued items")
+    async def test_call_after_commit_with_rollback(self, session: AsyncSession):
+        # given
+        calls = []
+
+        async def callback(items):
+            calls.append(items)
+
+        await session.execute(text("SELECT 1"))
+        call_after_commit(session, callback, ["a"])
+
+        # when
+        await session.rollback()
+        await session.commit()
+        await asyncio.gather(*_background_tasks)
+
+        # then
+        assert calls == []
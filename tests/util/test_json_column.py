@@ -0,0 +1,54 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from claon_admin.common.util import json_column
+from claon_admin.common.util.json_column import JsonArray, normalize
+from claon_admin.schema.center import ReviewTag
+from claon_admin.schema.user import Certificate
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(json_column, "orjson", None)
+    elif json_column.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.mark.describe('Test case for json column')
+class TestJsonColumn(object):
+    @pytest.mark.it('Values round trip through the column')
+    def test_round_trip(self, backend):
+        # given
+        column_type = JsonArray(Certificate)
+        values = [Certificate(acquisition_date=date(2023, 1, 1), rate=1, name="certificate")]
+
+        # when
+        raw = column_type.process_bind_param(values, postgresql.dialect())
+
+        # then
+        assert column_type.process_result_value(raw, postgresql.dialect()) == \
+               [Certificate(acquisition_date="2023-01-01", rate=1, name="certificate")]
+
+    @pytest.mark.it('Text written by the main service is read as is')
+    def test_read_text(self, backend):
+        # given
+        column_type = JsonArray(ReviewTag)
+
+        # then
+        assert column_type.process_result_value('[{"word": "\\ud0dc\\uadf8", "id": 1}]', postgresql.dialect()) == \
+               [ReviewTag(word="태그")]
+        assert column_type.process_result_value(None, postgresql.dialect()) is None
+
+    @pytest.mark.it('Normalized values are the values read back from the column')
+    def test_normalize(self, backend):
+        assert normalize([Certificate(acquisition_date=date(2023, 1, 1), rate=1, name="certificate")]) == \
+               [Certificate(acquisition_date="2023-01-01", rate=1, name="certificate")]
+
+    @pytest.mark.it('Value objects have no instance dict')
+    def test_slots(self):
+        with pytest.raises(AttributeError):
+            ReviewTag(word="tag").unknown = 1
@@ -0,0 +1,72 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from jose import jwt
+
+from claon_admin.common.error.exception import UnauthorizedException, ErrorCode
+from claon_admin.common.util.jwt import TokenVerifier, resolve_access_token, find_user_id_by_access_token
+
+SECRET_KEY = "secret"
+ALGORITHM = "HS256"
+
+
+@pytest.fixture
+def verifier():
+    return TokenVerifier(SECRET_KEY, ALGORITHM, max_size=10, ttl=300)
+
+
+def make_token(exp: float, secret_key: str = SECRET_KEY):
+    return jwt.encode({"sub": "user_id", "exp": int(exp)}, secret_key, ALGORITHM)
+
+
+@pytest.mark.describe('Test case for token verifier')
+class TestTokenVerifier(object):
+    @pytest.mark.it('Claims of a verified token are reused')
+    def test_verify(self, verifier: TokenVerifier):
+        # given
+        token = make_token(time.time() + 3600)
+
+        with patch("claon_admin.common.util.jwt.jwt.decode", wraps=jwt.decode) as decode:
+            # when
+            claims = [verifier.verify(token) for _ in range(3)]
+
+        # then
+        assert claims[0]["sub"] == "user_id"
+        assert claims == [claims[0]] * 3
+        decode.assert_called_once()
+
+    @pytest.mark.it('Expired token is decoded but not kept')
+    def test_verify_expired(self, verifier: TokenVerifier):
+        # given
+        token = make_token(time.time() - 1)
+
+        # when
+        claims = verifier.verify(token)
+
+        # then
+        assert claims["sub"] == "user_id"
+        assert len(verifier.cache) == 0
+
+    @pytest.mark.it('Token signed with another key is rejected')
+    def test_verify_with_wrong_key(self, verifier: TokenVerifier):
+        with pytest.raises(jwt.JWTError):
+            verifier.verify(make_token(time.time() + 3600, secret_key="wrong secret"))
+
+        assert len(verifier.cache) == 0
+
+    @pytest.mark.it('Invalid access token raises unauthorized exception')
+    def test_resolve_access_token_with_wrong_key(self, verifier: TokenVerifier):
+        with patch("claon_admin.common.util.jwt.access_token_verifier", return_value=verifier), \
+                pytest.raises(UnauthorizedException) as exception:
+            resolve_access_token(make_token(time.time() + 3600, secret_key="wrong secret"))
+
+        assert exception.value.code == ErrorCode.INVALID_JWT
+
+    @pytest.mark.it('User id is read from a signed access token, expired or not')
+    def test_find_user_id_by_access_token(self, verifier: TokenVerifier):
+        with patch("claon_admin.common.util.jwt.access_token_verifier", return_value=verifier):
+            assert find_user_id_by_access_token(make_token(time.time() + 3600)) == "user_id"
+            assert find_user_id_by_access_token(make_token(time.time() - 3600)) == "user_id"
+            assert find_user_id_by_access_token(make_token(time.time() + 3600, secret_key="wrong secret")) is None
+            assert find_user_id_by_access_token(None) is None
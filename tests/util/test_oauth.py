@@ -0,0 +1,156 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from claon_admin.common.error.exception import InternalServerException
+from claon_admin.common.util.jwks import JwksCache, max_age_of
+from claon_admin.common.util.oauth import GoogleUserInfoProvider, KakaoUserInfoProvider, GOOGLE_CERTS_URL, \
+    KAKAO_USER_INFO_URL
+
+CLIENT_ID = "client-id"
+
+
+def make_key(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                            serialization.NoEncryption())
+    public_pem = private_key.public_key().public_bytes(serialization.Encoding.PEM,
+                                                       serialization.PublicFormat.SubjectPublicKeyInfo)
+    return private_pem, dict(jwk.construct(public_pem, "RS256").to_dict(), kid=kid, use="sig")
+
+
+def make_id_token(private_pem: bytes, kid: str, **claims):
+    return jwt.encode(
+        dict(dict(iss="https://accounts.google.com", aud=CLIENT_ID, sub="oauth_id", email="test@claon.com",
+                  exp=int(time.time()) + 3600), **claims),
+        private_pem,
+        algorithm="RS256",
+        headers={"kid": kid}
+    )
+
+
+class StubGoogle:
+    def __init__(self, public_keys, cache_control="public, max-age=3600"):
+        self.public_keys = public_keys
+        self.cache_control = cache_control
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request):
+        assert str(request.url) == GOOGLE_CERTS_URL
+        self.requests += 1
+        return httpx.Response(200, json={"keys": self.public_keys}, headers={"Cache-Control": self.cache_control})
+
+
+@pytest.fixture
+def google_key():
+    return make_key("kid-1")
+
+
+@pytest.fixture
+def mock_conf():
+    with patch("claon_admin.common.util.oauth.conf", return_value=SimpleNamespace(GOOGLE_CLIENT_ID=CLIENT_ID)):
+        yield
+
+
+@pytest.mark.describe('Test case for oauth user info providers')
+class TestOAuth(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it('Google id token is verified with cached certs')
+    async def test_google_user_info(self, google_key, mock_conf):
+        # given
+        private_pem, public_key = google_key
+        google = StubGoogle([public_key])
+        provider = GoogleUserInfoProvider(httpx.AsyncClient(transport=httpx.MockTransport(google)),
+                                          JwksCache(GOOGLE_CERTS_URL))
+
+        # when
+        results = [await provider.get_user_info(make_id_token(private_pem, "kid-1")) for _ in range(3)]
+
+        # then
+        assert [(result.oauth_id, result.sns_email) for result in results] == [("oauth_id", "test@claon.com")] * 3
+        assert google.requests == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Rotated google certs are fetched again')
+    async def test_google_user_info_with_rotated_key(self, google_key, mock_conf):
+        # given
+        private_pem, public_key = google_key
+        rotated_pem, rotated_key = make_key("kid-2")
+        google = StubGoogle([public_key])
+        jwks = JwksCache(GOOGLE_CERTS_URL)
+        provider = GoogleUserInfoProvider(httpx.AsyncClient(transport=httpx.MockTransport(google)), jwks)
+        await provider.get_user_info(make_id_token(private_pem, "kid-1"))
+
+        # when
+        google.public_keys = [public_key, rotated_key]
+        jwks.fetched_at -= 3600
+        result = await provider.get_user_info(make_id_token(rotated_pem, "kid-2"))
+
+        # then
+        assert result.oauth_id == "oauth_id"
+        assert google.requests == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Google id token for another client is rejected')
+    async def test_google_user_info_with_wrong_audience(self, google_key, mock_conf):
+        # given
+        private_pem, public_key = google_key
+        provider = GoogleUserInfoProvider(httpx.AsyncClient(transport=httpx.MockTransport(StubGoogle([public_key]))),
+                                          JwksCache(GOOGLE_CERTS_URL))
+
+        with pytest.raises(InternalServerException):
+            # when
+            await provider.get_user_info(make_id_token(private_pem, "kid-1", aud="another-client-id"))
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Google id token signed by an unknown key is rejected')
+    async def test_google_user_info_with_unknown_key(self, google_key, mock_conf):
+        # given
+        _, public_key = google_key
+        unknown_pem, _ = make_key("kid-1")
+        provider = GoogleUserInfoProvider(httpx.AsyncClient(transport=httpx.MockTransport(StubGoogle([public_key]))),
+                                          JwksCache(GOOGLE_CERTS_URL))
+
+        with pytest.raises(InternalServerException):
+            # when
+            await provider.get_user_info(make_id_token(unknown_pem, "kid-1"))
+
+    @pytest.mark.it('Cache lifetime follows Cache-Control')
+    def test_max_age_of(self):
+        assert max_age_of(httpx.Headers({"Cache-Control": "public, max-age=20000", "Age": "100"})) == 19900
+        assert max_age_of(httpx.Headers({"Cache-Control": "no-store"})) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Kakao user info is requested with the access token')
+    async def test_kakao_user_info(self):
+        # given
+        def kakao(request: httpx.Request):
+            assert str(request.url) == KAKAO_USER_INFO_URL
+            assert request.headers["Authorization"] == "Bearer token"
+            return httpx.Response(200, json={"id": 1234, "kakao_account": {"email": "test@claon.com"}})
+
+        provider = KakaoUserInfoProvider(httpx.AsyncClient(transport=httpx.MockTransport(kakao)))
+
+        # when
+        result = await provider.get_user_info("token")
+
+        # then
+        assert result.oauth_id == "1234"
+        assert result.sns_email == "test@claon.com"
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Kakao error response fails the sign-in')
+    async def test_kakao_user_info_with_error(self):
+        # given
+        provider = KakaoUserInfoProvider(httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(401, json={"msg": "this access token does not exist"}))))
+
+        with pytest.raises(InternalServerException):
+            # when
+            await provider.get_user_info("token")
@@ -0,0 +1,129 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi_pagination import Params
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.error.exception import BadRequestException, ErrorCode
+from claon_admin.common.util.pagination import encode_cursor, decode_cursor, paginate, CountStrategy, count_cache
+from claon_admin.schema.job import JobHistory
+
+
+@pytest.mark.describe('Test case for cursor pagination')
+class TestCursor(object):
+    def test_encode_and_decode_cursor(self):
+        # given
+        created_at = datetime(2023, 1, 1, 12, 30, 15, 123)
+
+        # when
+        result = decode_cursor(encode_cursor(created_at, "id|with|bar"))
+
+        # then
+        assert result == (created_at, "id|with|bar")
+
+    @pytest.mark.it('Fail case: cursor is malformed')
+    def test_decode_wrong_cursor(self):
+        with pytest.raises(BadRequestException) as exception:
+            decode_cursor("wrong cursor")
+
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
+
+
+@pytest.fixture
+async def job_history_list_fixture(session: AsyncSession):
+    histories = [
+        JobHistory(job_name="pagination", started_at=datetime(2023, 1, 1), finished_at=datetime(2023, 1, 1),
+                   duration=1.0, succeeded=True)
+        for _ in range(3)
+    ]
+    session.add_all(histories)
+    await session.flush()
+
+    yield histories
+    await session.rollback()
+
+
+@pytest.mark.describe('Test case for paginate with count strategy')
+class TestPaginate(object):
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count_strategy", list(CountStrategy))
+    async def test_paginate(self, session: AsyncSession, job_history_list_fixture, count_strategy: CountStrategy):
+        # given
+        params = Params(page=2, size=2)
+        query = select(JobHistory).where(JobHistory.job_name == "pagination").order_by(JobHistory.id)
+
+        # when
+        page = await paginate(query=query, conn=session, params=params, count_strategy=count_strategy)
+
+        # then
+        assert page.total == 3
+        assert page.items == sorted(job_history_list_fixture, key=lambda history: history.id)[2:]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Cached count is reused until it expires')
+    async def test_paginate_with_cached_count(self, session: AsyncSession, job_history_list_fixture):
+        # given
+        params = Params(page=1, size=10)
+        query = select(JobHistory).where(JobHistory.job_name == "pagination")
+        await paginate(query=query, conn=session, params=params, count_strategy=CountStrategy.CACHED)
+        session.add(JobHistory(job_name="pagination", started_at=datetime(2023, 1, 1),
+                               finished_at=datetime(2023, 1, 1), duration=1.0, succeeded=True))
+        await session.flush()
+
+        # when
+        cached = await paginate(query=query, conn=session, params=params, count_strategy=CountStrategy.CACHED)
+        count_cache.clear()
+        refreshed = await paginate(query=query, conn=session, params=params, count_strategy=CountStrategy.CACHED)
+
+        # then
+        assert cached.total == 3
+        assert refreshed.total == 4
+
+
+@pytest.mark.postgres
+@pytest.mark.describe('Test case for estimated count on PostgreSQL')
+class TestPaginateEstimated(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it('Large result is counted from the planner estimate')
+    async def test_paginate_with_estimated_count(self, postgres_session: AsyncSession):
+        # given
+        postgres_session.add_all([
+            JobHistory(job_name=f"estimate-{i % 4}", started_at=datetime(2023, 1, 1), finished_at=datetime(2023, 1, 1),
+                       duration=1.0, succeeded=True)
+            for i in range(4000)
+        ])
+        await postgres_session.flush()
+        await postgres_session.execute(text("ANALYZE tb_job_history"))
+        query = select(JobHistory).where(JobHistory.job_name.in_(["estimate-0", "estimate-1"]))
+
+        with patch("claon_admin.common.util.pagination._count_exact") as count_exact:
+            # when
+            page = await paginate(query=query, conn=postgres_session, params=Params(page=1, size=10),
+                                  count_strategy=CountStrategy.ESTIMATED)
+
+        # then
+        count_exact.assert_not_called()
+        assert len(page.items) == 10
+        assert 1000 <= page.total <= 4000
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Small result is counted exactly')
+    async def test_paginate_with_small_estimated_count(self, postgres_session: AsyncSession):
+        # given
+        postgres_session.add_all([
+            JobHistory(job_name="estimate-small", started_at=datetime(2023, 1, 1), finished_at=datetime(2023, 1, 1),
+                       duration=1.0, succeeded=True)
+            for _ in range(3)
+        ])
+        await postgres_session.flush()
+        await postgres_session.execute(text("ANALYZE tb_job_history"))
+        query = select(JobHistory).where(JobHistory.job_name.in_(["estimate-small", "unknown"]))
+
+        # when
+        page = await paginate(query=query, conn=postgres_session, params=Params(page=1, size=10),
+                              count_strategy=CountStrategy.ESTIMATED)
+
+        # then
+        assert page.total == 3
@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.util.jwt import create_refresh_token
+from claon_admin.common.util.redis import save_refresh_token, delete_refresh_token
+from claon_admin.config.config import conf
+
+
+@pytest.mark.describe("Test case for refresh token store")
+class TestRefreshTokenStore(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: created refresh token is saved with its user id until it expires")
+    async def test_create_refresh_token(self, redis_client):
+        with patch("claon_admin.common.util.redis.redis", redis_client):
+            # when
+            refresh_token = await create_refresh_token("user_id")
+
+        # then
+        assert await redis_client.get_connection().get(refresh_token) == "user_id"
+        assert 0 < await redis_client.get_connection().ttl(refresh_token) <= conf().REFRESH_TOKEN_EXPIRE_MINUTES * 60
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: refresh tokens created together are distinct")
+    async def test_create_distinct_refresh_tokens(self, redis_client):
+        with patch("claon_admin.common.util.redis.redis", redis_client):
+            # when
+            refresh_tokens = [await create_refresh_token("user_id") for _ in range(3)]
+
+        # then
+        assert len(set(refresh_tokens)) == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: refresh token is consumed only once")
+    async def test_delete_refresh_token(self, redis_client):
+        with patch("claon_admin.common.util.redis.redis", redis_client):
+            # given
+            await save_refresh_token("refresh_token", "user_id")
+
+            # when
+            first = await delete_refresh_token("refresh_token")
+            second = await delete_refresh_token("refresh_token")
+
+        # then
+        assert first == "user_id"
+        assert second is None
+        assert await redis_client.get_connection().exists("refresh_token") == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: only one of concurrent consumers gets the user id")
+    async def test_delete_refresh_token_concurrently(self, redis_client):
+        with patch("claon_admin.common.util.redis.redis", redis_client):
+            # given
+            await save_refresh_token("refresh_token", "user_id")
+
+            # when
+            results = await asyncio.gather(*[delete_refresh_token("refresh_token") for _ in range(5)])
+
+        # then
+        assert sorted(results, key=lambda x: x is None) == ["user_id"] + [None] * 4
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.db import AFTER_COMMIT_CALLBACKS, _background_tasks
+from claon_admin.common.util.review_summary import save_review_summary, find_review_summary, \
+    evict_review_summary_after_commit
+
+
+@pytest.mark.describe("Test case for review summary cache")
+class TestReviewSummary(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: summary is evicted after commit")
+    async def test_evict_review_summary_after_commit(self, session: AsyncSession):
+        # given
+        await save_review_summary("center-commit", dict(count_total=0))
+
+        # when
+        evict_review_summary_after_commit(session, "center-commit")
+        assert await find_review_summary("center-commit") is not None
+        await session.commit()
+        await asyncio.gather(*_background_tasks)
+
+        # then
+        assert await find_review_summary("center-commit") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: summary is kept after rollback")
+    async def test_keep_review_summary_after_rollback(self, session: AsyncSession):
+        # given
+        await save_review_summary("center-rollback", dict(count_total=0))
+        await session.execute(text("SELECT 1"))
+
+        # when
+        evict_review_summary_after_commit(session, "center-rollback")
+        await session.rollback()
+
+        # then
+        assert AFTER_COMMIT_CALLBACKS not in session.info
+        assert await find_review_summary("center-rollback") is not None
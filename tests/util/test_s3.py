@@ -0,0 +1,89 @@
+import asyncio
+import io
+from unittest.mock import patch
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.db import _background_tasks
+from claon_admin.common.util.s3 import upload_file, delete_file, delete_files, delete_files_after_commit, \
+    build_url
+from claon_admin.config.config import conf
+
+
+@pytest.mark.describe("Test case for s3 util")
+class TestS3(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: small file is uploaded with a single request")
+    async def test_upload_small_file(self, s3_client):
+        # given
+        file = UploadFile(file=io.BytesIO(b"test"), filename="proof.pdf")
+
+        # when
+        url = await upload_file(file=file, domain="center", purpose="proof", client=s3_client)
+
+        # then
+        key_name = url.split(".amazonaws.com/")[-1]
+        obj = s3_client.get_object(Bucket=conf().BUCKET, Key=key_name)
+        assert obj["Body"].read() == b"test"
+        assert obj["ContentType"] == "application/pdf"
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: large file is uploaded with multipart upload")
+    async def test_upload_large_file(self, s3_client):
+        # given
+        body = b"a" * (conf().S3_MULTIPART_CHUNK_SIZE * 2 + 10)
+        file = UploadFile(file=io.BytesIO(body), filename="proof.pdf")
+
+        # when
+        url = await upload_file(file=file, domain="center", purpose="proof", client=s3_client)
+
+        # then
+        key_name = url.split(".amazonaws.com/")[-1]
+        obj = s3_client.get_object(Bucket=conf().BUCKET, Key=key_name)
+        assert obj["ContentLength"] == len(body)
+        assert s3_client.list_multipart_uploads(Bucket=conf().BUCKET).get("Uploads") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: delete file")
+    async def test_delete_file(self, s3_client):
+        # given
+        file = UploadFile(file=io.BytesIO(b"test"), filename="image.png")
+        url = await upload_file(file=file, domain="center", purpose="image", client=s3_client)
+
+        # when
+        await delete_file(url, client=s3_client)
+
+        # then
+        assert s3_client.list_objects_v2(Bucket=conf().BUCKET).get("KeyCount") == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: delete files in batches")
+    async def test_delete_files(self, s3_client):
+        # given
+        keys = [f"center/proof/{i}.pdf" for i in range(1001)]
+        for key in keys:
+            s3_client.put_object(Bucket=conf().BUCKET, Key=key, Body=b"test")
+
+        # when
+        failed_keys = await delete_files([build_url(key) for key in keys], client=s3_client)
+
+        # then
+        assert failed_keys == []
+        assert s3_client.list_objects_v2(Bucket=conf().BUCKET).get("KeyCount") == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: pending files are deleted after commit")
+    async def test_delete_files_after_commit(self, s3_client, session: AsyncSession):
+        # given
+        s3_client.put_object(Bucket=conf().BUCKET, Key="center/proof/test.pdf", Body=b"test")
+
+        with patch("claon_admin.common.util.s3.get_s3", return_value=s3_client):
+            # when
+            delete_files_after_commit(session, [build_url("center/proof/test.pdf")])
+            await session.commit()
+            await asyncio.gather(*_background_tasks)
+
+        # then
+        assert s3_client.list_objects_v2(Bucket=conf().BUCKET).get("KeyCount") == 0
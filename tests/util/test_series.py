@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+
+from claon_admin.common.util.series import DailySeries
+
+
+@pytest.fixture
+def series():
+    # 2023-01-02 is a Monday, the series covers 2023-01-02 ~ 2023-01-17
+    return DailySeries(date(2023, 1, 2), date(2023, 1, 18), [
+        (date(2023, 1, 2), 1),
+        (date(2023, 1, 8), 2),
+        (date(2023, 1, 9), 3),
+        (date(2023, 1, 17), 4),
+        (date(2023, 1, 18), 100)
+    ])
+
+
+@pytest.mark.describe('Test case for daily series')
+class TestDailySeries(object):
+    @pytest.mark.it('Values outside of the range are ignored')
+    def test_sum_between(self, series: DailySeries):
+        assert len(series) == 16
+        assert series.sum_between(date(2022, 1, 1), date(2024, 1, 1)) == 10
+        assert series.sum_between(date(2023, 1, 8), date(2023, 1, 10)) == 5
+
+    def test_sum_last_days(self, series: DailySeries):
+        assert series.sum_last_days(1) == 4
+        assert series.sum_last_days(10) == 9
+
+    def test_last_days(self, series: DailySeries):
+        result = series.last_days(7)
+
+        assert len(result) == 7
+        assert result[0] == (date(2023, 1, 11), 0)
+        assert result[-1] == (date(2023, 1, 17), 4)
+
+    @pytest.mark.it('The trailing partial week is left out')
+    def test_complete_weeks(self, series: DailySeries):
+        assert series.complete_weeks() == [(date(2023, 1, 8), 3), (date(2023, 1, 15), 3)]
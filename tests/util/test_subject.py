@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import Role
+from claon_admin.common.util.db import AFTER_COMMIT_CALLBACKS, _background_tasks
+from claon_admin.common.util.subject import save_subject, find_subject, evict_subject_after_commit
+from claon_admin.model.auth import RequestUser
+
+
+@pytest.mark.describe("Test case for subject cache")
+class TestSubject(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: subject is evicted after commit")
+    async def test_evict_subject_after_commit(self, session: AsyncSession):
+        # given
+        await save_subject(RequestUser(id="subject-commit", sns="test@claon.com", role=Role.PENDING))
+
+        # when
+        evict_subject_after_commit(session, "subject-commit")
+        assert await find_subject("subject-commit") is not None
+        await session.commit()
+        await asyncio.gather(*_background_tasks)
+
+        # then
+        assert await find_subject("subject-commit") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: subject is kept after rollback")
+    async def test_keep_subject_after_rollback(self, session: AsyncSession):
+        # given
+        await save_subject(RequestUser(id="subject-rollback", sns="test@claon.com", role=Role.PENDING))
+
+        await session.execute(text("SELECT 1"))
+
+        # when
+        evict_subject_after_commit(session, "subject-rollback")
+        await session.rollback()
+
+        # then
+        assert AFTER_COMMIT_CALLBACKS not in session.info
+        assert await find_subject("subject-rollback") is not None